@@ -0,0 +1,441 @@
+"""
+Benchmark suite for runtime-yolk entry points.
+
+Synthetic inputs are generated for each line count, then every case is timed
+and measured for peak memory and the memory still held by its result
+(tracemalloc). Results are printed as a table and
+can be written as JSON. A saved JSON result can be used as a baseline, any case
+slower than the baseline by more than the threshold is flagged and the exit code
+is non-zero.
+
+Run from the repo root:
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --sizes 10,1000 --output baseline.json
+    python benchmarks/suite.py --baseline baseline.json --threshold 1.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from runtime_yolk import ConfigLoader
+from runtime_yolk import EnvLoader
+from runtime_yolk import env_cli
+from runtime_yolk.log_formatters import build_formatter
+
+DEFAULT_SIZES = "10,1000,100000,1000000"
+KEY_COUNT = 1_000
+
+# A case receives (lines, workdir) and returns the callable to be measured
+Setup = Callable[[int, Path], Callable[[], object]]
+CASES: dict[str, Setup] = {}
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark case by name."""
+
+    def register(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def build_env(lines: int) -> str:
+    """Build .env contents with a mix of comments, exports, and quoted values."""
+    body = []
+    for idx in range(lines):
+        if idx % 10 == 0:
+            body.append(f"# comment {idx}")
+        elif idx % 3 == 0:
+            body.append(f'export KEY_{idx} = "quoted value {idx}"')
+        else:
+            body.append(f"KEY_{idx}=value_{idx}")
+    return "\n".join(body)
+
+
+def build_config(lines: int, density: float, next_environment: str = "") -> str:
+    """Build ini contents where `density` of the options hold a placeholder."""
+    every = int(1 / density) if density else 0
+    body = ["[DEFAULT]", f"environment = {next_environment}"]
+    for idx in range(lines):
+        if idx % 100 == 0:
+            body.append(f"[section_{idx // 100}]")
+        if every and idx % every == 0:
+            body.append(f"option_{idx} = prefix {{{{KEY_{idx % KEY_COUNT}}}}} suffix")
+        else:
+            body.append(f"option_{idx} = value {idx}")
+    return "\n".join(body)
+
+
+@case("env_parse")
+def env_parse(lines: int, workdir: Path) -> Callable[[], object]:
+    (workdir / ".env").write_text(build_env(lines))
+    loader = EnvLoader(working_directory=workdir)
+    return loader.read
+
+
+@case("env_cli_update")
+def env_cli_update(lines: int, workdir: Path) -> Callable[[], object]:
+    contents = build_env(lines)
+    return lambda: env_cli._update_key(f"KEY_{lines - 1}", "updated", contents)
+
+
+@case("env_cli_batch[200]")
+def env_cli_batch(lines: int, workdir: Path) -> Callable[[], object]:
+    contents = build_env(lines)
+    operations = [("set", f"KEY_{idx}", "updated") for idx in range(200)]
+    return lambda: env_cli._apply_batch(operations, contents)
+
+
+def _interpolate_setup(density: float) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        contents = build_config(lines, density)
+        loader = ConfigLoader(working_directory=workdir)
+        return lambda: loader._interpolate_environment(contents)
+
+    return setup
+
+
+def _config_load_setup(depth: int, density: float, lazy: bool = False) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        per_layer = max(1, lines // depth)
+        for layer in range(depth):
+            name = "application" if not layer else f"application-env{layer}"
+            next_environment = f"env{layer + 1}" if layer + 1 < depth else ""
+            contents = build_config(per_layer, density, next_environment)
+            (workdir / f"{name}.ini").write_text(contents)
+
+        return lambda: ConfigLoader(working_directory=workdir, lazy=lazy).load()
+
+    return setup
+
+
+for _density in (0.0, 0.1, 1.0):
+    case(f"interpolate[density={_density}]")(_interpolate_setup(_density))
+
+for _depth in (1, 3, 5):
+    case(f"config_load[depth={_depth},density=0.1]")(_config_load_setup(_depth, 0.1))
+
+case("config_load[depth=3,density=0.1,lazy]")(_config_load_setup(3, 0.1, lazy=True))
+
+
+def _read_setup(use_snapshot: bool) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        from runtime_yolk.config_snapshot import ConfigSnapshot
+
+        contents = build_config(1_000, 0.0).replace(
+            "[DEFAULT]", "[DEFAULT]\nworkers = 4"
+        )
+        (workdir / "application.ini").write_text(contents)
+        loader = ConfigLoader(working_directory=workdir)
+        loader.load()
+        config = ConfigSnapshot(loader.config) if use_snapshot else loader.config
+        options = [
+            (f"section_{idx % 10}", f"option_{idx % 1_000}") for idx in range(lines)
+        ]
+
+        def read() -> None:
+            for section, option in options:
+                config.get(section, option, fallback=None)
+                config.getint(section, "workers")
+
+        return read
+
+    return setup
+
+
+case("config_read[configparser]")(_read_setup(False))
+case("config_read[snapshot]")(_read_setup(True))
+
+
+def _memory_setup(compact: bool) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        # Many small sections repeating the same option names, e.g. one per tenant
+        body = ["[DEFAULT]", "environment ="]
+        for idx in range(lines):
+            if idx % 10 == 0:
+                body.append(f"[tenant_{idx // 10}]")
+            body.append(f"option_{idx % 10} = value {idx}")
+        (workdir / "application.ini").write_text("\n".join(body))
+
+        def load() -> ConfigLoader:
+            loader = ConfigLoader(working_directory=workdir, compact=compact)
+            loader.load()
+            return loader
+
+        return load
+
+    return setup
+
+
+case("config_memory[configparser]")(_memory_setup(False))
+case("config_memory[compact]")(_memory_setup(True))
+
+
+def _tenants_setup(shared: bool, tenants: int) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        # Identical base file in every tenant directory, plus a small tenant file
+        base = build_config(lines, 0.1, "tenant")
+        directories = []
+        for tenant in range(tenants):
+            directory = workdir / f"tenant_{tenant}"
+            directory.mkdir()
+            (directory / "application.ini").write_text(base)
+            (directory / "application-tenant.ini").write_text(
+                f"[tenant]\nname = tenant_{tenant}\n"
+            )
+            directories.append(directory)
+
+        def load() -> list[ConfigLoader]:
+            loaders = [
+                ConfigLoader(working_directory=directory, shared=shared)
+                for directory in directories
+            ]
+            for loader in loaders:
+                loader.load()
+            return loaders
+
+        return load
+
+    return setup
+
+
+case("config_tenants[copied,tenants=20]")(_tenants_setup(False, 20))
+case("config_tenants[shared,tenants=20]")(_tenants_setup(True, 20))
+
+
+def _references_setup(referenced: bool) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        # One long value used by every section, copied or as a {{section:key}}
+        shared = "x" * 512
+        body = ["[base]", f"dsn = {shared}"]
+        for idx in range(lines):
+            if idx % 10 == 0:
+                body.append(f"[service_{idx // 10}]")
+            value = "{{base:dsn}}" if referenced else shared
+            body.append(f"option_{idx % 10} = {value}")
+        (workdir / "application.ini").write_text("\n".join(body))
+
+        def load() -> ConfigLoader:
+            loader = ConfigLoader(working_directory=workdir)
+            loader.load()
+            return loader
+
+        return load
+
+    return setup
+
+
+case("config_references[copied]")(_references_setup(False))
+case("config_references[referenced]")(_references_setup(True))
+
+
+def _log_format_setup(kind: str) -> Setup:
+    def setup(lines: int, workdir: Path) -> Callable[[], object]:
+        # `lines` records of the default format, 1000 records per second
+        formatter = build_formatter(
+            "%(asctime)s - %(levelname)s - %(name)s - %(message)s", kind
+        )
+        records = []
+        for idx in range(min(lines, 10_000)):
+            record = logging.LogRecord(
+                "app.worker", logging.INFO, __file__, 1, "request %d done", (idx,), None
+            )
+            record.created = 1_700_000_000 + idx / 1000
+            record.msecs = idx % 1000
+            records.append(record)
+
+        def format_records() -> int:
+            total = 0
+            for idx in range(lines):
+                total += len(formatter.format(records[idx % len(records)]))
+            return total
+
+        return format_records
+
+    return setup
+
+
+for _kind in ("standard", "cached", "json"):
+    case(f"log_format[{_kind}]")(_log_format_setup(_kind))
+
+
+@contextmanager
+def environ(values: dict[str, str]) -> Iterator[None]:
+    """Temporarily add values to os.environ."""
+    saved = os.environ.copy()
+    os.environ.update(values)
+    try:
+        yield None
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, int, int]:
+    """
+    Return the best wall time of `repeat` runs, the peak traced memory, and the
+    traced memory still held while the result of a run is alive.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return best, peak, retained
+
+
+def run(sizes: list[int], cases: list[str], repeat: int) -> list[dict[str, Any]]:
+    """Run selected cases for each size, return result rows."""
+    results = []
+    placeholders = {f"KEY_{idx}": f"value_{idx}" for idx in range(KEY_COUNT)}
+
+    with environ(placeholders):
+        for name in cases:
+            for lines in sizes:
+                with tempfile.TemporaryDirectory() as tempdir:
+                    func = CASES[name](lines, Path(tempdir))
+                    runs = repeat if lines < 100_000 else 1
+                    seconds, peak, retained = measure(func, runs)
+
+                results.append(
+                    {
+                        "case": name,
+                        "lines": lines,
+                        "seconds": seconds,
+                        "peak_bytes": peak,
+                        "retained_bytes": retained,
+                    }
+                )
+                print_row(results[-1])
+
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Return descriptions of results slower than baseline by more than threshold."""
+    previous = {(row["case"], row["lines"]): row for row in baseline}
+    regressions = []
+
+    for row in results:
+        base = previous.get((row["case"], row["lines"]))
+        if not base or not base["seconds"]:
+            continue
+
+        ratio = row["seconds"] / base["seconds"]
+        if ratio > threshold:
+            regressions.append(
+                f"{row['case']} @ {row['lines']} lines: "
+                f"{base['seconds']:.6f}s -> {row['seconds']:.6f}s ({ratio:.2f}x)"
+            )
+
+    return regressions
+
+
+def print_row(row: dict[str, Any]) -> None:
+    """Print a single result row."""
+    per_line = row["seconds"] / row["lines"] * 1e6
+    print(
+        f"{row['case']:<36} {row['lines']:>9} {row['seconds']:>10.5f}s "
+        f"{per_line:>9.3f}us/line {row['peak_bytes'] / 1024:>12.1f}KiB "
+        f"{row['retained_bytes'] / 1024:>12.1f}KiB held"
+    )
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark runtime-yolk.")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma separated line counts. (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--cases",
+        default="",
+        help="Comma separated case names or prefixes to run. (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Runs per measurement under 100,000 lines, best is kept. (default: 5)",
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", help="JSON results to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio flagged as a regression. (default: 1.25)",
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit.")
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+    """Entry point for the benchmark suite."""
+    parsed = parse_args(args)
+
+    if parsed.list:
+        print("\n".join(CASES))
+        return 0
+
+    sizes = [int(size) for size in parsed.sizes.split(",") if size]
+    prefixes = [prefix for prefix in parsed.cases.split(",") if prefix]
+    cases = [
+        name
+        for name in CASES
+        if not prefixes or any(name.startswith(prefix) for prefix in prefixes)
+    ]
+
+    results = run(sizes, cases, parsed.repeat)
+
+    if parsed.output:
+        payload = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": results,
+        }
+        Path(parsed.output).write_text(json.dumps(payload, indent=2))
+
+    if parsed.baseline:
+        baseline = json.loads(Path(parsed.baseline).read_text())["results"]
+        regressions = compare(results, baseline, parsed.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
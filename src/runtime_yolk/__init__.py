@@ -1,11 +1,37 @@
 from __future__ import annotations
 
-from runtime_yolk.config_loader import ConfigLoader
-from runtime_yolk.env_loader import EnvLoader
-from runtime_yolk.yolk import Yolk
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from runtime_yolk.config_loader import ConfigLoader
+    from runtime_yolk.env_loader import EnvLoader
+    from runtime_yolk.yolk import Yolk
 
 __all__ = [
     "ConfigLoader",
     "EnvLoader",
     "Yolk",
 ]
+
+# Public names are imported from their submodule on first access
+_LAZY_IMPORTS = {
+    "ConfigLoader": "runtime_yolk.config_loader",
+    "EnvLoader": "runtime_yolk.env_loader",
+    "Yolk": "runtime_yolk.yolk",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public names lazily, keeps `import runtime_yolk` cheap."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy names in dir()."""
+    return sorted(set(globals()) | set(__all__))
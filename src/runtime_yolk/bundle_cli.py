@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from runtime_yolk.yolk import Yolk
+
+
+def _parse_args(arg_list: list[str] | None = None) -> Namespace:
+    """Parse sys.argv."""
+    parser = ArgumentParser(
+        "Compile .env values and layered config files into a bundle for "
+        "Yolk.load_bundle()."
+    )
+    parser.add_argument(
+        "output",
+        type=str,
+        help="Bundle file to write.",
+    )
+    parser.add_argument(
+        "-e",
+        "--environment",
+        action="store",
+        default=None,
+        help="Set YOLK_ENVIRONMENT before loading.",
+    )
+    parser.add_argument(
+        "-C",
+        "--config",
+        action="store",
+        default="application",
+        help="Config file name without the extension, default is 'application'",
+    )
+    parser.add_argument(
+        "-F",
+        "--file",
+        action="store",
+        default=".env",
+        help="Env filename, default is '.env'",
+    )
+    parser.add_argument(
+        "-d",
+        "--directory",
+        action="append",
+        default=None,
+        help="Directory to load from, repeat for a search path. Default is cwd.",
+    )
+    return parser.parse_args(arg_list)
+
+
+def main(_args: list[str] | None = None) -> int:
+    """Entry point for cli."""
+    args = _parse_args(_args)
+
+    if args.environment is not None:
+        os.environ["YOLK_ENVIRONMENT"] = args.environment
+
+    yolk = Yolk(search_path=args.directory)
+    yolk.load_env(args.file)
+    yolk.load_config(args.config)
+    yolk.write_bundle(args.output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+"""Compact, read-oriented alternative to ConfigParser for large configs."""
+
+from __future__ import annotations
+
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+from runtime_yolk.config_snapshot import UNSET
+from runtime_yolk.config_snapshot import TypedGetters
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    from runtime_yolk.lazy_interpolation import LazyInterpolation
+
+
+class CompactConfig(TypedGetters):
+    """
+    Config store with the read interface of ConfigParser and a smaller footprint.
+
+    Sections are plain dictionaries, there are no per-section proxy objects, and
+    DEFAULT options are found by a second lookup instead of being merged. Section
+    and option names are pooled so each distinct name is stored once, which matters
+    when thousands of sections repeat the same option names. Values are kept as
+    given, not copied.
+
+    Values are raw unless an interpolation is given, whose `before_get()` is called
+    on non-raw reads as with ConfigParser. Sections are only changed through
+    `read_dict()`.
+    """
+
+    __slots__ = ("default_section", "_defaults", "_sections", "_pool", "_interpolation")
+
+    def __init__(self, interpolation: LazyInterpolation | None = None) -> None:
+        """Create an empty store."""
+        self.default_section = "DEFAULT"
+        self._interpolation = interpolation
+        self._defaults: dict[str, str] = {}
+        self._sections: dict[str, dict[str, str]] = {}
+        self._pool: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f"CompactConfig(sections={len(self._sections)})"
+
+    def __contains__(self, section: object) -> bool:
+        return section == self.default_section or section in self._sections
+
+    def read_dict(self, dictionary: Mapping[str, Mapping[str, str]]) -> None:
+        """Layer {section: {option: value}} onto the store, options are lowercased."""
+        pool = self._pool.setdefault
+        for section, options in dictionary.items():
+            if section == self.default_section:
+                target = self._defaults
+            else:
+                target = self._sections.setdefault(pool(section, section), {})
+
+            for option, value in options.items():
+                key = option.lower()
+                target[pool(key, key)] = value
+
+    def defaults(self) -> dict[str, str]:
+        """Return the DEFAULT options."""
+        return self._defaults
+
+    def sections(self) -> list[str]:
+        """Return section names, excluding DEFAULT."""
+        return list(self._sections)
+
+    def has_section(self, section: str) -> bool:
+        """True if section exists. DEFAULT is not considered a section."""
+        return section in self._sections
+
+    def has_option(self, section: str, option: str) -> bool:
+        """True if option exists in section or in DEFAULT."""
+        option = option.lower()
+        if not section or section == self.default_section:
+            return option in self._defaults
+
+        options = self._sections.get(section)
+        return options is not None and (option in options or option in self._defaults)
+
+    def options(self, section: str) -> list[str]:
+        """Return option names of section, including those from DEFAULT."""
+        return [option for option, _ in self.items(section)]
+
+    def items(self, section: str, raw: bool = False) -> list[tuple[str, str]]:
+        """Return (option, value) pairs of section, including those from DEFAULT."""
+        options = self._sections.get(section)
+        if options is None:
+            if section != self.default_section:
+                raise NoSectionError(section)
+            options = {}
+
+        merged = {**self._defaults, **options}
+        interpolation = self._interpolation
+        if raw or interpolation is None:
+            return list(merged.items())
+
+        return [
+            (option, interpolation.before_get(self, section, option, value, merged))
+            for option, value in merged.items()
+        ]
+
+    def get(
+        self,
+        section: str,
+        option: str,
+        *,
+        raw: bool = False,
+        fallback: Any = UNSET,
+    ) -> Any:
+        """Return option as a string, or fallback if provided and missing."""
+        option = option.lower()
+
+        if section == self.default_section:
+            options: dict[str, str] | None = self._defaults
+        else:
+            options = self._sections.get(section)
+        if options is None:
+            if fallback is UNSET:
+                raise NoSectionError(section)
+            return fallback
+
+        value = options.get(option)
+        if value is None:
+            value = self._defaults.get(option)
+        if value is None:
+            if fallback is UNSET:
+                raise NoOptionError(option, section)
+            return fallback
+
+        if raw or self._interpolation is None:
+            return value
+        return self._interpolation.before_get(self, section, option, value, {})
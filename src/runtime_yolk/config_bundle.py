@@ -0,0 +1,56 @@
+"""
+Compiled bundle of loaded `.env` values and parsed config layers.
+
+A bundle is written by `Yolk.write_bundle()`, or the `yolk-bundle` cli, once the
+environment is known at deploy time. `Yolk.load_bundle()` applies it with a single
+read and no `.ini` parsing, falling back to normal loading when a source file or
+an environ value the bundle was built from changed.
+
+Bundles are JSON so a bundle built with one Python version loads on another.
+Unreadable bundles or bundles of another `BUNDLE_VERSION` are ignored.
+"""
+
+from __future__ import annotations
+
+import os
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+BUNDLE_VERSION = 1
+
+
+def write_bundle(path: str, bundle: dict[str, Any]) -> None:
+    """Write bundle to path with the current version. Write is atomic."""
+    import json
+    import tempfile
+
+    payload = json.dumps({"version": BUNDLE_VERSION, **bundle}, separators=(",", ":"))
+    directory = os.path.dirname(os.path.abspath(path))
+
+    file_desc, temp_path = tempfile.mkstemp(dir=directory, prefix=".yolk_bundle_")
+    try:
+        with os.fdopen(file_desc, "w", encoding="utf-8") as outfile:
+            outfile.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_bundle(path: str) -> dict[str, Any] | None:
+    """Return the bundle at path, None if missing, unreadable, or another version."""
+    import json
+
+    try:
+        with open(path, "rb") as infile:
+            bundle = json.loads(infile.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("version") != BUNDLE_VERSION:
+        return None
+
+    return bundle
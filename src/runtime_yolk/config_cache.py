@@ -0,0 +1,148 @@
+"""
+On-disk cache of parsed configuration layers.
+
+Each layer is stored with the fingerprint of the file it was parsed from (path,
+mtime, size, and content hash) and the environment values referenced through
+`{{KEYWORD}}` interpolation. A cached layer is only used when every part of the
+fingerprint still matches.
+
+The cache is stored with `marshal` and is specific to the running Python version.
+Unreadable or mismatched cache files are ignored and rebuilt.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from mmap import mmap
+    from pathlib import Path
+    from typing import Any
+
+    Layer = dict[str, dict[str, str]]
+    Fingerprint = tuple[int, int, bytes]
+
+CACHE_VERSION = 1
+
+
+def fingerprint(filepath: Path, contents: bytes | mmap) -> Fingerprint:
+    """Return the (mtime_ns, size, digest) fingerprint of a file and its contents."""
+    import hashlib
+
+    stat = filepath.stat()
+    digest = hashlib.blake2b(contents, digest_size=16).digest()
+    return stat.st_mtime_ns, stat.st_size, digest
+
+
+class ConfigCache:
+    """Load, validate, and store parsed configuration layers."""
+
+    def __init__(self, cache_file: Path) -> None:
+        """
+        Create a cache backed by the given file. The file is read lazily.
+
+        Args:
+            cache_file: Path of the cache file. Created on first save.
+        """
+        self._cache_file = cache_file
+        self._layers: dict[str, tuple[Any, ...]] | None = None
+        self._dirty = False
+
+    def get(
+        self,
+        filepath: Path,
+        contents: bytes | mmap,
+        environ: Mapping[str, str],
+        *,
+        lazy: bool = False,
+    ) -> tuple[Layer, dict[str, str | None]] | None:
+        """
+        Return the cached (layer, referenced) for the file if valid, else None.
+
+        Layers put with `lazy` hold unresolved placeholders and are cached apart.
+        """
+        entry = self._entries().get(_key(filepath, lazy))
+        if entry is None:
+            return None
+
+        cached_fingerprint, referenced, layer = entry
+        if cached_fingerprint != fingerprint(filepath, contents):
+            return None
+
+        for key, value in referenced:
+            if environ.get(key) != value:
+                return None
+
+        return layer, dict(referenced)
+
+    def put(
+        self,
+        filepath: Path,
+        contents: bytes | mmap,
+        referenced: Mapping[str, str | None],
+        layer: Layer,
+        *,
+        lazy: bool = False,
+    ) -> None:
+        """Store a parsed layer with its fingerprint and referenced environ values."""
+        entry = (
+            fingerprint(filepath, contents),
+            tuple(sorted(referenced.items())),
+            layer,
+        )
+        self._entries()[_key(filepath, lazy)] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed. Write is atomic."""
+        if not self._dirty:
+            return
+
+        import marshal
+        import tempfile
+
+        payload = marshal.dumps(
+            (CACHE_VERSION, tuple(sys.version_info[:2]), self._entries())
+        )
+        directory = self._cache_file.parent
+        directory.mkdir(parents=True, exist_ok=True)
+
+        file_desc, temp_path = tempfile.mkstemp(dir=directory, prefix=".yolk_cache_")
+        try:
+            with os.fdopen(file_desc, "wb") as outfile:
+                outfile.write(payload)
+            os.replace(temp_path, self._cache_file)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._dirty = False
+
+    def _entries(self) -> dict[str, tuple[Any, ...]]:
+        """Lazy load entries from disk. Invalid cache files are discarded."""
+        if self._layers is None:
+            self._layers = self._read()
+        return self._layers
+
+    def _read(self) -> dict[str, tuple[Any, ...]]:
+        """Read the cache file, returning empty entries if missing or invalid."""
+        import marshal
+
+        try:
+            version, python, entries = marshal.loads(self._cache_file.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+
+        if version != CACHE_VERSION or python != tuple(sys.version_info[:2]):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+
+def _key(filepath: Path, lazy: bool) -> str:
+    """Cache key of a file, layers with unresolved placeholders are kept apart."""
+    return f"{filepath}\x00lazy" if lazy else str(filepath)
@@ -2,41 +2,176 @@
 
 from __future__ import annotations
 
+import io
 import os
-import re
-from configparser import ConfigParser
 from pathlib import Path
 
+from runtime_yolk.config_cache import ConfigCache
+from runtime_yolk.util import mapped_file
+from runtime_yolk.util.dir_index import DirectoryIndex
 from runtime_yolk.util.file_rule import get_file_name
+from runtime_yolk.util.file_stat import stat_fingerprint
+from runtime_yolk.util.interpolate import Interpolator
+from runtime_yolk.util.references import ReferenceResolver
 
-INTERPOLATE_PATTERN = "{{(.+?)}}"
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from configparser import ConfigParser
+    from mmap import mmap
+    from typing import Any
+    from typing import Union
+
+    from runtime_yolk.compact_config import CompactConfig
+    from runtime_yolk.config_cache import Layer
+    from runtime_yolk.layered_config import LayeredConfig
+    from runtime_yolk.lazy_interpolation import LazyInterpolation
+    from runtime_yolk.load_stats import LoadStats
+    from runtime_yolk.load_stats import PhaseStats
+
+    # Any of the stores `ConfigLoader.config` can be
+    ConfigStore = Union[ConfigParser, CompactConfig, LayeredConfig]
+
+# Section name used to parse single layers so `[DEFAULT]` is kept as its own section
+_LAYER_DEFAULT_SECTION = "\x00"
+
+
+class LoadedLayer:
+    """A parsed config file with the stat and environ values it was parsed from."""
+
+    __slots__ = ("path", "stat", "referenced", "layer")
+
+    def __init__(
+        self,
+        path: Path,
+        stat: tuple[int, int] | None,
+        referenced: Mapping[str, str | None],
+        layer: Layer,
+    ) -> None:
+        self.path = path
+        self.stat = stat
+        self.referenced = referenced
+        self.layer = layer
+
+    def is_stale(self, environ: Mapping[str, str]) -> bool:
+        """True if the file or a referenced environ value changed since parsing."""
+        if stat_fingerprint(self.path) != self.stat:
+            return True
+
+        return any(environ.get(key) != value for key, value in self.referenced.items())
 
 
 class ConfigLoader:
     """Load and store configuration data"""
 
-    def __init__(self, *, working_directory: Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        working_directory: Path | None = None,
+        cache_file: Path | None = None,
+        stats: LoadStats | None = None,
+        search_path: Sequence[Path] | None = None,
+        compact: bool = False,
+        lazy: bool = False,
+        shared: bool = False,
+    ) -> None:
         """
         Create a new instance of Config.
 
         Args:
             working_directory: Set the working directory where file(s) will be loaded.
+            cache_file: Opt-in cache of parsed files, reused while files are unchanged.
+            stats: Opt-in record of load, reload, and interpolate phases.
+            search_path: Directories to load from in order, later directories layer
+                over earlier ones. Replaces working_directory when provided.
+            compact: Store the config in a `CompactConfig` instead of a ConfigParser,
+                for large configs. Only the read methods of ConfigParser are kept,
+                the config is read through `store`.
+            lazy: Resolve `{{KEYWORD}}` placeholders when a value is read instead of
+                when its file is loaded. See `LazyInterpolation`.
+            shared: Share parsed files with every other shared loader of the process
+                that loads identical contents, see `layer_pool`. The config is kept
+                in a `LayeredConfig` holding the shared layers, compact is ignored.
+                The config is read through `store`.
         """
         self._working_directory = working_directory or Path().cwd()
-        self.config = ConfigParser(interpolation=None)
+        self._index = DirectoryIndex(search_path or [self._working_directory])
+        self._compact = compact
+        self._shared = shared
+        self._cache = ConfigCache(cache_file) if cache_file else None
+        self.stats = stats
+        self._phase: PhaseStats | None = None
 
-        self._build_default_config()
+        # Store {{keywords}} that could not be interpolated from the environment.
+        self.unresolved_keys: set[str] = set()
+
+        self._interpolation: LazyInterpolation | None = None
+        if lazy:
+            from runtime_yolk import lazy_interpolation
+
+            self._interpolation = lazy_interpolation.LazyInterpolation(
+                unresolved=self.unresolved_keys
+            )
+
+        # The loaded config, a ConfigParser unless compact or shared is set
+        self.store: ConfigStore = self._build_default_config()
 
         # Store loaded config file names to prevent loading the same file twice.
         self._loaded_configs: set[Path] = set()
 
-    def _build_default_config(self) -> None:
+        # Store loaded layers, in load order, to rebuild the config on reload.
+        self._layers: list[LoadedLayer] = []
+
+        # Config names given to load, in order, to walk their file chains on reload.
+        self._config_names: list[str] = []
+
+        # Resolved values of `{{section:key}}` references, layered over the files.
+        self._resolved: dict[tuple[str, str], str] = {}
+
+    @property
+    def config(self) -> ConfigParser:
+        """
+        Return the loaded ConfigParser.
+
+        Raises:
+            TypeError: The loader is compact or shared, read `store` instead.
+        """
+        from configparser import ConfigParser
+
+        store = self.store
+        if not isinstance(store, ConfigParser):
+            raise TypeError(
+                f"Config is kept in a {type(store).__name__}, read it through store"
+            )
+        return store
+
+    @config.setter
+    def config(self, config: ConfigParser) -> None:
+        self.store = config
+
+    def _build_default_config(self) -> ConfigStore:
         """Build and populate the default config."""
-        self.config["DEFAULT"] = {
-            "environment": os.getenv("YOLK_ENVIRONMENT", ""),
-            "logging_level": os.getenv("LOGGING_LEVEL", "WARNING"),
-            "logging_format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-        }
+        config: ConfigStore
+        if self._shared:
+            from runtime_yolk.layered_config import LayeredConfig
+
+            config = LayeredConfig(self._interpolation)
+        elif self._compact:
+            from runtime_yolk.compact_config import CompactConfig
+
+            config = CompactConfig(self._interpolation)
+        else:
+            from configparser import ConfigParser
+
+            config = ConfigParser(interpolation=self._interpolation)
+
+        config.read_dict({"DEFAULT": _default_values()})
+        return config
 
     def load(
         self,
@@ -51,34 +186,589 @@ class ConfigLoader:
         extension. e.g. `application.ini` becomes `application_${environment}.ini`. If
         found, this config is loaded next.
 
+        With a `search_path` each file name is loaded from every directory that has
+        it, in search path order, before the environment of the next file is read.
+        Each directory is listed once per load, files are not probed one by one.
+
         Default ConfigParser interpolation is disabled. Values with the pattern of
         `{{KEYWORD}}` are interpolated a single time against matching environ keys.
-        Keywords are case sensitive.
+        Keywords are case sensitive. Keywords without a matching environ key are
+        replaced with an empty string and recorded in `unresolved_keys`. With `lazy`
+        files are parsed with their placeholders, each value is resolved and recorded
+        the first time it is read.
+
+        When a `cache_file` is provided, parsed files are reused from the cache as
+        long as the file and the environ keys it references are unchanged.
+
+        Large files are memory mapped and parsed line by line, with only lines that
+        hold a placeholder interpolated, so the full text is never copied.
+
+        Once every file is layered, `{{section:key}}` placeholders are replaced with
+        the value of key as read from section, see `ReferenceResolver`. References
+        are resolved in dependency order, so referenced values may hold references
+        themselves. Missing values are replaced with an empty string and recorded
+        in `unresolved_keys` as `section:key`, a reference cycle raises ValueError.
 
         Args:
             config_name: The name of the configuration file without the extension.
         """
-        self._load(config_name, "")
+        self._start_phase("load_config")
+        try:
+            self._index.clear()
+            if config_name not in self._config_names:
+                self._config_names.append(config_name)
+            self._load(config_name, "")
+            self._resolved = self._resolve_references(self.store)
+
+            if self._cache is not None:
+                self._cache.save()
+        finally:
+            self._finish_phase()
+
+    async def aload(
+        self,
+        *,
+        config_name: str = "application",
+        ready: Awaitable[object] | None = None,
+    ) -> None:
+        """
+        Async `load()`. Files are read and parsed in the loop's default executor.
+
+        Layers are applied in the same order as `load()`, each file is only read
+        once the prior layer names its environment.
+
+        Args:
+            config_name: The name of the configuration file without the extension.
+            ready: Awaited after the first file is read and before it is parsed,
+                such as the load of the `.env` file its `{{KEYWORD}}`s refer to.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        self._index.clear()
+        if config_name not in self._config_names:
+            self._config_names.append(config_name)
+        filename = get_file_name(config_name, "")
+        pending = loop.run_in_executor(None, self._read_files, filename)
+
+        if ready is not None:
+            await ready
+
+        self._start_phase("load_config")
+        try:
+            while True:
+                applied = False
+                reads = await pending
+                try:
+                    for filepath, read in reads:
+                        if read is None or filepath in self._loaded_configs:
+                            continue
+
+                        loaded = await loop.run_in_executor(
+                            None, self._build_layer, filepath, *read
+                        )
+                        self._apply_layer(loaded)
+                        applied = True
+                finally:
+                    # Including files already loaded and those left after an error
+                    for _, read in reads:
+                        if read is not None:
+                            mapped_file.close(read[1])
+
+                environment = self.store.get("DEFAULT", "environment", fallback=None)
+                if not applied or not environment:
+                    break
+
+                filename = get_file_name(config_name, environment)
+                pending = loop.run_in_executor(None, self._read_files, filename)
+
+            self._resolved = self._resolve_references(self.store)
+
+            if self._cache is not None:
+                await loop.run_in_executor(None, self._cache.save)
+        finally:
+            self._finish_phase()
+
+    def dump_layers(self) -> dict[str, Any]:
+        """
+        Return the loaded layers as JSON compatible data for `load_layers()`.
+
+        The data holds each file's parsed layer, stat, and referenced environ values
+        along with the environ driven DEFAULT values.
+        """
+        return {
+            "lazy": self._interpolation is not None,
+            "config_names": list(self._config_names),
+            "defaults": dict(self._build_default_config().defaults()),
+            "layers": [
+                {
+                    "path": str(loaded.path),
+                    "stat": loaded.stat,
+                    "referenced": dict(loaded.referenced),
+                    "layer": loaded.layer,
+                }
+                for loaded in self._layers
+            ],
+        }
+
+    def load_layers(self, data: Mapping[str, Any]) -> bool:
+        """
+        Layer data from `dump_layers()` onto the config without parsing any file.
+
+        Nothing is applied if the environ driven DEFAULT values, a layer's file, or
+        an environ value a layer referenced changed since the data was dumped, or if
+        the search path now holds config files the data has no layer for.
+
+        Args:
+            data: Result of `dump_layers()`, such as from a deploy time bundle.
+
+        Returns:
+            True if the layers were applied, False if the data is stale.
+        """
+        layers = [
+            LoadedLayer(
+                Path(layer["path"]),
+                tuple(layer["stat"]) if layer["stat"] else None,
+                layer["referenced"],
+                layer["layer"],
+            )
+            for layer in data["layers"]
+        ]
+
+        if dict(self._build_default_config().defaults()) != data["defaults"]:
+            return False
+        # Lazy layers hold unresolved placeholders, only a lazy config resolves them
+        if data.get("lazy") and self._interpolation is None:
+            return False
+        if any(loaded.is_stale(os.environ) for loaded in layers):
+            return False
+        config_names = data.get("config_names", ())
+        if config_names and self._chain_paths(config_names, layers) != [
+            loaded.path for loaded in layers
+        ]:
+            return False
+
+        for config_name in config_names:
+            if config_name not in self._config_names:
+                self._config_names.append(config_name)
+        for loaded in layers:
+            if loaded.path not in self._loaded_configs:
+                self._apply_layer(loaded)
+                self.unresolved_keys.update(
+                    key for key, value in loaded.referenced.items() if value is None
+                )
+        self._resolved = self._resolve_references(self.store)
+
+        return True
+
+    def reload(self) -> set[tuple[str, str]]:
+        """
+        Re-read loaded files that changed and rebuild the config from all layers.
+
+        A file is re-read when its mtime or size changed, or when an environ value
+        it referenced through `{{KEYWORD}}` changed. Unchanged files are not read.
+        The chain of file names of each loaded config name is walked again, so a
+        changed `environment` swaps the environment files, and files created since
+        the last load are layered in. Files no longer found are dropped.
+        With `lazy` files are only re-read on a stat change, values already read
+        whose referenced environ values changed are reported as changed.
+        The rebuilt config replaces `config`; changes made directly to the prior
+        `config` object are not carried over.
+
+        Returns:
+            Set of (section, option) whose value was added, changed, or removed.
+        """
+        self._start_phase("reload_config")
+        try:
+            return self._reload()
+        finally:
+            self._finish_phase()
+
+    def _reload(self) -> set[tuple[str, str]]:
+        """Internal reload, see `reload()`."""
+        previous = self._layers
+        changed_values = (
+            self._interpolation.take_changed()
+            if self._interpolation is not None
+            else set()
+        )
+
+        if self._config_names:
+            self._layers = self._walk({loaded.path: loaded for loaded in previous})
+        else:
+            # Layers from data without config names, only their own files are known
+            self._layers = [self._refresh(loaded) for loaded in previous]
+        self._loaded_configs = {loaded.path for loaded in self._layers}
+
+        changed_layers = len(self._layers) != len(previous) or any(
+            loaded is not before for loaded, before in zip(self._layers, previous)
+        )
+
+        if not changed_layers and not changed_values:
+            return set()
+
+        config = self.store
+        resolved = self._resolved
+        if changed_layers:
+            config = self._build_default_config()
+            for loaded in self._layers:
+                self._layer_onto(config, loaded.layer)
+            resolved = self._resolve_references(config)
+
+        before = {**_flatten(self.store, previous), **self._resolved}
+        after = {**_flatten(config, self._layers), **resolved}
+        self.store = config
+        self._resolved = resolved
+
+        if self._cache is not None:
+            self._cache.save()
+
+        return {
+            key
+            for key in before.keys() | after.keys()
+            if before.get(key) != after.get(key) or after.get(key) in changed_values
+        }
+
+    def _walk(self, known: Mapping[Path, LoadedLayer]) -> list[LoadedLayer]:
+        """
+        Return the layers of every loaded config name, as `_load()` would find them.
+
+        Layers in known are reused while their files are unchanged.
+        """
+        self._index.clear()
+        layers: list[LoadedLayer] = []
+        seen: set[Path] = set()
+
+        for config_name in self._config_names:
+            environment = ""
+            while True:
+                applied = False
+                for filepath in self._find(get_file_name(config_name, environment)):
+                    if filepath in seen:
+                        continue
+                    seen.add(filepath)
+
+                    loaded = known.get(filepath)
+                    try:
+                        loaded = (
+                            self._read_layer(filepath)
+                            if loaded is None
+                            else self._refresh(loaded)
+                        )
+                    except FileNotFoundError:
+                        continue
+                    layers.append(loaded)
+                    applied = True
+
+                environment = self._environment(layers)
+                if not applied or not environment:
+                    break
+
+        return layers
+
+    def _chain_paths(
+        self,
+        config_names: Iterable[str],
+        layers: list[LoadedLayer],
+    ) -> list[Path]:
+        """
+        Return the files `_walk()` finds for config_names, without reading any.
+
+        The environment of each step is taken from layers, so a file without a
+        layer there ends the walk.
+        """
+        self._index.clear()
+        by_path = {loaded.path: loaded for loaded in layers}
+        paths: list[Path] = []
+        walked: list[LoadedLayer] = []
+
+        for config_name in config_names:
+            environment = ""
+            while True:
+                applied = False
+                for filepath in self._find(get_file_name(config_name, environment)):
+                    if filepath in paths:
+                        continue
+                    paths.append(filepath)
+                    if filepath not in by_path:
+                        return paths
+                    walked.append(by_path[filepath])
+                    applied = True
+
+                environment = self._environment(walked)
+                if not applied or not environment:
+                    break
+
+        return paths
+
+    def _refresh(self, loaded: LoadedLayer) -> LoadedLayer:
+        """Return loaded, or the file parsed again if it is stale."""
+        if self._phase is not None:
+            self._phase.files_probed += 1
+        if not loaded.is_stale(os.environ):
+            return loaded
+        if loaded.path.is_file():
+            return self._read_layer(loaded.path)
+        return LoadedLayer(loaded.path, None, {}, {})
+
+    def _environment(self, layers: list[LoadedLayer]) -> str:
+        """Return the DEFAULT environment the config has once layers are applied."""
+        for loaded in reversed(layers):
+            value = loaded.layer.get("DEFAULT", {}).get("environment")
+            if value is not None:
+                break
+        else:
+            value = _default_values()["environment"]
+
+        if self._interpolation is not None:
+            value = self._interpolation.resolve(value)
+        return value
 
     def _load(self, config_file: str, yolk_environment: str) -> None:
         """Interal recursive loader."""
+        applied = False
+
+        for _file in self._find(get_file_name(config_file, yolk_environment)):
+            if _file not in self._loaded_configs:
+                self._apply_layer(self._read_layer(_file))
+                applied = True
+
+        # If the config file has an environment set, attempt to load the next file.
+        environment = self.store.get("DEFAULT", "environment", fallback=None)
+        if applied and environment:
+            self._load(config_file, environment)
+
+    def _find(self, filename: str) -> list[Path]:
+        """Return paths to filename in the search path, from the directory index."""
+        if self._phase is not None:
+            self._phase.files_probed += len(self._index.directories)
+        return self._index.find(filename)
+
+    def _start_phase(self, name: str) -> None:
+        """Start recording a phase if stats are enabled."""
+        if self.stats is not None:
+            self._phase = self.stats.start(name)
+
+    def _finish_phase(self) -> None:
+        """Finish the phase started by `_start_phase()`."""
+        if self.stats is not None and self._phase is not None:
+            self.stats.finish(self._phase)
+        self._phase = None
+
+    def _apply_layer(self, loaded: LoadedLayer) -> None:
+        """Layer loaded onto the config and record it for reloads."""
+        self._layer_onto(self.store, loaded.layer)
+        self._loaded_configs.add(loaded.path)
+        self._layers.append(loaded)
 
-        _file = self._working_directory / get_file_name(config_file, yolk_environment)
+    def _layer_onto(self, config: ConfigStore, layer: Layer) -> None:
+        """Layer onto config, a shared config keeps the layer instead of a copy."""
+        if self._shared:
+            from runtime_yolk import layered_config
 
-        if _file.is_file() and _file not in self._loaded_configs:
-            contents = self._interpolate_environment(_file.read_text())
+            if isinstance(config, layered_config.LayeredConfig):
+                config.add_layer(layer)
+                return
 
-            # Load the discovered content as a configuration string
-            # ConfigParser handles invalid content
-            self.config.read_string(contents)
-            self._loaded_configs.add(_file)
+        config.read_dict(layer)
 
-            # If the config file has an environment set, attempt to load the next file.
-            if self.config.get("DEFAULT", "environment", fallback=None):
-                self._load(config_file, self.config.get("DEFAULT", "environment"))
+    def _resolve_references(self, config: ConfigStore) -> dict[tuple[str, str], str]:
+        """Layer the loaded values holding references onto config, resolved."""
+        resolver = ReferenceResolver(
+            [loaded.layer for loaded in self._layers],
+            config.defaults(),
+            config.default_section,
+        )
+        resolved = resolver.resolve()
+        self.unresolved_keys.update(resolver.unresolved)
+
+        overlay: dict[str, dict[str, str]] = {}
+        for (section, option), value in resolved.items():
+            overlay.setdefault(section, {})[option] = value
+        if overlay:
+            config.read_dict(overlay)
+
+        return resolved
+
+    def _read_files(
+        self,
+        filename: str,
+    ) -> list[tuple[Path, tuple[tuple[int, int] | None, bytes | mmap] | None]]:
+        """Return the stat and contents of filename in each search path directory."""
+        return [
+            (filepath, self._read_file(filepath)) for filepath in self._find(filename)
+        ]
+
+    def _read_file(
+        self,
+        filepath: Path,
+    ) -> tuple[tuple[int, int] | None, bytes | mmap] | None:
+        """Return the stat and contents of filepath, None if it was removed."""
+        try:
+            return stat_fingerprint(filepath), mapped_file.read_contents(filepath)
+        except FileNotFoundError:
+            return None
+
+    def _read_layer(self, filepath: Path) -> LoadedLayer:
+        """Read, interpolate, and parse a single file. Uses the cache if provided."""
+        stat = stat_fingerprint(filepath)
+        raw = mapped_file.read_contents(filepath)
+        try:
+            return self._build_layer(filepath, stat, raw)
+        finally:
+            mapped_file.close(raw)
+
+    def _build_layer(
+        self,
+        filepath: Path,
+        stat: tuple[int, int] | None,
+        raw: bytes | mmap,
+    ) -> LoadedLayer:
+        """
+        Interpolate and parse the contents of filepath. Uses the layer pool when
+        shared and the cache if provided.
+        """
+        lazy = self._interpolation is not None
+        key = None
+        cached = None
+        if self._shared:
+            from runtime_yolk import layer_pool
+
+            key = layer_pool.pool_key(raw, lazy)
+            cached = layer_pool.get(key, os.environ)
+        pooled = cached is not None
+        if cached is None and self._cache is not None:
+            cached = self._cache.get(filepath, raw, os.environ, lazy=lazy)
+
+        if cached is not None:
+            layer, referenced = cached
+            self.unresolved_keys.update(
+                key for key, value in referenced.items() if value is None
+            )
+        elif lazy:
+            # Placeholders are kept and resolved on read by the interpolation
+            if isinstance(raw, bytes):
+                layer = self._parse_layer(_decode(raw))
+            else:
+                layer = self._parse_layer(_mapped_lines(raw, None))
+            referenced = {}
+
+            if self._cache is not None:
+                self._cache.put(filepath, raw, referenced, layer, lazy=True)
+        else:
+            stats = self.stats
+            interpolate = stats.start("interpolate") if stats is not None else None
+
+            # A snapshot, the file is interpolated against one consistent environ
+            # even while another thread writes to it, e.g. during `aload()`
+            interpolator = Interpolator(os.environ.copy())
+            parsed: Layer | None = None
+            if isinstance(raw, bytes):
+                contents = interpolator.interpolate(_decode(raw))
+            else:
+                # Interpolated line by line while parsing, the phase includes parsing
+                parsed = self._parse_layer(_mapped_lines(raw, interpolator))
+            self.unresolved_keys.update(interpolator.unresolved)
+            referenced = interpolator.referenced
+
+            if stats is not None and interpolate is not None:
+                interpolate.bytes_read = len(raw)
+                interpolate.placeholders_resolved = len(interpolator.resolved)
+                stats.finish(interpolate)
+
+            layer = self._parse_layer(contents) if parsed is None else parsed
+
+            if self._cache is not None:
+                self._cache.put(filepath, raw, referenced, layer)
+
+        if key is not None and not pooled:
+            layer = layer_pool.put(key, layer, referenced)
+
+        phase = self._phase
+        if phase is not None:
+            phase.bytes_read += len(raw)
+            phase.files_loaded += 1
+            phase.placeholders_resolved += sum(
+                value is not None for value in referenced.values()
+            )
+            phase.keys_applied += sum(len(options) for options in layer.values())
+
+        return LoadedLayer(filepath, stat, referenced, layer)
+
+    def _parse_layer(self, contents: str | Iterable[str]) -> Layer:
+        """Parse content into {section: {option: value}}, keeping DEFAULT separate."""
+        from configparser import ConfigParser
+
+        # ConfigParser handles invalid content
+        parser = ConfigParser(
+            interpolation=None,
+            default_section=_LAYER_DEFAULT_SECTION,
+        )
+        if isinstance(contents, str):
+            parser.read_string(contents)
+        else:
+            parser.read_file(contents)
+
+        return {
+            section: dict(parser.items(section, raw=True))
+            for section in parser.sections()
+        }
 
     def _interpolate_environment(self, contents: str) -> str:
         """Interpolate {{keywords}} to matching environment variable values."""
-        for match in re.finditer(INTERPOLATE_PATTERN, contents):
-            contents = re.sub(match.group(0), os.getenv(match.group(1), ""), contents)
+        interpolator = Interpolator(os.environ.copy())
+        contents = interpolator.interpolate(contents)
+        self.unresolved_keys.update(interpolator.unresolved)
         return contents
+
+
+def _default_values() -> dict[str, str]:
+    """Return the DEFAULT values every config starts from."""
+    return {
+        "environment": os.getenv("YOLK_ENVIRONMENT", ""),
+        "logging_level": os.getenv("LOGGING_LEVEL", "WARNING"),
+        "logging_format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+    }
+
+
+def _decode(raw: bytes) -> str:
+    """Decode file contents as `open()` would, with universal newlines."""
+    return io.TextIOWrapper(io.BytesIO(raw)).read()
+
+
+def _mapped_lines(
+    buffer: mmap,
+    interpolator: Interpolator | None,
+) -> Iterator[str]:
+    """
+    Decode lines of a mapped file, interpolating only lines with a placeholder.
+
+    Line endings are translated to "\\n" as `_decode()` does, so a file parses the
+    same whether or not it is mapped.
+    """
+    encoding = mapped_file.text_encoding()
+    for line in mapped_file.iter_lines(buffer):
+        text = line.decode(encoding)
+        if interpolator is not None and b"{{" in line:
+            text = interpolator.interpolate(text)
+        if b"\r" in line:
+            yield from io.StringIO(text, newline=None)
+        else:
+            yield text
+
+
+def _flatten(
+    config: ConfigStore,
+    layers: list[LoadedLayer],
+) -> dict[tuple[str, str], str]:
+    """Flatten config to {(section, option): value} without inherited DEFAULTs."""
+    default_section = config.default_section
+    flat = {(default_section, key): value for key, value in config.defaults().items()}
+
+    for loaded in layers:
+        for section, options in loaded.layer.items():
+            if section != default_section:
+                for option, value in options.items():
+                    flat[(section, option)] = value
+
+    return flat
@@ -0,0 +1,156 @@
+"""Immutable, pre-resolved view of a loaded configuration."""
+
+from __future__ import annotations
+
+from configparser import ConfigParser
+from configparser import NoOptionError
+from configparser import NoSectionError
+from types import MappingProxyType
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+    from typing import Any
+
+    from runtime_yolk.config_loader import ConfigStore
+
+# Default of `fallback`, tells a missing fallback apart from a None one
+UNSET: Any = object()
+
+
+class TypedGetters:
+    """
+    Typed reads (`getint`, `getfloat`, `getboolean`) for config stores with `get`.
+
+    Values are converted as ConfigParser converts them. Stores override
+    `_get_converted()` to change how a converted value is found, e.g. memoized.
+    """
+
+    __slots__ = ()
+
+    def get(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option as a string, or fallback if provided and missing."""
+        raise NotImplementedError
+
+    def getint(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option converted to int, or fallback if provided and missing."""
+        return self._get_converted(section, option, int, fallback)
+
+    def getfloat(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option converted to float, or fallback if provided and missing."""
+        return self._get_converted(section, option, float, fallback)
+
+    def getboolean(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option converted to bool, or fallback if provided and missing."""
+        return self._get_converted(section, option, to_boolean, fallback)
+
+    def _get_converted(
+        self,
+        section: str,
+        option: str,
+        convert: Callable[[str], Any],
+        fallback: Any,
+    ) -> Any:
+        value = self.get(section, option, fallback=UNSET if fallback is UNSET else None)
+        return fallback if value is None else convert(value)
+
+
+class ConfigSnapshot(TypedGetters):
+    """
+    Read-only copy of a ConfigParser with DEFAULT values resolved into each section.
+
+    Reads are plain dictionary lookups. Typed reads (`getint`, `getfloat`,
+    `getboolean`) are converted once and memoized. The data is never changed after
+    creation so a snapshot can be shared across threads without locks.
+    """
+
+    __slots__ = ("_default_section", "_sections", "_typed")
+
+    def __init__(self, config: ConfigStore) -> None:
+        """
+        Freeze the current state of config.
+
+        Args:
+            config: Loaded config to copy. Later changes to it are not seen.
+        """
+        self._default_section = config.default_section
+        sections: dict[str, Mapping[str, str]] = {
+            self._default_section: MappingProxyType(
+                dict(config.items(config.default_section))
+            )
+        }
+        for section in config.sections():
+            sections[section] = MappingProxyType(dict(config.items(section)))
+
+        self._sections: Mapping[str, Mapping[str, str]] = MappingProxyType(sections)
+        self._typed: dict[tuple[str, str, Callable[[str], Any]], Any] = {}
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(sections={self.sections()!r})"
+
+    def sections(self) -> list[str]:
+        """Return section names, excluding DEFAULT."""
+        return [name for name in self._sections if name != self._default_section]
+
+    def has_section(self, section: str) -> bool:
+        """True if section exists. DEFAULT is not considered a section."""
+        return section != self._default_section and section in self._sections
+
+    def has_option(self, section: str, option: str) -> bool:
+        """True if option exists in section or in DEFAULT."""
+        options = self._sections.get(section)
+        return options is not None and option.lower() in options
+
+    def items(self, section: str) -> Mapping[str, str]:
+        """Return a read-only mapping of the section's options."""
+        try:
+            return self._sections[section]
+        except KeyError:
+            raise NoSectionError(section) from None
+
+    def get(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option as a string, or fallback if provided and missing."""
+        options = self._sections.get(section)
+        if options is None:
+            if fallback is UNSET:
+                raise NoSectionError(section)
+            return fallback
+
+        try:
+            return options[option.lower()]
+        except KeyError:
+            if fallback is UNSET:
+                raise NoOptionError(option, section) from None
+            return fallback
+
+    def _get_converted(
+        self,
+        section: str,
+        option: str,
+        convert: Callable[[str], Any],
+        fallback: Any,
+    ) -> Any:
+        """Return memoized converted value."""
+        key = (section, option.lower(), convert)
+        try:
+            return self._typed[key]
+        except KeyError:
+            pass
+
+        value = self.get(section, option, fallback=UNSET if fallback is UNSET else None)
+        if value is None:
+            return fallback
+
+        converted = convert(value)
+        self._typed[key] = converted
+        return converted
+
+
+def to_boolean(value: str) -> bool:
+    """Convert using the same states as ConfigParser."""
+    try:
+        return ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-import re
+import os
+import sys
+import tempfile
 from argparse import ArgumentParser
 from argparse import Namespace
+from collections.abc import Iterable
+
+from runtime_yolk.env_document import EnvDocument
+
+BATCH_OPERATIONS = ("add", "set", "update", "delete", "unset")
 
 
 def _parse_args(arg_list: list[str] | None = None) -> Namespace:
@@ -11,6 +18,7 @@ def _parse_args(arg_list: list[str] | None = None) -> Namespace:
     parser.add_argument(
         "key",
         type=str,
+        nargs="?",
         help="Name of environ variable to save.",
     )
     parser.add_argument(
@@ -39,7 +47,22 @@ def _parse_args(arg_list: list[str] | None = None) -> Namespace:
         default=".env",
         help="Specify filename and path, default is '.env'",
     )
-    return parser.parse_args(arg_list)
+    parser.add_argument(
+        "-B",
+        "--batch",
+        action="store",
+        default=None,
+        help=(
+            "Apply operations from a file, '-' for stdin. One per line as "
+            "'<add|set|update|delete|unset> KEY [VALUE]'. All or nothing."
+        ),
+    )
+    args = parser.parse_args(arg_list)
+
+    if not args.key and not args.batch:
+        parser.error("the following arguments are required: key")
+
+    return args
 
 
 def _read_file(file_: str) -> str:
@@ -52,46 +75,114 @@ def _read_file(file_: str) -> str:
 
 
 def _write_file(file_: str, contents: str) -> None:
-    """Write contents to file as provided."""
-    with open(file_, "w") as outfile:
-        outfile.write(contents)
+    """Write contents to file as provided. Written to a temp file, then renamed."""
+    directory = os.path.dirname(os.path.abspath(file_))
+    try:
+        mode = os.stat(file_).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    file_desc, temp_path = tempfile.mkstemp(dir=directory, prefix=".yolk_env_")
+    try:
+        with os.fdopen(file_desc, "w") as outfile:
+            outfile.write(contents)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_)
+    except BaseException:
+        os.remove(temp_path)
+        raise
 
 
 def _add_key(key: str, value: str, contents: str) -> str:
     """Add key=value to contents, returns contents. Raises KeyError if key exists."""
-    if re.search(rf"{key.upper()}(\s+)?=", contents):
-        raise KeyError("Key already exists in target file.")
-
-    lines = contents.split("\n")
-    lines.append(f"{key.upper()}={value}")
-    return "\n".join(lines)
+    document = EnvDocument(contents)
+    document.add(key.upper(), value)
+    return document.render()
 
 
 def _update_key(key: str, value: str, contents: str) -> str:
     """Update key=value, returns contents. Raises KeyError if key is missing."""
-    sub_pattern = re.compile(rf"{key.upper()}(\s+)?=.+")
-
-    if not sub_pattern.search(contents):
-        raise KeyError("Key to update was not found in file.")
-
-    return sub_pattern.sub(f"{key.upper()}={value}", contents)
+    document = EnvDocument(contents)
+    document.update(key.upper(), value)
+    return document.render()
 
 
 def _delete_key(key: str, contents: str) -> str:
     """Delete key, returns contents. Raises KeyError if key is missing."""
-    sub_pattern = re.compile(rf"{key.upper()}(\s+)?=.+")
+    document = EnvDocument(contents)
+    document.delete(key.upper())
+    return document.render()
+
+
+def _parse_batch(lines: Iterable[str]) -> list[tuple[str, str, str]]:
+    """Parse batch lines into (operation, key, value). Raises ValueError if invalid."""
+    operations = []
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        operation, _, remainder = line.partition(" ")
+        key, _, value = remainder.strip().partition(" ")
+        operation = operation.lower()
 
-    if not sub_pattern.search(contents):
-        raise KeyError("Key to update was not found in file.")
-    lines = [line for line in contents.split("\n") if not sub_pattern.search(line)]
+        if operation not in BATCH_OPERATIONS or not key:
+            raise ValueError(f"Invalid batch operation on line {line_number}: {line}")
 
-    return "\n".join(lines)
+        operations.append((operation, key.upper(), value.strip()))
+
+    return operations
+
+
+def _apply_batch(operations: Iterable[tuple[str, str, str]], contents: str) -> str:
+    """Apply all operations in one pass, returns contents. Raises KeyError."""
+    document = EnvDocument(contents)
+
+    for operation, key, value in operations:
+        if operation == "add":
+            document.add(key, value)
+        elif operation == "set":
+            document.upsert(key, value)
+        elif operation == "update":
+            document.update(key, value)
+        elif operation == "delete":
+            document.delete(key)
+        else:
+            document.discard(key)
+
+    return document.render()
+
+
+def _run_batch(source: str, file_: str) -> int:
+    """Apply batch operations from source to file_, writing once."""
+    try:
+        if source == "-":
+            operations = _parse_batch(sys.stdin)
+        else:
+            with open(source) as infile:
+                operations = _parse_batch(infile)
+
+        contents = _apply_batch(operations, _read_file(file_))
+
+    except (KeyError, ValueError, OSError) as error:
+        print(f"Error: {error}")
+        return 1
+
+    _write_file(file_, contents)
+
+    return 0
 
 
 def main(_args: list[str] | None = None) -> int:
     """Entry point for cli."""
     args = _parse_args(_args)
 
+    if args.batch:
+        return _run_batch(args.batch, args.file)
+
     contents = _read_file(args.file)
     try:
         if args.delete:
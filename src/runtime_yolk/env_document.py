@@ -0,0 +1,141 @@
+"""
+Line-preserving model of a `.env` file.
+
+The tokenizer in this module is shared by `EnvLoader` and the `yolk-env` cli so
+both agree on what a key is. Lines are split on the first `=`, an optional
+leading 'export ' prefix (case agnostic) is kept apart from the key, and keys
+are matched exactly.
+
+`EnvDocument` keeps every original line, comments and ordering included, with an
+index of key to line position. Lookups and edits do not scan the file and only
+edited lines are rebuilt when rendered.
+"""
+
+from __future__ import annotations
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def split_line(line: str) -> tuple[str, str, str] | None:
+    """
+    Split a `KEY=value` line into (prefix, key, raw value).
+
+    The prefix holds leading whitespace and any 'export ' prefix. Returns None for
+    blank lines, comments, and lines without an `=`.
+    """
+    head, delimiter, value = line.partition("=")
+    key = head.lstrip()
+    if not delimiter or key.startswith("#"):
+        return None
+
+    if key[:6].lower() == "export" and key[6:7].isspace():
+        key = key[6:].lstrip()
+
+    return head[: len(head) - len(key)], key.strip(), value
+
+
+def strip_export(key: str) -> str:
+    """Remove leading 'export ' prefix, case agnostic."""
+    stripped = key.lstrip()
+    if stripped[:6].lower() == "export" and stripped[6:7].isspace():
+        return stripped[6:].lstrip()
+    return key
+
+
+def remove_quotes(value: str) -> str:
+    """Remove matched leading and trailing single or double quotes."""
+    if len(value) > 2 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def clean_value(value: str) -> str:
+    """Strip whitespace, then remove matched leading and trailing quotes."""
+    return remove_quotes(value.strip())
+
+
+class EnvDocument:
+    """Indexed, line-preserving `.env` document."""
+
+    def __init__(self, contents: str = "") -> None:
+        """
+        Parse contents into a document.
+
+        Args:
+            contents: Text of a `.env` file. Lines are split on "\\n" only.
+        """
+        self._lines: list[str | None] = list(contents.split("\n"))
+        self._prefixes: dict[int, str] = {}
+        self._index: dict[str, list[int]] = {}
+
+        for position, line in enumerate(self._lines):
+            split = split_line(line or "")
+            if split is not None and split[1]:
+                prefix, key, _ = split
+                self._prefixes[position] = prefix
+                self._index.setdefault(key, []).append(position)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> str | None:
+        """Return the cleaned value of the last line holding key, else None."""
+        positions = self._index.get(key)
+        if not positions:
+            return None
+
+        split = split_line(self._lines[positions[-1]] or "")
+        return clean_value(split[2]) if split else None
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Yield (key, cleaned value) in file order. Duplicate keys are repeated."""
+        for line in self._lines:
+            split = split_line(line or "")
+            if split is not None and split[1]:
+                yield split[1], clean_value(split[2])
+
+    def add(self, key: str, value: str) -> None:
+        """Append key=value. Raises KeyError if key exists."""
+        if key in self._index:
+            raise KeyError("Key already exists in target file.")
+        self.upsert(key, value)
+
+    def update(self, key: str, value: str) -> None:
+        """Update every line holding key. Raises KeyError if key is missing."""
+        if key not in self._index:
+            raise KeyError("Key to update was not found in file.")
+        self.upsert(key, value)
+
+    def upsert(self, key: str, value: str) -> None:
+        """Update every line holding key, appending key=value if missing."""
+        positions = self._index.get(key)
+
+        if not positions:
+            self._index[key] = [len(self._lines)]
+            self._lines.append(f"{key}={value}")
+            return
+
+        for position in positions:
+            self._lines[position] = f"{self._prefixes.get(position, '')}{key}={value}"
+
+    def delete(self, key: str) -> None:
+        """Remove every line holding key. Raises KeyError if key is missing."""
+        if key not in self._index:
+            raise KeyError("Key to update was not found in file.")
+        self.discard(key)
+
+    def discard(self, key: str) -> None:
+        """Remove every line holding key if present."""
+        for position in self._index.pop(key, []):
+            self._lines[position] = None
+            self._prefixes.pop(position, None)
+
+    def render(self) -> str:
+        """Return the document as text. Untouched lines are kept as read."""
+        return "\n".join(line for line in self._lines if line is not None)
@@ -14,69 +14,221 @@ the following order:
 from __future__ import annotations
 
 import os
-import re
 from pathlib import Path
 
+from runtime_yolk.env_document import clean_value
+from runtime_yolk.env_document import remove_quotes
+from runtime_yolk.env_document import split_line
+from runtime_yolk.env_document import strip_export
+from runtime_yolk.util import mapped_file
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from mmap import mmap
+
+
+class EnvDiff:
+    """Result of comparing loaded values against the current environ."""
+
+    __slots__ = ("added", "changed", "unchanged")
+
+    def __init__(
+        self,
+        added: dict[str, str] | None = None,
+        changed: dict[str, str] | None = None,
+        unchanged: dict[str, str] | None = None,
+    ) -> None:
+        """Create a diff, all mappings default to empty."""
+        self.added: dict[str, str] = added or {}
+        self.changed: dict[str, str] = changed or {}
+        self.unchanged: dict[str, str] = unchanged or {}
+
+    def __repr__(self) -> str:
+        return (
+            f"EnvDiff(added={self.added!r}, changed={self.changed!r}, "
+            f"unchanged={self.unchanged!r})"
+        )
+
+    def __bool__(self) -> bool:
+        """True if any key was added or changed."""
+        return bool(self.added or self.changed)
+
+    @property
+    def values(self) -> dict[str, str]:
+        """All loaded key/value pairs."""
+        return {**self.unchanged, **self.changed, **self.added}
+
 
 class EnvLoader:
     """Load local .env file into environment variables."""
 
-    def __init__(self, working_directory: Path | None = None) -> None:
+    # Incremented each time any EnvLoader writes to environ, values derived from
+    # environ can be kept until it changes.
+    generation = 0
+
+    def __init__(
+        self,
+        working_directory: Path | None = None,
+        *,
+        search_path: Sequence[Path] | None = None,
+    ) -> None:
         """
         Create .env loader.
 
         Args:
             working_directory: Set the working directory where file(s) will be loaded.
+
+        Keyword Args:
+            search_path: Directories to read the file from in order, values in later
+                directories override earlier ones. Replaces working_directory.
         """
         self._working_directory = working_directory or Path().cwd()
+        self.search_path = list(search_path or [self._working_directory])
 
     def load(self, filename: str | None = None) -> bool:
         """
-        Load file to environ.
+        Load file to environ. Only keys with new values are written.
 
         Args:
             filename: Name of environment file to load (default: ".env")
         """
+        return bool(self.apply(filename).values)
+
+    def apply(self, filename: str | None = None, *, dry_run: bool = False) -> EnvDiff:
+        """
+        Load file to environ, returning the difference from the prior environ.
+
+        Keys whose value already matches the environ are not written.
+
+        Args:
+            filename: Name of environment file to load (default: ".env")
+
+        Keyword Args:
+            dry_run: When True the environ is not changed. (default: False)
+        """
+        return self.apply_values(self.read(filename), dry_run=dry_run)
+
+    def apply_values(
+        self,
+        values: Mapping[str, str],
+        *,
+        dry_run: bool = False,
+    ) -> EnvDiff:
+        """
+        Load values, such as those from `read()`, to environ. See `apply()`.
+
+        Args:
+            values: Key/value pairs to load.
+
+        Keyword Args:
+            dry_run: When True the environ is not changed. (default: False)
+        """
+        diff = EnvDiff()
+
+        for key, value in values.items():
+            current = os.environ.get(key)
+            if current is None:
+                diff.added[key] = value
+            elif current != value:
+                diff.changed[key] = value
+            else:
+                diff.unchanged[key] = value
+
+        if not dry_run and (diff.added or diff.changed):
+            for key, value in diff.added.items():
+                os.environ[key] = value
+            for key, value in diff.changed.items():
+                os.environ[key] = value
+            EnvLoader.generation += 1
+
+        return diff
+
+    def read(self, filename: str | None = None) -> dict[str, str]:
+        """
+        Read file to a dictionary without changing environ.
+
+        Args:
+            filename: Name of environment file to read (default: ".env")
+        """
+        return dict(self.iter_values(filename))
+
+    def iter_values(self, filename: str | None = None) -> Iterator[tuple[str, str]]:
+        """
+        Stream key/value pairs from file without loading them to environ.
+
+        The file is read one line at a time. Values are yielded in file order,
+        later duplicate keys are yielded again. With a search path each directory's
+        file is read in search path order.
+
+        Args:
+            filename: Name of environment file to read (default: ".env")
+        """
         filename = ".env" if not filename else filename
-        filepath = self._working_directory / filename
+        return self._iter_files(
+            [directory / filename for directory in self.search_path]
+        )
 
-        loaded_values = self._load_values(filepath)
+    def _iter_files(self, filepaths: list[Path]) -> Iterator[tuple[str, str]]:
+        """
+        Internal: Stream values from each file in order.
 
-        for key, value in loaded_values.items():
-            os.environ[key] = value
+        A single file name is read per directory, so opening it directly costs no
+        more than a directory listing would and no index is kept.
+        """
+        for filepath in filepaths:
+            yield from self._iter_file(filepath)
 
-        return bool(loaded_values)
+    def _iter_file(self, filepath: Path) -> Iterator[tuple[str, str]]:
+        """
+        Internal: Stream values from provided filename. Missing files are empty.
 
-    def _load_values(self, filepath: Path) -> dict[str, str]:
-        """Internal: Load values from provided filename."""
+        Large files are memory mapped and scanned as bytes, see `mapped_file`.
+        """
         try:
-            return self._parse_env_file(filepath.read_text())
-
+            # Split on "\n" only, matching the line rules of `_parse_env_file`
+            infile = open(filepath, newline="\n")
         except FileNotFoundError:
-            return {}
+            return
+
+        with infile:
+            buffer = mapped_file.map_large(infile.fileno())
+            if buffer is None:
+                yield from self._parse_lines(infile)
+                return
+
+        with buffer:
+            yield from self._parse_mapped(buffer)
+
+    def _parse_mapped(self, buffer: mmap) -> Iterator[tuple[str, str]]:
+        """Parse a mapped env file, lines without a key are skipped undecoded."""
+        encoding = mapped_file.text_encoding()
+        for line in mapped_file.iter_lines(buffer):
+            if b"=" not in line or line.lstrip().startswith(b"#"):
+                continue
+            yield from self._parse_lines((line.decode(encoding),))
 
     def _parse_env_file(self, contents: str) -> dict[str, str]:
         """Parse env file into key-pair values."""
-        loaded_values: dict[str, str] = {}
+        return dict(self._parse_lines(contents.split("\n")))
 
-        for line in contents.split("\n"):
-            if not line or line.strip().startswith("#") or len(line.split("=", 1)) != 2:
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+        """Parse lines of an env file into key-pair values."""
+        for line in lines:
+            split = split_line(line)
+            if split is None or not split[1]:
                 continue
-            key, value = line.split("=", 1)
-
-            key = self._strip_export(key).strip()
-            value = value.strip()
-            value = self._remove_lt_quotes(value)
-
-            loaded_values[key] = value
 
-        return loaded_values
+            yield split[1], clean_value(split[2])
 
     def _remove_lt_quotes(self, in_: str) -> str:
         """Remove matched leading and trailing single or double quotes."""
-        match = re.match(r"([\"'])(.*)\1$|^(.*)$", in_)
-        return match.group(2) if match and match.group(2) else in_
+        return remove_quotes(in_)
 
     def _strip_export(self, in_: str) -> str:
         """Remove leading 'export ' prefix, case agnostic."""
-        return re.sub(r"^\s*?export\s*", "", in_, flags=re.IGNORECASE)
+        return strip_export(in_)
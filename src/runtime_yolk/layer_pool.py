@@ -0,0 +1,74 @@
+"""
+Process wide pool of parsed config layers, shared between ConfigLoaders.
+
+Loaders created with `shared=True` look up each file they read by a digest of its
+contents. Files with identical contents, such as a base `application.ini` used
+by every tenant of a process, are parsed once and the parsed layer is shared.
+A pooled layer is dropped once no loader holds it.
+
+A layer is reused while the environ values it referenced through `{{KEYWORD}}`
+interpolation are unchanged, otherwise the file is parsed again and replaces
+the pooled layer.
+"""
+
+from __future__ import annotations
+
+import weakref
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from mmap import mmap
+
+    from runtime_yolk.config_cache import Layer
+
+    # Content digest and whether placeholders were left unresolved
+    PoolKey = tuple[bytes, bool]
+
+
+class PooledLayer(dict):  # type: ignore[type-arg]
+    """A parsed layer shared through the pool. Must not be changed."""
+
+    __slots__ = ("referenced", "__weakref__")
+
+    referenced: dict[str, str | None]
+
+
+_POOL: weakref.WeakValueDictionary[PoolKey, PooledLayer] = weakref.WeakValueDictionary()
+
+
+def pool_key(contents: bytes | mmap, lazy: bool) -> PoolKey:
+    """Return the pool key of file contents, parsed lazily or not."""
+    import hashlib
+
+    return hashlib.blake2b(contents, digest_size=16).digest(), lazy
+
+
+def get(
+    key: PoolKey,
+    environ: Mapping[str, str],
+) -> tuple[Layer, dict[str, str | None]] | None:
+    """Return the pooled (layer, referenced) if valid for environ, else None."""
+    pooled = _POOL.get(key)
+    if pooled is None:
+        return None
+
+    referenced = pooled.referenced
+    if any(environ.get(name) != value for name, value in referenced.items()):
+        return None
+
+    return pooled, referenced
+
+
+def put(key: PoolKey, layer: Layer, referenced: Mapping[str, str | None]) -> Layer:
+    """Pool layer and return the pooled layer to hold in its place."""
+    pooled = PooledLayer(layer)
+    pooled.referenced = dict(referenced)
+    _POOL[key] = pooled
+    return pooled
+
+
+def clear() -> None:
+    """Drop all pooled layers. Layers held by loaders are not changed."""
+    _POOL.clear()
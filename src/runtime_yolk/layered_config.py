@@ -0,0 +1,160 @@
+"""Copy-on-write config store reading through shared, read-only layers."""
+
+from __future__ import annotations
+
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+from runtime_yolk.config_snapshot import UNSET
+from runtime_yolk.config_snapshot import TypedGetters
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    from runtime_yolk.lazy_interpolation import LazyInterpolation
+
+
+class LayeredConfig(TypedGetters):
+    """
+    Config store that keeps each layer as given instead of merging them.
+
+    Layers added with `add_layer()` are kept by reference, so every store that
+    loads the same file shares one parsed copy of it, see `layer_pool`. A store
+    only holds its list of layers, an index of section names, and copies of what
+    is given to `read_dict()`. Reads check the layers from last to first, then
+    DEFAULT the same way.
+
+    Has the read interface of `CompactConfig`, including its optional
+    interpolation. Sections are only changed through `read_dict()` and
+    `add_layer()`.
+    """
+
+    __slots__ = ("default_section", "_layers", "_sections", "_interpolation")
+
+    def __init__(self, interpolation: LazyInterpolation | None = None) -> None:
+        """Create an empty store."""
+        self.default_section = "DEFAULT"
+        self._layers: list[Mapping[str, Mapping[str, str]]] = []
+        self._sections: dict[str, None] = {}
+        self._interpolation = interpolation
+
+    def __repr__(self) -> str:
+        return (
+            f"LayeredConfig(layers={len(self._layers)}, "
+            f"sections={len(self._sections)})"
+        )
+
+    def __contains__(self, section: object) -> bool:
+        return section == self.default_section or section in self._sections
+
+    def read_dict(self, dictionary: Mapping[str, Mapping[str, str]]) -> None:
+        """Layer a copy of {section: {option: value}}, options are lowercased."""
+        self.add_layer(
+            {
+                section: {option.lower(): value for option, value in options.items()}
+                for section, options in dictionary.items()
+            }
+        )
+
+    def add_layer(self, layer: Mapping[str, Mapping[str, str]]) -> None:
+        """
+        Layer {section: {option: value}} onto the store without copying it.
+
+        The layer must not be changed afterwards and its option names must be
+        lowercase, as they are in layers parsed by `ConfigLoader`.
+        """
+        self._layers.append(layer)
+        default_section = self.default_section
+        for section in layer:
+            if section != default_section:
+                self._sections.setdefault(section)
+
+    def defaults(self) -> dict[str, str]:
+        """Return the DEFAULT options, merged from every layer."""
+        defaults: dict[str, str] = {}
+        for layer in self._layers:
+            defaults.update(layer.get(self.default_section, {}))
+        return defaults
+
+    def sections(self) -> list[str]:
+        """Return section names, excluding DEFAULT."""
+        return list(self._sections)
+
+    def has_section(self, section: str) -> bool:
+        """True if section exists. DEFAULT is not considered a section."""
+        return section in self._sections
+
+    def has_option(self, section: str, option: str) -> bool:
+        """True if option exists in section or in DEFAULT."""
+        option = option.lower()
+        if not section or section == self.default_section:
+            return self._lookup(self.default_section, option) is not None
+
+        return section in self._sections and (
+            self._lookup(section, option) is not None
+            or self._lookup(self.default_section, option) is not None
+        )
+
+    def options(self, section: str) -> list[str]:
+        """Return option names of section, including those from DEFAULT."""
+        return [option for option, _ in self.items(section, raw=True)]
+
+    def items(self, section: str, raw: bool = False) -> list[tuple[str, str]]:
+        """Return (option, value) pairs of section, including those from DEFAULT."""
+        if section != self.default_section and section not in self._sections:
+            raise NoSectionError(section)
+
+        merged = self.defaults()
+        for layer in self._layers:
+            merged.update(layer.get(section, {}))
+
+        interpolation = self._interpolation
+        if raw or interpolation is None:
+            return list(merged.items())
+
+        return [
+            (option, interpolation.before_get(self, section, option, value, merged))
+            for option, value in merged.items()
+        ]
+
+    def get(
+        self,
+        section: str,
+        option: str,
+        *,
+        raw: bool = False,
+        fallback: Any = UNSET,
+    ) -> Any:
+        """Return option as a string, or fallback if provided and missing."""
+        option = option.lower()
+        default_section = self.default_section
+
+        if section != default_section and section not in self._sections:
+            if fallback is UNSET:
+                raise NoSectionError(section)
+            return fallback
+
+        value = self._lookup(section, option)
+        if value is None and section != default_section:
+            value = self._lookup(default_section, option)
+        if value is None:
+            if fallback is UNSET:
+                raise NoOptionError(option, section)
+            return fallback
+
+        if raw or self._interpolation is None:
+            return value
+        return self._interpolation.before_get(self, section, option, value, {})
+
+    def _lookup(self, section: str, option: str) -> str | None:
+        """Return option from the last layer of section that has it, else None."""
+        for layer in reversed(self._layers):
+            options = layer.get(section)
+            if options is not None:
+                value = options.get(option)
+                if value is not None:
+                    return value
+        return None
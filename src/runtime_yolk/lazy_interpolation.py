@@ -0,0 +1,100 @@
+"""Resolve `{{KEYWORD}}` placeholders when a config value is read."""
+
+from __future__ import annotations
+
+import os
+import threading
+from configparser import Interpolation
+
+from runtime_yolk.env_loader import EnvLoader
+from runtime_yolk.util.interpolate import Interpolator
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+
+class LazyInterpolation(Interpolation):
+    """
+    Interpolation that leaves values raw until they are read.
+
+    A resolved value is memoized by its raw value along with the environ values
+    it referenced. Memoized values are checked again the first time they are read
+    after an `EnvLoader` writes to environ, those whose referenced values changed
+    are resolved again on their next read. Direct changes to `os.environ` are not
+    seen until an `EnvLoader` applies values.
+    """
+
+    def __init__(
+        self,
+        environ: Mapping[str, str] = os.environ,
+        unresolved: set[str] | None = None,
+    ) -> None:
+        """
+        Create an interpolation with an empty memo.
+
+        Args:
+            environ: Values placeholders are resolved against.
+            unresolved: Set to add keywords without a matching environ key to.
+        """
+        self._environ = environ
+        self._generation = EnvLoader.generation
+        self._memo: dict[str, tuple[str, dict[str, str | None]]] = {}
+        self._changed: set[str] = set()
+        # Held while memoized values are dropped, reads can run on several threads
+        self._lock = threading.Lock()
+        self.unresolved = set() if unresolved is None else unresolved
+
+    def before_get(
+        self,
+        parser: Any,
+        section: str,
+        option: str,
+        value: str,
+        defaults: Any,
+    ) -> str:
+        """Return value with placeholders resolved, called by ConfigParser reads."""
+        return self.resolve(value)
+
+    def resolve(self, value: str) -> str:
+        """Return value with placeholders resolved, from the memo when valid."""
+        if "{{" not in value:
+            return value
+
+        if self._generation != EnvLoader.generation:
+            self._invalidate()
+
+        memo = self._memo.get(value)
+        if memo is None:
+            interpolator = Interpolator(self._environ)
+            memo = self._memo[value] = (
+                interpolator.interpolate(value),
+                interpolator.referenced,
+            )
+            self.unresolved.update(interpolator.unresolved)
+
+        return memo[0]
+
+    def take_changed(self) -> set[str]:
+        """
+        Return raw values whose memoized result was dropped since the last call.
+
+        Values that were never read are not included, nothing resolved them yet.
+        """
+        self._invalidate()
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def _invalidate(self) -> None:
+        """Drop memoized values whose referenced environ values changed."""
+        environ = self._environ
+
+        with self._lock:
+            self._generation = EnvLoader.generation
+            for value, (_, referenced) in list(self._memo.items()):
+                if any(environ.get(key) != ref for key, ref in referenced.items()):
+                    self._memo.pop(value, None)
+                    self._changed.add(value)
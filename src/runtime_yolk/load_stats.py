@@ -0,0 +1,137 @@
+"""Phase timings and counters recorded by an instrumented Yolk."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Counters summed by `LoadStats.total()`, in `as_dict()` order
+COUNTERS = (
+    "bytes_read",
+    "files_probed",
+    "files_loaded",
+    "placeholders_resolved",
+    "keys_applied",
+)
+
+# Phases kept in `LoadStats.phases`, older phases only count in `LoadStats.total()`
+MAX_PHASES = 1_000
+
+
+class PhaseStats:
+    """
+    Wall time and counters of a single phase.
+
+    Phases recorded by Yolk:
+        load_env: One `.env` file read and applied to environ.
+        load_config: The chain of config files read and layered.
+        interpolate: `{{KEYWORD}}` replacement of one config file, nested in a
+            config phase. Cached files skip this phase.
+        reload_config: Changed config files re-read on reload.
+        reload: A full `Yolk.reload()`, nesting `reload_config`.
+        set_logging: Creating and attaching the stderr handler.
+    """
+
+    __slots__ = ("name", "wall_time", "_started", *COUNTERS)
+
+    def __init__(self, name: str) -> None:
+        """Create a phase and start its clock."""
+        self.name = name
+        self.wall_time = 0.0
+        self.bytes_read = 0
+        self.files_probed = 0
+        self.files_loaded = 0
+        self.placeholders_resolved = 0
+        self.keys_applied = 0
+        self._started = time.perf_counter()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"PhaseStats({fields})"
+
+    def as_dict(self) -> dict[str, str | float | int]:
+        """Return the phase as a dictionary, suitable for metrics or JSON."""
+        stats: dict[str, str | float | int] = {
+            "name": self.name,
+            "wall_time": self.wall_time,
+        }
+        for counter in COUNTERS:
+            stats[counter] = getattr(self, counter)
+        return stats
+
+
+class LoadStats:
+    """
+    Phases recorded by an instrumented Yolk, in the order they started.
+
+    Only the latest `max_phases` phases are kept, so a watched Yolk recording a
+    reload every poll does not grow without bound. Finished phases are also summed
+    by name as they finish, `total()` covers every phase ever recorded.
+
+    Yolk and its loaders only check whether stats are set, so there is no cost
+    beyond an attribute lookup per phase when instrumentation is off.
+    """
+
+    __slots__ = ("phases", "hook", "_totals")
+
+    def __init__(
+        self,
+        hook: Callable[[PhaseStats], object] | None = None,
+        max_phases: int = MAX_PHASES,
+    ) -> None:
+        """
+        Create an empty record.
+
+        Args:
+            hook: Called with each phase as it finishes, e.g. to forward metrics.
+            max_phases: Latest phases kept in `phases`.
+        """
+        self.phases: deque[PhaseStats] = deque(maxlen=max_phases)
+        self.hook = hook
+        self._totals: dict[str, PhaseStats] = {}
+
+    def __repr__(self) -> str:
+        return f"LoadStats(phases={self.phases!r})"
+
+    def start(self, name: str) -> PhaseStats:
+        """Start and record a new phase."""
+        phase = PhaseStats(name)
+        self.phases.append(phase)
+        return phase
+
+    def finish(self, phase: PhaseStats) -> None:
+        """Stop the clock of phase and call the hook."""
+        phase.wall_time = time.perf_counter() - phase._started
+
+        total = self._totals.get(phase.name)
+        if total is None:
+            total = self._totals[phase.name] = PhaseStats(phase.name)
+        _add(total, phase)
+
+        if self.hook is not None:
+            self.hook(phase)
+
+    def total(self, name: str) -> PhaseStats:
+        """Return the sum of every finished phase named name."""
+        total = PhaseStats(name)
+        recorded = self._totals.get(name)
+        if recorded is not None:
+            _add(total, recorded)
+        return total
+
+    def clear(self) -> None:
+        """Remove all recorded phases and totals."""
+        self.phases.clear()
+        self._totals.clear()
+
+
+def _add(total: PhaseStats, phase: PhaseStats) -> None:
+    """Add the wall time and counters of phase to total."""
+    total.wall_time += phase.wall_time
+    for counter in COUNTERS:
+        setattr(total, counter, getattr(total, counter) + getattr(phase, counter))
@@ -0,0 +1,394 @@
+"""Logging handlers used by Yolk."""
+
+from __future__ import annotations
+
+import locale
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+
+OVERFLOW_POLICIES = ("block", "drop", "drop_lowest")
+
+
+class OverflowQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue with a policy for when the queue is full.
+
+    Policies:
+        block: Wait for space in the queue.
+        drop: Drop the incoming record.
+        drop_lowest: Drop the lowest level record between the incoming record and
+            those queued. The incoming record is dropped on a tie.
+    """
+
+    def __init__(self, queue_: queue.Queue[logging.LogRecord], overflow: str) -> None:
+        """
+        Create the handler.
+
+        Args:
+            queue_: Bounded queue drained by a QueueListener.
+            overflow: One of `OVERFLOW_POLICIES`.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+
+        super().__init__(queue_)
+        self.queue: queue.Queue[logging.LogRecord] = queue_
+        self.overflow = overflow
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, applying the overflow policy if the queue is full."""
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == "drop_lowest":
+                self._replace_lowest(record)
+            else:
+                self._count_dropped()
+
+    def _replace_lowest(self, record: logging.LogRecord) -> None:
+        """Swap the lowest level queued record for record if record is higher."""
+        with self.queue.mutex:
+            queued = self.queue.queue
+
+            # The queue may have drained since put_nowait() failed
+            if len(queued) < self.queue.maxsize:
+                queued.append(record)
+                self.queue.unfinished_tasks += 1
+                self.queue.not_empty.notify()
+                return
+
+            # Non-records, such as the listener's stop sentinel, are never dropped
+            lowest = min(
+                range(len(queued)),
+                key=lambda idx: getattr(queued[idx], "levelno", sys.maxsize),
+            )
+            if getattr(queued[lowest], "levelno", sys.maxsize) < record.levelno:
+                del queued[lowest]
+                queued.append(record)
+
+        self._count_dropped()
+
+    def _count_dropped(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+
+
+class OverflowQueueListener(QueueListener):
+    """
+    QueueListener that stops without raising when its bounded queue is full.
+
+    The stock listener puts its stop sentinel with `put_nowait()`, which raises
+    `queue.Full` on a full bounded queue. Here the sentinel waits for space,
+    which the listener thread makes as it drains the queue.
+    """
+
+    def __init__(
+        self,
+        queue_: queue.Queue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        """Create a listener of queue_ writing records to handlers."""
+        super().__init__(queue_, *handlers, respect_handler_level=respect_handler_level)
+        self.queue: queue.Queue[logging.LogRecord] = queue_
+
+    def enqueue_sentinel(self) -> None:
+        """Put the stop sentinel, waiting for space in the queue."""
+        # The sentinel of QueueListener is None
+        self.queue.put(None)  # type: ignore[arg-type]
+
+
+class BufferedRotatingFileHandler(logging.FileHandler):
+    """
+    FileHandler that buffers records and optionally rotates the file.
+
+    The buffer is written when it holds `flush_bytes` encoded bytes, `flush_records`
+    records, or `flush_interval` seconds passed since the first buffered record,
+    on a timer thread so records are written even if no other record arrives.
+    Records at `flush_level` or above are written immediately.
+
+    The file is rotated before a write that would grow it past `max_bytes`, or once
+    `rotate_interval` seconds passed. Rotated files are renamed `<file>.1` through
+    `<file>.<backup_count>`. With `compress` the rotated file is gzipped on a
+    background thread as `<file>.1.gz`; a rotation only waits on compression if
+    the prior rotation's compression is still running.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: str | None = None,
+        *,
+        flush_bytes: int = 65_536,
+        flush_records: int = 1_000,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+        max_bytes: int = 0,
+        rotate_interval: float = 0.0,
+        backup_count: int = 5,
+        compress: bool = False,
+    ) -> None:
+        """
+        Create the handler. Zero disables a flush threshold or rotation trigger.
+
+        Args:
+            filename: Path and filename to write logs.
+            mode: File mode for the first open, "a" or "w".
+            encoding: File encoding, default is the platform default.
+
+        Keyword Args:
+            flush_bytes: Buffered bytes that trigger a write.
+            flush_records: Buffered records that trigger a write.
+            flush_interval: Seconds a record may stay buffered.
+            flush_level: Records at or above this level are written immediately.
+            max_bytes: Rotate before the file grows past this size.
+            rotate_interval: Rotate every number of seconds.
+            backup_count: Rotated files to keep, 0 keeps none.
+            compress: Gzip rotated files on a background thread.
+        """
+        super().__init__(filename, mode, encoding)
+        self.flush_bytes = flush_bytes
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+
+        self._buffer: list[str] = []
+        # Encoded size of the buffer, as written to the file. Only counted with a
+        # size threshold
+        self._buffered = 0
+        self._codec = _codec(self.encoding)
+        self._last_flush = time.monotonic()
+        self._flush_timer: threading.Timer | None = None
+        self._file_size = os.path.getsize(self.baseFilename) if mode == "a" else 0
+        self._rotate_at = time.time() + rotate_interval if rotate_interval else 0.0
+        self._compressor: threading.Thread | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record, writing the buffer if any threshold is reached."""
+        try:
+            message = self.format(record) + self.terminator
+            self._buffer.append(message)
+            # Sizes are only needed by the size thresholds, don't encode twice else
+            if self.flush_bytes or self.max_bytes:
+                self._buffered += len(message.encode(self._codec, "replace"))
+
+            if (
+                record.levelno >= self.flush_level
+                or (self.flush_bytes and self._buffered >= self.flush_bytes)
+                or (self.flush_records and len(self._buffer) >= self.flush_records)
+                or (
+                    self.flush_interval
+                    and time.monotonic() - self._last_flush >= self.flush_interval
+                )
+            ):
+                self._write_buffer()
+            elif self.flush_interval and self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.flush_interval, self._flush_on_timer
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records and flush the stream."""
+        self.acquire()
+        try:
+            self._write_buffer()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write buffered records, close the file, and finish any compression."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._write_buffer()
+        finally:
+            super().close()
+            self.release()
+
+        if self._compressor is not None:
+            self._compressor.join()
+
+    def _flush_on_timer(self) -> None:
+        """Write records buffered for `flush_interval`, run on the timer thread."""
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def _write_buffer(self) -> None:
+        """Rotate if needed, then write and clear the buffer."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        if self._should_rotate():
+            self._rotate()
+
+        if self.stream is None:
+            self.stream = self._open()
+
+        self.stream.write("".join(self._buffer))
+        self.stream.flush()
+        self._file_size += self._buffered
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _should_rotate(self) -> bool:
+        if self._rotate_at and time.time() >= self._rotate_at:
+            return True
+        return bool(
+            self.max_bytes
+            and self._file_size
+            and self._file_size + self._buffered > self.max_bytes
+        )
+
+    def _rotate(self) -> None:
+        """Close the file and shift rotated files, compressing the newest if set."""
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+
+        if self.rotate_interval:
+            self._rotate_at = time.time() + self.rotate_interval
+        self._file_size = 0
+        self.mode = "a"
+
+        if not self.backup_count:
+            os.remove(self.baseFilename)
+            return
+
+        suffix = ".gz" if self.compress else ""
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.baseFilename}.{index}{suffix}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{index + 1}{suffix}")
+
+        rotated = f"{self.baseFilename}.1"
+        os.replace(self.baseFilename, rotated)
+
+        if self.compress:
+            self._compressor = threading.Thread(
+                target=_gzip_file,
+                args=(rotated,),
+                name="yolk_log_compress",
+                daemon=True,
+            )
+            self._compressor.start()
+
+
+def worker_path(filepath: str, pid: int) -> str:
+    """Insert pid before the extension of filepath, `app.log` -> `app.<pid>.log`."""
+    root, extension = os.path.splitext(filepath)
+    return f"{root}.{pid}{extension}"
+
+
+def retarget(handler: logging.FileHandler, filename: str) -> None:
+    """
+    Point a file handler at another file without replacing the handler.
+
+    Buffered records are written to the current file before it is closed. The new
+    file is opened in append mode on the next write.
+
+    Args:
+        handler: File handler to move.
+        filename: Path and filename to write logs to from now on.
+    """
+    handler.acquire()
+    try:
+        handler.flush()
+        if handler.stream is not None:
+            handler.stream.close()
+            handler.stream = None
+
+        handler.baseFilename = os.path.abspath(filename)
+        handler.mode = "a"
+
+        if isinstance(handler, BufferedRotatingFileHandler):
+            try:
+                handler._file_size = os.path.getsize(handler.baseFilename)
+            except OSError:
+                handler._file_size = 0
+    finally:
+        handler.release()
+
+
+def reopen_after_fork(handler: logging.Handler, filename: str | None = None) -> None:
+    """
+    Give a handler inherited across a fork its own lock and file in the child.
+
+    The lock is recreated as it may have been held by a parent thread at fork. File
+    handlers drop the inherited stream, which shares its offset with the parent, and
+    reopen in append mode on the next write.
+
+    Args:
+        handler: Handler inherited from the parent process.
+        filename: Write to this file instead of the inherited one.
+    """
+    handler.createLock()
+
+    if not isinstance(handler, logging.FileHandler):
+        return
+
+    if filename is not None:
+        handler.baseFilename = os.path.abspath(filename)
+    handler.mode = "a"
+    handler.stream = None
+
+    if isinstance(handler, BufferedRotatingFileHandler):
+        handler._buffer.clear()
+        handler._buffered = 0
+        handler._compressor = None
+        handler._flush_timer = None
+        handler._last_flush = time.monotonic()
+        try:
+            handler._file_size = os.path.getsize(handler.baseFilename)
+        except OSError:
+            handler._file_size = 0
+
+
+def _codec(encoding: str | None) -> str:
+    """Return the codec a file opened with encoding writes, as open() picks it."""
+    if encoding is None or encoding == "locale":
+        return locale.getpreferredencoding(False)
+    return encoding
+
+
+def _gzip_file(path: str) -> None:
+    """Gzip path to `<path>.gz` then remove path."""
+    import gzip
+    import shutil
+
+    with open(path, "rb") as infile, gzip.open(f"{path}.gz", "wb") as outfile:
+        shutil.copyfileobj(infile, outfile)
+    os.remove(path)
@@ -0,0 +1,247 @@
+"""
+Memory-mapped config shared between a parent process and its forked workers.
+
+The parent calls `publish()` to write the loaded config into a single file. Each
+worker opens the file with `SharedConfig`, which memory maps it read-only. The
+operating system shares the mapped pages between all workers and values are only
+decoded when looked up, so workers do not deserialize or copy the full config.
+
+File layout, all integers little-endian:
+
+    header:  magic (8 bytes), generation (u64), entry count (u32),
+             default section length (u32)
+    default: utf-8 name of the DEFAULT section
+    index:   entry count x (key offset, key length, value offset, value length) u32
+    data:    utf-8 keys and values
+
+Keys are `section \\x00 option`, sorted for binary search. Each section also has
+a `section \\x00` marker entry. Options in DEFAULT are not copied into sections,
+they are found by a second lookup. A section only holds the options whose value
+differs from DEFAULT.
+
+Publishing writes a new file and renames it over the old one. Workers keep reading
+their current mapping until `refresh()` sees a new generation. Generations grow
+with the clock, so a file published after the old one was removed still has a
+new generation.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+from runtime_yolk.config_snapshot import UNSET
+from runtime_yolk.config_snapshot import TypedGetters
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from runtime_yolk.config_loader import ConfigStore
+
+MAGIC = b"YOLKSHM2"
+HEADER = struct.Struct("<8sQII")
+ENTRY = struct.Struct("<IIII")
+
+
+def _key(section: str, option: str) -> bytes:
+    return f"{section}\x00{option}".encode()
+
+
+def read_generation(path: str) -> int:
+    """Return the generation of a published file, 0 if missing or invalid."""
+    try:
+        with open(path, "rb") as infile:
+            magic, generation, _, _ = HEADER.unpack(infile.read(HEADER.size))
+    except (OSError, struct.error):
+        return 0
+    return generation if magic == MAGIC else 0
+
+
+def publish(config: ConfigStore, path: str) -> int:
+    """
+    Write config to path for workers to attach to. The write is atomic.
+
+    Args:
+        config: Loaded config to publish.
+        path: File to write, a tmpfs path such as /dev/shm avoids disk writes.
+
+    Returns:
+        The generation number of the published file.
+    """
+    entries: dict[bytes, bytes] = {}
+    default_section = config.default_section
+
+    defaults = dict(config.items(default_section))
+    entries[_key(default_section, "")] = b""
+    for option, value in defaults.items():
+        entries[_key(default_section, option)] = value.encode()
+
+    for section in config.sections():
+        entries[_key(section, "")] = b""
+        for option, value in config.items(section):
+            # Values equal to DEFAULT are found by the second lookup
+            if defaults.get(option) != value:
+                entries[_key(section, option)] = value.encode()
+
+    # Never reused, even if the file was removed since the last publish
+    generation = max(read_generation(path) + 1, time.time_ns())
+    name = default_section.encode()
+    keys = sorted(entries)
+    index = bytearray()
+    data = bytearray()
+    data_start = HEADER.size + len(name) + ENTRY.size * len(keys)
+
+    for key in keys:
+        encoded = entries[key]
+        key_offset = data_start + len(data)
+        data += key
+        value_offset = data_start + len(data)
+        data += encoded
+        index += ENTRY.pack(key_offset, len(key), value_offset, len(encoded))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_desc, temp_path = tempfile.mkstemp(dir=directory, prefix=".yolk_shm_")
+    try:
+        with os.fdopen(file_desc, "wb") as outfile:
+            outfile.write(HEADER.pack(MAGIC, generation, len(keys), len(name)))
+            outfile.write(name)
+            outfile.write(index)
+            outfile.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return generation
+
+
+class SharedConfig(TypedGetters):
+    """Read-only, memory-mapped view of a config written by `publish()`."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Attach to a published config.
+
+        Args:
+            path: File written by `publish()`.
+        """
+        self._path = path
+        self._default_section = "DEFAULT"
+        self._map: mmap.mmap | None = None
+        self.generation = 0
+        self._count = 0
+        self._index_start = HEADER.size
+        self._attach()
+
+    def __enter__(self) -> SharedConfig:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def is_stale(self) -> bool:
+        """True if a newer generation was published since attaching."""
+        return read_generation(self._path) != self.generation
+
+    def refresh(self) -> bool:
+        """Attach to the newest published generation. Returns True if it changed."""
+        if not self.is_stale():
+            return False
+        self.close()
+        self._attach()
+        return True
+
+    def sections(self) -> list[str]:
+        """Return section names, excluding DEFAULT."""
+        sections = []
+        for position in range(self._count):
+            section, _, option = self._read_key(position).partition(b"\x00")
+            if not option and section.decode() != self._default_section:
+                sections.append(section.decode())
+        return sections
+
+    def has_section(self, section: str) -> bool:
+        """True if section exists. DEFAULT is not considered a section."""
+        return section != self._default_section and self._find(_key(section, "")) >= 0
+
+    def has_option(self, section: str, option: str) -> bool:
+        """True if option exists in section or in DEFAULT."""
+        return self.get(section, option, fallback=None) is not None
+
+    def get(self, section: str, option: str, *, fallback: Any = UNSET) -> Any:
+        """Return option as a string, or fallback if provided and missing."""
+        option = option.lower()
+        position = self._find(_key(section, option))
+
+        if position < 0:
+            if self._find(_key(section, "")) < 0:
+                if fallback is UNSET:
+                    raise NoSectionError(section)
+                return fallback
+
+            position = self._find(_key(self._default_section, option))
+
+        if position < 0:
+            if fallback is UNSET:
+                raise NoOptionError(option, section)
+            return fallback
+
+        return self._read_value(position)
+
+    def _attach(self) -> None:
+        with open(self._path, "rb") as infile:
+            self._map = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, generation, count, name_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a published yolk config: {self._path}")
+
+        self.generation = generation
+        self._count = count
+        self._index_start = HEADER.size + name_length
+        self._default_section = self._map[HEADER.size : self._index_start].decode()
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            raise ValueError("SharedConfig is closed.")
+        return self._map
+
+    def _read_key(self, position: int) -> bytes:
+        key_offset, key_length, _, _ = ENTRY.unpack_from(
+            self._mapped(), self._index_start + ENTRY.size * position
+        )
+        return self._mapped()[key_offset : key_offset + key_length]
+
+    def _read_value(self, position: int) -> str:
+        _, _, value_offset, value_length = ENTRY.unpack_from(
+            self._mapped(), self._index_start + ENTRY.size * position
+        )
+        return self._mapped()[value_offset : value_offset + value_length].decode()
+
+    def _find(self, key: bytes) -> int:
+        """Binary search the index for key, returns position or -1."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            current = self._read_key(middle)
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return middle
+        return -1
@@ -0,0 +1,62 @@
+"""Cached listing of file names in an ordered list of directories."""
+
+from __future__ import annotations
+
+import os
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+class DirectoryIndex:
+    """
+    Find files by name in a search path, listing each directory once.
+
+    A directory is listed with a single `scandir()` the first time it is searched.
+    Later lookups are set membership checks with no file system calls. Call
+    `clear()` to see files created or removed since the listing.
+    """
+
+    __slots__ = ("directories", "_names")
+
+    def __init__(self, directories: Iterable[Path]) -> None:
+        """
+        Create an index, directories are listed on first use.
+
+        Args:
+            directories: Search path, in the order files should be layered.
+        """
+        self.directories = list(directories)
+        self._names: dict[Path, frozenset[str]] = {}
+
+    def find(self, filename: str) -> list[Path]:
+        """Return every directory's path to filename, in search path order."""
+        return [
+            directory / filename
+            for directory in self.directories
+            if filename in self._listing(directory)
+        ]
+
+    def clear(self) -> None:
+        """Drop all listings, the next lookup lists each directory again."""
+        self._names.clear()
+
+    def _listing(self, directory: Path) -> frozenset[str]:
+        """Return names of files in directory, listing it if not yet listed."""
+        names = self._names.get(directory)
+        if names is None:
+            names = self._names[directory] = _list_files(directory)
+        return names
+
+
+def _list_files(directory: Path) -> frozenset[str]:
+    """Names of files in directory, empty if the directory cannot be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            # is_file() uses the type from the listing where the platform has one
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
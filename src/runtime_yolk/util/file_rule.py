@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import re
-
 
 def _replace_spaces(string: str) -> str:
     """Replace spaces with underscores, removes extra spaces."""
-    return re.sub(r"\s+", "_", string.strip())
+    return "_".join(string.split())
 
 
 def get_file_name(filename: str, environment: str = "") -> str:
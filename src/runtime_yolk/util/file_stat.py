@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def stat_fingerprint(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of path, None if the file is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
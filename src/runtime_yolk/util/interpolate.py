@@ -0,0 +1,60 @@
+"""Single-pass `{{KEYWORD}}` interpolation against a snapshot of values."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+
+INTERPOLATE_PATTERN = re.compile(r"{{(.+?)}}")
+
+
+class Interpolator:
+    """
+    Replace `{{KEYWORD}}` placeholders in a single pass.
+
+    Each keyword is looked up once against the provided values and the result is
+    reused for every following occurrence. Keywords that cannot be found are
+    replaced with an empty string and recorded in `unresolved`. Keywords holding a
+    `:` are `{{section:key}}` config references and are left as they are.
+    """
+
+    def __init__(self, values: Mapping[str, str]) -> None:
+        """
+        Create an interpolator.
+
+        Args:
+            values: Mapping of keywords to replacement values, e.g. `os.environ`.
+        """
+        self._values = values
+        self.resolved: dict[str, str] = {}
+        self.unresolved: set[str] = set()
+
+    @property
+    def referenced(self) -> dict[str, str | None]:
+        """Every keyword seen so far and the value it resolved to, if any."""
+        referenced: dict[str, str | None] = dict.fromkeys(self.unresolved)
+        referenced.update(self.resolved)
+        return referenced
+
+    def interpolate(self, contents: str) -> str:
+        """Return contents with all placeholders replaced."""
+        return INTERPOLATE_PATTERN.sub(self._replace, contents)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        """Resolve a single match, caching the lookup."""
+        key = match.group(1)
+
+        if ":" in key:
+            return match.group(0)
+        if key in self.resolved:
+            return self.resolved[key]
+        if key in self.unresolved:
+            return ""
+
+        value = self._values.get(key)
+        if value is None:
+            self.unresolved.add(key)
+            return ""
+
+        self.resolved[key] = value
+        return value
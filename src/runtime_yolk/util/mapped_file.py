@@ -0,0 +1,67 @@
+"""
+Memory mapped reads of large files, scanned for lines as bytes.
+
+Files of at least `MMAP_THRESHOLD` bytes are mapped read-only instead of being
+read into memory. Callers scan the mapped bytes line by line and only decode the
+lines they keep, so no full text copy of the file is made.
+
+Lines are split on b"\\n" only, which assumes an ASCII compatible encoding such as
+utf-8 or latin-1, the encodings `.env` and `.ini` files are written in.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Files of at least this many bytes are mapped instead of read, smaller files are
+# cheaper to read in a single call.
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+def read_contents(filepath: Path) -> bytes | mmap.mmap:
+    """
+    Return the contents of filepath, mapped read-only if it is a large file.
+
+    Mapped contents support `len()` and the buffer protocol like bytes. Release
+    them with `close()` once done.
+    """
+    with open(filepath, "rb") as infile:
+        mapped = map_large(infile.fileno())
+        return infile.read() if mapped is None else mapped
+
+
+def map_large(file_desc: int) -> mmap.mmap | None:
+    """Return a read-only map of the open file if it is large, else None."""
+    if os.fstat(file_desc).st_size < MMAP_THRESHOLD:
+        return None
+    return mmap.mmap(file_desc, 0, access=mmap.ACCESS_READ)
+
+
+def close(contents: bytes | mmap.mmap) -> None:
+    """Release contents returned by `read_contents()`, no-op for bytes."""
+    if isinstance(contents, mmap.mmap):
+        contents.close()
+
+
+def iter_lines(buffer: mmap.mmap) -> Iterator[bytes]:
+    """Yield each line of buffer, line endings included."""
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start) + 1 or size
+        yield buffer[start:end]
+        start = end
+
+
+def text_encoding() -> str:
+    """Encoding `open()` uses by default, so mapped reads decode the same text."""
+    import locale
+
+    return locale.getpreferredencoding(False)
@@ -0,0 +1,164 @@
+"""Dependency ordered `{{section:key}}` references between config values."""
+
+from __future__ import annotations
+
+import re
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    # (section, option) of a config value
+    Node = tuple[str, str]
+
+REFERENCE_PATTERN = re.compile(r"{{([^{}:]+):([^{}]+)}}")
+
+
+class ReferenceResolver:
+    """
+    Resolve `{{section:key}}` references against layered config values.
+
+    Values are nodes of a dependency graph and each reference is an edge to the
+    value it names, found as the config would: the last layer defining it in the
+    section, then in DEFAULT. Values holding references are evaluated once, after
+    everything they depend on, and kept in `resolved` for every later reference.
+    A value that is exactly one reference is given the referenced string itself,
+    so a value referenced many times is stored once.
+
+    References to missing values are replaced with an empty string and recorded in
+    `unresolved` as `section:key`. A reference cycle raises ValueError.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[Mapping[str, Mapping[str, str]]],
+        defaults: Mapping[str, str],
+        default_section: str = "DEFAULT",
+    ) -> None:
+        """
+        Create a resolver with an empty memo.
+
+        Args:
+            layers: {section: {option: value}} layers in the order they apply.
+            defaults: DEFAULT values not given by any layer, e.g. built-in ones.
+            default_section: Name of the DEFAULT section in layers.
+        """
+        self._layers = layers
+        self._defaults = defaults
+        self._default_section = default_section
+        self._located: dict[Node, Node | None] = {}
+        self.resolved: dict[Node, str] = {}
+        self.unresolved: set[str] = set()
+
+    def resolve(self) -> dict[Node, str]:
+        """Return {(section, option): value} of every value holding a reference."""
+        pending = self._referencing()
+
+        for node in pending:
+            if node not in self.resolved:
+                self._evaluate(node, pending)
+
+        return {node: self.resolved[node] for node in pending}
+
+    def _referencing(self) -> dict[Node, str]:
+        """Return the raw values, after layering, that hold a reference."""
+        pending: dict[Node, str] = {}
+        for layer in self._layers:
+            for section, options in layer.items():
+                for option, value in options.items():
+                    if "{{" in value and REFERENCE_PATTERN.search(value):
+                        pending[(section, option)] = value
+                    else:
+                        pending.pop((section, option), None)
+        return pending
+
+    def _evaluate(self, start: Node, pending: Mapping[Node, str]) -> None:
+        """
+        Resolve start after its dependencies, walking the graph depth first.
+
+        A value is resolved once every reference it holds is, which evaluates the
+        graph in topological order without recursion, however long the chain.
+        """
+        path = [start]
+        on_path = {start}
+        stack = [self._dependencies(pending[start])]
+
+        while stack:
+            for dependency in stack[-1]:
+                if dependency in self.resolved or dependency not in pending:
+                    continue
+                if dependency in on_path:
+                    cycle = path[path.index(dependency) :] + [dependency]
+                    raise ValueError(
+                        "Config reference cycle: "
+                        + " -> ".join(
+                            f"{section}:{option}" for section, option in cycle
+                        )
+                    )
+
+                path.append(dependency)
+                on_path.add(dependency)
+                stack.append(self._dependencies(pending[dependency]))
+                break
+            else:
+                stack.pop()
+                node = path.pop()
+                on_path.discard(node)
+                self.resolved[node] = self._substitute(pending[node])
+
+    def _dependencies(self, value: str) -> Iterator[Node]:
+        """Yield the node of each reference in value that can be found."""
+        for match in REFERENCE_PATTERN.finditer(value):
+            node = self._locate(match.group(1), match.group(2).lower())
+            if node is not None:
+                yield node
+
+    def _substitute(self, value: str) -> str:
+        """Return value with references replaced by their resolved values."""
+        match = REFERENCE_PATTERN.fullmatch(value)
+        if match is not None:
+            return self._replace(match)
+        return REFERENCE_PATTERN.sub(self._replace, value)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        """Return the value a single reference names, empty if missing."""
+        section, option = match.group(1), match.group(2).lower()
+        node = self._locate(section, option)
+        if node is None:
+            self.unresolved.add(f"{section}:{option}")
+            return ""
+
+        resolved = self.resolved.get(node)
+        return resolved if resolved is not None else self._raw(node)
+
+    def _locate(self, section: str, option: str) -> Node | None:
+        """Return the node defining option as read from section, None if missing."""
+        target = (section, option)
+        if target in self._located:
+            return self._located[target]
+
+        node: Node | None = None
+        default = self._default_section
+        if section == default or any(section in layer for layer in self._layers):
+            for candidate in (section, default):
+                if any(option in layer.get(candidate, ()) for layer in self._layers):
+                    node = (candidate, option)
+                    break
+            else:
+                if option in self._defaults:
+                    node = (default, option)
+
+        self._located[target] = node
+        return node
+
+    def _raw(self, node: Node) -> str:
+        """Return the raw value of a located node from the last layer defining it."""
+        section, option = node
+        for layer in reversed(self._layers):
+            options = layer.get(section)
+            if options is not None and option in options:
+                return options[option]
+        return self._defaults[option]
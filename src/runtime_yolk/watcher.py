@@ -0,0 +1,69 @@
+"""Background stat polling of loaded files for Yolk hot reloads."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class ReloadChanges:
+    """Keys changed by a reload."""
+
+    __slots__ = ("environ", "config")
+
+    def __init__(
+        self,
+        environ: set[str] | None = None,
+        config: set[tuple[str, str]] | None = None,
+    ) -> None:
+        """
+        Create a record of changed keys.
+
+        Args:
+            environ: Environ keys added or changed.
+            config: (section, option) pairs added, changed, or removed.
+        """
+        self.environ: set[str] = environ or set()
+        self.config: set[tuple[str, str]] = config or set()
+
+    def __repr__(self) -> str:
+        return f"ReloadChanges(environ={self.environ!r}, config={self.config!r})"
+
+    def __bool__(self) -> bool:
+        """True if any key changed."""
+        return bool(self.environ or self.config)
+
+
+class Watcher(threading.Thread):
+    """Daemon thread calling `poll` every `interval` seconds until stopped."""
+
+    def __init__(self, poll: Callable[[], object], interval: float) -> None:
+        """
+        Create the watcher, call `start()` to begin polling.
+
+        Args:
+            poll: Callable run on each interval. Exceptions are logged, not raised.
+            interval: Seconds between polls.
+        """
+        super().__init__(name="yolk_watcher", daemon=True)
+        self._poll = poll
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self._poll()
+            except Exception:
+                logging.getLogger(__name__).exception("Reload failed")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
@@ -6,12 +6,48 @@ Reponsible for all loaders and runners.
 
 from __future__ import annotations
 
-import logging
-from configparser import ConfigParser
+import os
 from pathlib import Path
 
 from runtime_yolk.config_loader import ConfigLoader
 from runtime_yolk.env_loader import EnvLoader
+from runtime_yolk.util.file_stat import stat_fingerprint
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import logging
+    import weakref
+    from collections.abc import Callable
+    from collections.abc import Sequence
+    from configparser import ConfigParser
+    from logging.handlers import QueueListener
+    from typing import IO
+    from typing import Any
+
+    from runtime_yolk.config_loader import ConfigStore
+    from runtime_yolk.config_snapshot import ConfigSnapshot
+    from runtime_yolk.env_loader import EnvDiff
+    from runtime_yolk.load_stats import LoadStats
+    from runtime_yolk.load_stats import PhaseStats
+    from runtime_yolk.log_handlers import OverflowQueueHandler
+    from runtime_yolk.watcher import ReloadChanges
+    from runtime_yolk.watcher import Watcher
+
+    # Stat fingerprint of an env file in each search path directory
+    EnvStat = tuple[tuple[int, int] | None, ...]
+
+# Config options that change Yolk handlers on reload
+_LOGGING_OPTIONS = frozenset(
+    {
+        ("DEFAULT", "logging_level"),
+        ("DEFAULT", "logging_format"),
+        ("DEFAULT", "logging_formatter"),
+    }
+)
+
+# Yolk instances with logging set up, reinitialized in the child after a fork
+_FORK_AWARE: weakref.WeakSet[Yolk] | None = None
 
 
 class Yolk:
@@ -22,6 +58,13 @@ class Yolk:
         *,
         auto_load: bool = False,
         working_directory: str | None = None,
+        config_cache: str | None = None,
+        instrument: bool = False,
+        stats_hook: Callable[[PhaseStats], object] | None = None,
+        search_path: Sequence[str] | None = None,
+        compact_config: bool = False,
+        lazy_interpolation: bool = False,
+        shared_layers: bool = False,
     ) -> None:
         """
         Create Yolk run-time loader instance.
@@ -29,14 +72,60 @@ class Yolk:
         Keyword Args:
             auto_load: Run loads on instantiation. (default: False)
             working_directory: Defaults to cwd, provide path to where config files
+            config_cache: Optional file used to cache parsed config files
+            instrument: Record the time and counters of each phase in `stats`
+            stats_hook: Called with each finished phase, implies instrument
+            search_path: Directories to load files from in order, later directories
+                layer over earlier ones. Replaces working_directory for loading
+            compact_config: Store config in a smaller, read-only CompactConfig
+            lazy_interpolation: Resolve config `{{KEYWORD}}`s when values are read
+            shared_layers: Share parsed config files with other Yolks of the process
         """
         if working_directory:
             self._working_directory = Path(working_directory)
         else:
             self._working_directory = Path.cwd()
 
-        self._config = ConfigLoader(working_directory=self._working_directory)
-        self._env = EnvLoader(working_directory=self._working_directory)
+        self.stats: LoadStats | None = None
+        if instrument or stats_hook is not None:
+            from runtime_yolk import load_stats
+
+            self.stats = load_stats.LoadStats(stats_hook)
+
+        directories = [Path(path) for path in search_path] if search_path else None
+        self._config = ConfigLoader(
+            working_directory=self._working_directory,
+            cache_file=Path(config_cache) if config_cache else None,
+            stats=self.stats,
+            search_path=directories,
+            compact=compact_config,
+            lazy=lazy_interpolation,
+            shared=shared_layers,
+        )
+        self._env = EnvLoader(
+            working_directory=self._working_directory,
+            search_path=directories,
+        )
+
+        # Stat fingerprints of loaded env files, checked on reload
+        self._env_files: dict[str, EnvStat] = {}
+        self._config_names: list[str] = []
+        self._subscribers: list[Callable[[ReloadChanges], object]] = []
+        self._watcher: Watcher | None = None
+        self._snapshot: ConfigSnapshot | None = None
+
+        # Logging handlers added by Yolk by name, attached to root or the queue listener
+        self._handlers: dict[str, logging.Handler] = {}
+        # Root level given to set_logging(), None follows the config
+        self._logging_level: str | int | None = None
+        # Names of file handlers whose level follows the config
+        self._config_levels: set[str] = set()
+        # Whether the format of yolk_core follows the config
+        self._config_format = True
+        self._queue_handler: OverflowQueueHandler | None = None
+        self._queue_listener: QueueListener | None = None
+        # Per-worker file handlers to the path given, before the pid suffix
+        self._worker_files: dict[logging.Handler, str] = {}
 
         if auto_load:
             self.load_env()
@@ -45,9 +134,20 @@ class Yolk:
 
     @property
     def config(self) -> ConfigParser:
-        """Return loaded ConfigParser object."""
+        """
+        Return the loaded ConfigParser.
+
+        Raises:
+            TypeError: Created with `compact_config` or `shared_layers`, read
+                `config_store` instead.
+        """
         return self._config.config
 
+    @property
+    def config_store(self) -> ConfigStore:
+        """Return the loaded config, a ConfigParser unless another store was chosen."""
+        return self._config.store
+
     def load_config(self, config_name: str = "application") -> None:
         """
         Load configuration from a file, layers loads onto existing loaded data.
@@ -56,37 +156,274 @@ class Yolk:
             config_name: The name of the config file without the extension
         """
         self._config.load(config_name=config_name)
+        self._add_config_name(config_name)
+        self._snapshot = None
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Return a read-only snapshot of the config, safe to share across threads.
+
+        The snapshot is built once and reused until `load_config()` or a `reload()`
+        that changes the config replaces it. Changes made directly to `config` are
+        not seen by an existing snapshot.
+        """
+        from runtime_yolk.config_snapshot import ConfigSnapshot
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = ConfigSnapshot(self.config_store)
+        return snapshot
 
-    def load_env(self, filename: str = ".env") -> None:
+    def publish_config(self, path: str) -> int:
         """
-        Load environment values from a file.
+        Write the loaded config to a file that forked workers memory map.
+
+        Call after loading and before forking. Workers open the file with
+        `runtime_yolk.shared_config.SharedConfig` and share its pages instead of
+        each parsing or copying the config. Publishing again bumps the generation
+        seen by `SharedConfig.refresh()`.
+
+        Args:
+            path: File to write, a tmpfs path such as /dev/shm avoids disk writes.
+
+        Returns:
+            The generation number of the published file.
+        """
+        from runtime_yolk.shared_config import publish
+
+        return publish(self.config_store, path)
+
+    def write_bundle(self, path: str) -> None:
+        """
+        Write the loaded env values and config layers to a bundle for `load_bundle()`.
+
+        The bundle records the stat of every source file and the environ values
+        interpolated into the config, so a stale bundle is detected when loaded.
+
+        Args:
+            path: Bundle file to write.
+        """
+        from runtime_yolk.config_bundle import write_bundle
+
+        write_bundle(
+            path,
+            {
+                "search_path": [
+                    os.path.abspath(path) for path in self._env.search_path
+                ],
+                "config_names": self._config_names,
+                "env_files": {
+                    filename: {"stat": stat, "values": self._env.read(filename)}
+                    for filename, stat in self._env_files.items()
+                },
+                "config": self._config.dump_layers(),
+            },
+        )
+
+    def load_bundle(
+        self,
+        path: str,
+        env_filename: str = ".env",
+        config_name: str = "application",
+    ) -> bool:
+        """
+        Load env values and config from a bundle, or from files if it is stale.
+
+        The bundle is used when it was built from the same search path, env file,
+        and config name, its source files are unchanged, and the environ values its
+        config was interpolated with still match. Otherwise the files are loaded as
+        with `load_env(env_filename)` and `load_config(config_name)`.
+
+        Args:
+            path: Bundle written by `write_bundle()` or the `yolk-bundle` cli.
+            env_filename: The name of the env file to load. (default: `.env`)
+            config_name: The name of the config file without the extension
+
+        Returns:
+            True if the bundle was used, False if files were loaded instead.
+        """
+        from runtime_yolk.config_bundle import read_bundle
+
+        bundle = read_bundle(path)
+        env_stat = self._env_stat(env_filename)
+
+        if bundle is None or not _bundle_matches(
+            bundle,
+            self._bundle_search_path(),
+            env_filename,
+            env_stat,
+            config_name,
+        ):
+            self.load_env(env_filename)
+            self.load_config(config_name)
+            return False
+
+        phase = self.stats.start("load_env") if self.stats is not None else None
+        values = bundle["env_files"][env_filename]["values"]
+        self._apply_env(env_filename, env_stat, values, phase)
+
+        # The environ now matches what load_env() would leave, so the config layers
+        # are checked against the same referenced values a file load would use
+        if not self._config.load_layers(bundle["config"]):
+            self.load_config(config_name)
+            return False
+
+        self._add_config_name(config_name)
+        self._snapshot = None
+        return True
+
+    def load_env(self, filename: str = ".env") -> EnvDiff:
+        """
+        Load environment values from a file. Unchanged values are not rewritten.
 
         Args:
             filename: The name of the env file to load. (default: `.env`)
+
+        Returns:
+            EnvDiff of added, changed, and unchanged keys.
+        """
+        phase = self.stats.start("load_env") if self.stats is not None else None
+        stat, values = self._read_env(filename)
+        return self._apply_env(filename, stat, values, phase)
+
+    async def aload(
+        self,
+        env_filename: str = ".env",
+        config_name: str = "application",
+    ) -> None:
+        """
+        Async equivalent of `auto_load`, file reads run in the default executor.
+
+        The `.env` file and the first config file are read concurrently. The env
+        values are applied before config files are parsed, as with `load_env()`
+        followed by `load_config()`, then `set_logging()` is run.
+
+        Args:
+            env_filename: The name of the env file to load. (default: `.env`)
+            config_name: The name of the config file without the extension
+        """
+        import asyncio
+
+        env = asyncio.ensure_future(self.aload_env(env_filename))
+        await self._config.aload(config_name=config_name, ready=env)
+        self._add_config_name(config_name)
+        self._snapshot = None
+        await env
+        self.set_logging()
+
+    async def aload_env(self, filename: str = ".env") -> EnvDiff:
+        """Async `load_env()`. The file is read in the default executor."""
+        import asyncio
+
+        phase = self.stats.start("load_env") if self.stats is not None else None
+        loop = asyncio.get_running_loop()
+        stat, values = await loop.run_in_executor(None, self._read_env, filename)
+        return self._apply_env(filename, stat, values, phase)
+
+    async def aload_config(self, config_name: str = "application") -> None:
+        """Async `load_config()`. Files are read in the default executor."""
+        await self._config.aload(config_name=config_name)
+        self._add_config_name(config_name)
+        self._snapshot = None
+
+    def reload(self) -> ReloadChanges:
+        """
+        Reload env and config files that changed since they were loaded.
+
+        Only files with a changed mtime or size are re-read. Config files are also
+        re-read when an environ value they referenced changed. Subscribers are
+        called with the changes if anything changed.
+
+        Returns:
+            ReloadChanges of the environ keys and config (section, option) changed.
         """
-        self._env.load(filename)
+        changes = self._reload_files()
+        self._notify(changes)
+        return changes
+
+    async def areload(self) -> ReloadChanges:
+        """
+        Async `reload()`. Files are checked and read in the default executor.
+
+        Subscribers are called on the event loop thread.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        changes = await loop.run_in_executor(None, self._reload_files)
+        self._notify(changes)
+        return changes
+
+    def subscribe(self, callback: Callable[[ReloadChanges], object]) -> None:
+        """Call `callback(changes)` after each reload that changed any key."""
+        self._subscribers.append(callback)
+
+    def watch(self, interval: float = 1.0) -> None:
+        """
+        Start a background thread calling `reload()` every interval.
+
+        Loaded files are polled with `stat()`, no file system events are used.
+        Calling again replaces the running watcher.
+
+        Args:
+            interval: Seconds between polls. (default: 1.0)
+        """
+        from runtime_yolk.watcher import Watcher
+
+        self.stop_watching()
+        self._watcher = Watcher(self.reload, interval)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background reload thread if running."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
 
     def set_logging(self, level: str | int | None = None) -> None:
         """
         Set the root log level for stderr output. If empty, config level is used.
 
+        The stderr handler is named `yolk_core`. Calling again, or from another
+        Yolk, updates its format and the root level instead of adding another
+        handler. Records are formatted as selected by `logging_formatter`. Without
+        a level, the root level and format follow `logging_level` and
+        `logging_format` when the config is reloaded.
+
         Args:
             level: String or Int representing logging level. (e.g.: "ERROR" or 40)
         """
-        config_level = self.config.get("DEFAULT", "logging_level", fallback="ERROR")
-        config_fmt = self.config.get("DEFAULT", "logging_format", fallback="")
+        import logging
+
+        phase = self.stats.start("set_logging") if self.stats is not None else None
 
-        # Create our handler for root logger, don't touch existing handlers
-        handler = logging.StreamHandler()
-        handler.set_name("yolk_core")
-        handler.setFormatter(logging.Formatter(config_fmt))
-        logging.getLogger().addHandler(handler)
+        config_level = self.config_store.get(
+            "DEFAULT", "logging_level", fallback="ERROR"
+        )
+        config_fmt = self.config_store.get("DEFAULT", "logging_format", fallback="")
+
+        # Create our handler for root logger once, don't touch existing handlers
+        handler = self._existing_handler("yolk_core")
+        if handler is None:
+            handler = logging.StreamHandler()
+            handler.set_name("yolk_core")
+            handler.setFormatter(self._formatter(config_fmt))
+            self._add_handler(handler)
+        else:
+            handler.setFormatter(self._formatter(config_fmt))
+        self._config_format = True
 
         # Apply desired level to root logger
+        self._logging_level = level
         logging.getLogger().setLevel(level if level is not None else config_level)
 
+        if self.stats is not None and phase is not None:
+            self.stats.finish(phase)
+
     def get_logger(self, name: str | None = None) -> logging.Logger:
         """Return a logger. If a name is not provided, root logger is returned."""
+        import logging
+
         return logging.getLogger(name)
 
     def add_logging_file(
@@ -94,21 +431,494 @@ class Yolk:
         filepath: str,
         level: str | int | None = None,
         append: bool = True,
+        *,
+        buffered: bool = False,
+        flush_bytes: int = 65_536,
+        flush_records: int = 1_000,
+        flush_interval: float = 1.0,
+        max_bytes: int = 0,
+        rotate_interval: float = 0.0,
+        backup_count: int = 5,
+        compress: bool = False,
+        per_worker: bool = False,
     ) -> None:
         """
         Add a handler for logging output to desired file.
 
+        The handler is named `yolk_core_<filepath>`. Calling again with the same
+        filepath and options, or from another Yolk, only updates the level of the
+        existing handler, see `tune_handler()` for the format or file. With other
+        options the existing handler is closed and replaced. Without a level the
+        handler follows `logging_level` when the config is reloaded.
+
         Args:
             filepath: Path and filename to write logs. Relative or Absolute.
             level: String or Int representing logging level. (e.g.: "DEBUG" or 10)
             append: If False, existing log file will be cleared before writing
+
+        Keyword Args:
+            buffered: Buffer records, ERROR and above are always written at once.
+            flush_bytes: Buffered bytes that trigger a write. (default: 64KiB)
+            flush_records: Buffered records that trigger a write. (default: 1000)
+            flush_interval: Seconds a record may stay buffered. (default: 1.0)
+            max_bytes: Rotate the file before it grows past this size.
+            rotate_interval: Rotate the file every number of seconds.
+            backup_count: Rotated files to keep. (default: 5)
+            compress: Gzip rotated files on a background thread.
+            per_worker: Write to `<name>.<pid><ext>`. A forked child switches to
+                a file with its own pid so workers do not share one file.
         """
+        import logging
+
+        from runtime_yolk.log_handlers import BufferedRotatingFileHandler
+        from runtime_yolk.log_handlers import worker_path
+
+        name = f"yolk_core_{filepath}"
+        mode = "a" if append else "w"
+        rotating = bool(buffered or max_bytes or rotate_interval)
+        if not buffered:
+            # Every record is written at once
+            flush_bytes, flush_records, flush_interval = 0, 1, 0.0
+        options: tuple[object, ...] = (mode, per_worker)
+        if rotating:
+            options += (
+                flush_bytes,
+                flush_records,
+                flush_interval,
+                max_bytes,
+                rotate_interval,
+                backup_count,
+                compress,
+            )
+
+        existing = self._existing_handler(name)
+        if existing is not None and self._file_options(existing) != options:
+            self.remove_handler(name)
+            existing = None
+
         # Assert we have a level, default to lowest.
-        config_level = self.config.get("DEFAULT", "logging_level", fallback="DEBUG")
+        config_level = self.config_store.get(
+            "DEFAULT", "logging_level", fallback="DEBUG"
+        )
+        if level is None:
+            self._config_levels.add(name)
+        else:
+            self._config_levels.discard(name)
         level = level if level is not None else config_level
 
-        handler = logging.FileHandler(filename=filepath, mode="a" if append else "w")
-        handler.set_name(f"yolk_core_{filepath}")
+        if existing is not None:
+            existing.setLevel(level)
+            return
+
+        path = worker_path(filepath, os.getpid()) if per_worker else filepath
+
+        handler: logging.FileHandler
+        if rotating:
+            handler = BufferedRotatingFileHandler(
+                path,
+                mode,
+                flush_bytes=flush_bytes,
+                flush_records=flush_records,
+                flush_interval=flush_interval,
+                max_bytes=max_bytes,
+                rotate_interval=rotate_interval,
+                backup_count=backup_count,
+                compress=compress,
+            )
+        else:
+            handler = logging.FileHandler(filename=path, mode=mode)
+
+        handler.set_name(name)
         handler.setLevel(level)
 
-        logging.getLogger().addHandler(handler)
+        if per_worker:
+            self._worker_files[handler] = filepath
+
+        self._add_handler(handler)
+
+    @property
+    def logging_handlers(self) -> dict[str, logging.Handler]:
+        """Return the handlers added by Yolk, by name."""
+        return dict(self._handlers)
+
+    def tune_handler(
+        self,
+        name: str,
+        *,
+        level: str | int | None = None,
+        fmt: str | None = None,
+        target: str | IO[str] | None = None,
+    ) -> None:
+        """
+        Change a Yolk handler in place, records keep flowing while it changes.
+
+        A level or format given here is no longer taken from the config on reload.
+
+        Args:
+            name: Handler name, `yolk_core` or `yolk_core_<filepath>`.
+
+        Keyword Args:
+            level: New level of the handler.
+            fmt: New format string of the handler, formatted as selected by
+                `logging_formatter`.
+            target: New file path for a file handler, or stream for `yolk_core`.
+        """
+        import logging
+
+        from runtime_yolk.log_handlers import retarget
+
+        handler = self._handlers[name]
+
+        if level is not None:
+            handler.setLevel(level)
+            self._config_levels.discard(name)
+        if fmt is not None:
+            handler.setFormatter(self._formatter(fmt))
+            if name == "yolk_core":
+                self._config_format = False
+
+        if target is None:
+            return
+
+        if isinstance(handler, logging.FileHandler):
+            if not isinstance(target, str):
+                raise TypeError(f"File handler {name} needs a file path target")
+            retarget(handler, target)
+            self._worker_files.pop(handler, None)
+        elif isinstance(handler, logging.StreamHandler) and not isinstance(target, str):
+            handler.setStream(target)
+        else:
+            raise TypeError(f"Cannot target {name} at {target!r}")
+
+    def remove_handler(self, name: str) -> None:
+        """Detach and close a Yolk handler. Unknown names are ignored."""
+        import logging
+
+        handler = self._handlers.pop(name, None)
+        if handler is None:
+            return
+
+        self._config_levels.discard(name)
+        self._worker_files.pop(handler, None)
+
+        if self._queue_listener is not None:
+            listener = self._queue_listener
+            listener.handlers = tuple(
+                current for current in listener.handlers if current is not handler
+            )
+        else:
+            logging.getLogger().removeHandler(handler)
+
+        handler.close()
+
+    def set_queued_logging(
+        self, max_size: int = 10_000, overflow: str = "block"
+    ) -> None:
+        """
+        Move Yolk logging handlers behind a queue drained on a background thread.
+
+        The root logger gets a QueueHandler and the handlers from `set_logging` and
+        `add_logging_file`, including those added later, are written by a
+        QueueListener thread. Queued records are flushed on `stop_queued_logging()`,
+        which also runs at interpreter exit.
+
+        Args:
+            max_size: Maximum records held in the queue, 0 is unbounded.
+            overflow: When the queue is full; "block" waits for space, "drop" drops
+                the new record, "drop_lowest" drops the lowest level record.
+        """
+        import atexit
+        import logging
+        import queue
+
+        from runtime_yolk.log_handlers import OverflowQueueHandler
+        from runtime_yolk.log_handlers import OverflowQueueListener
+
+        self.stop_queued_logging()
+
+        records: queue.Queue[logging.LogRecord] = queue.Queue(max_size)
+        queue_handler = OverflowQueueHandler(records, overflow)
+        queue_handler.set_name("yolk_queue")
+
+        root = logging.getLogger()
+        for handler in self._handlers.values():
+            root.removeHandler(handler)
+
+        self._queue_listener = OverflowQueueListener(
+            records,
+            *self._handlers.values(),
+            respect_handler_level=True,
+        )
+        self._queue_listener.start()
+        self._queue_handler = queue_handler
+        root.addHandler(queue_handler)
+
+        atexit.register(self.stop_queued_logging)
+        _track_for_fork(self)
+
+    def stop_queued_logging(self) -> None:
+        """Flush queued records and attach Yolk handlers directly to root again."""
+        import atexit
+        import logging
+
+        if self._queue_listener is None or self._queue_handler is None:
+            return
+
+        root = logging.getLogger()
+        root.removeHandler(self._queue_handler)
+        self._queue_listener.stop()
+        self._queue_listener = None
+
+        for handler in self._handlers.values():
+            root.addHandler(handler)
+
+        atexit.unregister(self.stop_queued_logging)
+
+    @property
+    def dropped_log_records(self) -> int:
+        """Number of records dropped by the queued logging overflow policy."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def _existing_handler(self, name: str) -> logging.Handler | None:
+        """
+        Return the Yolk handler named name, None if there is none.
+
+        A handler another Yolk attached to root is taken over, so instances in one
+        process share a single handler per name.
+        """
+        import logging
+
+        handler = self._handlers.get(name)
+        if handler is not None:
+            return handler
+
+        root = logging.getLogger()
+        for handler in root.handlers:
+            if handler.get_name() == name:
+                if self._queue_listener is not None:
+                    root.removeHandler(handler)
+                self._add_handler(handler)
+                return handler
+        return None
+
+    def _file_options(self, handler: logging.Handler) -> tuple[object, ...]:
+        """Return the `add_logging_file()` options handler was created with."""
+        import logging
+
+        from runtime_yolk.log_handlers import BufferedRotatingFileHandler
+
+        if not isinstance(handler, logging.FileHandler):
+            return ()
+
+        options: tuple[object, ...] = (handler.mode, handler in self._worker_files)
+        if isinstance(handler, BufferedRotatingFileHandler):
+            options += (
+                handler.flush_bytes,
+                handler.flush_records,
+                handler.flush_interval,
+                handler.max_bytes,
+                handler.rotate_interval,
+                handler.backup_count,
+                handler.compress,
+            )
+        return options
+
+    def _add_handler(self, handler: logging.Handler) -> None:
+        """Attach a Yolk handler to the queue listener if active, else to root."""
+        import logging
+
+        self._handlers[handler.get_name()] = handler
+        _track_for_fork(self)
+
+        if self._queue_listener is not None:
+            listener = self._queue_listener
+            listener.handlers = (*listener.handlers, handler)
+        else:
+            logging.getLogger().addHandler(handler)
+
+    def _add_config_name(self, config_name: str) -> None:
+        """Record a loaded config name once, as bundles are matched on the list."""
+        if config_name not in self._config_names:
+            self._config_names.append(config_name)
+
+    def _bundle_search_path(self) -> list[str]:
+        """Return absolute search path directories, as recorded in bundles."""
+        return [os.path.abspath(directory) for directory in self._env.search_path]
+
+    def _env_stat(self, filename: str) -> EnvStat:
+        """Return the stat fingerprint of filename in each env search directory."""
+        return tuple(
+            stat_fingerprint(directory / filename)
+            for directory in self._env.search_path
+        )
+
+    def _read_env(self, filename: str) -> tuple[EnvStat, dict[str, str]]:
+        """Return the stat and values of an env file."""
+        return self._env_stat(filename), self._env.read(filename)
+
+    def _apply_env(
+        self,
+        filename: str,
+        stat: EnvStat,
+        values: dict[str, str],
+        phase: PhaseStats | None,
+    ) -> EnvDiff:
+        """Apply values read from an env file, finishing its phase if recorded."""
+        self._env_files[filename] = stat
+        diff = self._env.apply_values(values)
+
+        if self.stats is not None and phase is not None:
+            found = [fingerprint for fingerprint in stat if fingerprint is not None]
+            phase.files_probed = len(stat)
+            phase.files_loaded = len(found)
+            phase.bytes_read = sum(size for _, size in found)
+            phase.keys_applied = len(diff.added) + len(diff.changed)
+            self.stats.finish(phase)
+
+        return diff
+
+    def _reload_files(self) -> ReloadChanges:
+        """Re-read changed files, returning the changes. Subscribers are not called."""
+        from runtime_yolk.watcher import ReloadChanges
+
+        phase = self.stats.start("reload") if self.stats is not None else None
+        changes = ReloadChanges()
+
+        for filename, stat in self._env_files.items():
+            current = self._env_stat(filename)
+            if phase is not None:
+                phase.files_probed += len(current)
+            if current == stat:
+                continue
+
+            self._env_files[filename] = current
+            diff = self._env.apply(filename)
+            changes.environ.update(diff.added, diff.changed)
+
+            if phase is not None:
+                for fingerprint in current:
+                    if fingerprint is not None:
+                        phase.files_loaded += 1
+                        phase.bytes_read += fingerprint[1]
+
+        changes.config.update(self._config.reload())
+        if not changes.config.isdisjoint(_LOGGING_OPTIONS):
+            self._retune_logging()
+
+        if self.stats is not None and phase is not None:
+            phase.keys_applied = len(changes.environ) + len(changes.config)
+            self.stats.finish(phase)
+
+        # Readers holding the prior snapshot keep a consistent view
+        if changes.config and self._snapshot is not None:
+            from runtime_yolk.config_snapshot import ConfigSnapshot
+
+            self._snapshot = ConfigSnapshot(self.config_store)
+
+        return changes
+
+    def _notify(self, changes: ReloadChanges) -> None:
+        """Call subscribers if anything changed."""
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+
+    def _retune_logging(self) -> None:
+        """Apply reloaded logging options to the handlers that follow the config."""
+        import logging
+
+        handler = self._handlers.get("yolk_core")
+        if handler is not None:
+            if self._config_format:
+                fmt = self.config_store.get("DEFAULT", "logging_format", fallback="")
+                handler.setFormatter(self._formatter(fmt))
+            if self._logging_level is None:
+                logging.getLogger().setLevel(
+                    self.config_store.get("DEFAULT", "logging_level", fallback="ERROR")
+                )
+
+        file_level = self.config_store.get("DEFAULT", "logging_level", fallback="DEBUG")
+        for name in self._config_levels:
+            self._handlers[name].setLevel(file_level)
+
+    def _formatter(self, fmt: str) -> logging.Formatter:
+        """Return a formatter for fmt of the kind set by `logging_formatter`."""
+        from runtime_yolk.log_formatters import build_formatter
+
+        kind = self.config_store.get(
+            "DEFAULT", "logging_formatter", fallback="standard"
+        )
+        return build_formatter(fmt, kind)
+
+    def _flush_handlers(self) -> None:
+        """Write buffered records so a forked child does not inherit them."""
+        for handler in self._handlers.values():
+            handler.flush()
+
+    def _reinit_logging_after_fork(self) -> None:
+        """Reopen handlers and restart queued logging in a forked child."""
+        import logging
+
+        from runtime_yolk.log_handlers import reopen_after_fork
+        from runtime_yolk.log_handlers import worker_path
+
+        pid = os.getpid()
+        for handler in self._handlers.values():
+            filepath = self._worker_files.get(handler)
+            reopen_after_fork(handler, worker_path(filepath, pid) if filepath else None)
+
+        # The listener thread is not copied to the child and the queue's lock may
+        # have been held at fork. Replace both with the same settings.
+        queue_handler = self._queue_handler
+        if queue_handler is not None and self._queue_listener is not None:
+            logging.getLogger().removeHandler(queue_handler)
+            self._queue_listener = None
+            self.set_queued_logging(queue_handler.queue.maxsize, queue_handler.overflow)
+
+
+def _bundle_matches(
+    bundle: dict[str, Any],
+    search_path: list[str],
+    env_filename: str,
+    env_stat: EnvStat,
+    config_name: str,
+) -> bool:
+    """True if bundle was built for the same files and its env file is unchanged."""
+    env_files = bundle["env_files"]
+    if (
+        bundle["search_path"] != search_path
+        or bundle["config_names"] != [config_name]
+        or list(env_files) != [env_filename]
+    ):
+        return False
+
+    recorded = env_files[env_filename]["stat"]
+    return tuple(tuple(stat) if stat else None for stat in recorded) == env_stat
+
+
+def _track_for_fork(yolk: Yolk) -> None:
+    """Reinitialize the logging of yolk in the child process after a fork."""
+    global _FORK_AWARE
+
+    if _FORK_AWARE is None:
+        import weakref
+
+        _FORK_AWARE = weakref.WeakSet()
+
+        # Not available on Windows, where there is no fork
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(
+                before=_before_fork, after_in_child=_after_fork_in_child
+            )
+
+    _FORK_AWARE.add(yolk)
+
+
+def _before_fork() -> None:
+    for yolk in list(_FORK_AWARE or ()):
+        yolk._flush_handlers()
+
+
+def _after_fork_in_child() -> None:
+    for yolk in list(_FORK_AWARE or ()):
+        yolk._reinit_logging_after_fork()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from runtime_yolk import bundle_cli
+from runtime_yolk.config_bundle import read_bundle
+
+
+@pytest.fixture(autouse=True)
+def patch_environ() -> Generator[None, None, None]:
+    with patch.dict(os.environ, {}):
+        yield None
+
+
+def test_parse_args_defaults() -> None:
+    args = bundle_cli._parse_args(["bundle.json"])
+
+    assert args.output == "bundle.json"
+    assert args.environment is None
+    assert args.config == "application"
+    assert args.file == ".env"
+    assert args.directory is None
+
+
+def test_main_writes_bundle_for_environment(tmp_path: Path) -> None:
+    (tmp_path / ".env").write_text("BUNDLE_HOST=example.com")
+    (tmp_path / "application.ini").write_text("[app]\nhost = {{BUNDLE_HOST}}\n")
+    (tmp_path / "application-prod.ini").write_text("[app]\nport = 443\n")
+    output = str(tmp_path / "bundle.json")
+
+    result = bundle_cli.main([output, "-e", "prod", "-d", str(tmp_path)])
+    bundle = read_bundle(output)
+
+    assert result == 0
+    assert bundle is not None
+    assert bundle["env_files"][".env"]["values"] == {"BUNDLE_HOST": "example.com"}
+    assert [layer["layer"] for layer in bundle["config"]["layers"]] == [
+        {"app": {"host": "example.com"}},
+        {"app": {"port": "443"}},
+    ]
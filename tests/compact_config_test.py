@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from configparser import ConfigParser
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+import pytest
+
+from runtime_yolk.compact_config import CompactConfig
+
+CONFIG = {
+    "DEFAULT": {"shared": "default", "number": "1"},
+    "app": {"Number": "42", "ratio": "0.5", "enabled": "yes"},
+    "worker": {"number": "3"},
+}
+
+
+@pytest.fixture
+def parser() -> ConfigParser:
+    config = ConfigParser(interpolation=None)
+    config.read_dict(CONFIG)
+    return config
+
+
+@pytest.fixture
+def compact() -> CompactConfig:
+    config = CompactConfig()
+    config.read_dict(CONFIG)
+    return config
+
+
+def test_reads_match_configparser(parser: ConfigParser, compact: CompactConfig) -> None:
+    assert compact.sections() == parser.sections()
+    assert compact.defaults() == dict(parser.defaults())
+    for section in ["DEFAULT", *parser.sections()]:
+        assert compact.items(section) == parser.items(section, raw=True)
+        assert compact.options(section) == [key for key, _ in parser.items(section)]
+        for option in ["shared", "NUMBER", "ratio", "missing"]:
+            assert compact.has_option(section, option) == parser.has_option(
+                section, option
+            )
+            assert compact.get(section, option, fallback=None) == parser.get(
+                section, option, fallback=None
+            )
+
+
+def test_typed_reads(compact: CompactConfig) -> None:
+    assert compact.getint("app", "number") == 42
+    assert compact.getint("worker", "missing", fallback=7) == 7
+    assert compact.getfloat("app", "ratio") == 0.5
+    assert compact.getboolean("app", "enabled") is True
+    assert compact.getboolean("app", "missing", fallback=None) is None
+
+
+def test_errors_match_configparser(compact: CompactConfig) -> None:
+    with pytest.raises(NoSectionError):
+        compact.get("missing", "option")
+    with pytest.raises(NoOptionError):
+        compact.get("app", "missing")
+    with pytest.raises(NoSectionError):
+        compact.items("missing")
+    assert "app" in compact
+    assert "DEFAULT" in compact
+    assert not compact.has_section("DEFAULT")
+
+
+def test_later_layers_override(compact: CompactConfig) -> None:
+    compact.read_dict({"app": {"NUMBER": "43"}, "DEFAULT": {"shared": "new"}})
+
+    assert compact.get("app", "number") == "43"
+    assert compact.get("worker", "shared") == "new"
+
+
+def test_names_are_pooled(compact: CompactConfig) -> None:
+    compact.read_dict({"other": {"NUMBER": "5"}})
+
+    app_key = next(key for key in compact._sections["app"] if key == "number")
+    other_key = next(key for key in compact._sections["other"] if key == "number")
+
+    assert app_key is other_key
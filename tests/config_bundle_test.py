@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from runtime_yolk.config_bundle import BUNDLE_VERSION
+from runtime_yolk.config_bundle import read_bundle
+from runtime_yolk.config_bundle import write_bundle
+
+
+def test_write_and_read_bundle(tmp_path: Path) -> None:
+    path = str(tmp_path / "bundle.json")
+
+    write_bundle(path, {"config": {"layers": []}})
+
+    assert read_bundle(path) == {"version": BUNDLE_VERSION, "config": {"layers": []}}
+    assert [item.name for item in tmp_path.iterdir()] == ["bundle.json"]
+
+
+def test_read_bundle_ignores_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "bundle.json"
+
+    assert read_bundle(str(path)) is None
+
+    path.write_text("not json")
+    assert read_bundle(str(path)) is None
+
+    path.write_text(json.dumps({"version": BUNDLE_VERSION + 1}))
+    assert read_bundle(str(path)) is None
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from runtime_yolk import ConfigLoader
+from runtime_yolk.config_cache import ConfigCache
+
+CONFIG = "[DEFAULT]\nlogging_level = {{LEVEL}}\n\n[section]\nkey = value\n"
+
+
+@pytest.fixture
+def workdir(tmp_path: Path) -> Generator[Path, None, None]:
+    (tmp_path / "application.ini").write_text(CONFIG)
+    with patch.dict(os.environ, {"LEVEL": "INFO", "YOLK_ENVIRONMENT": ""}):
+        yield tmp_path
+
+
+def _loader(workdir: Path) -> ConfigLoader:
+    return ConfigLoader(working_directory=workdir, cache_file=workdir / "cache.bin")
+
+
+def test_cache_file_created_on_load(workdir: Path) -> None:
+    loader = _loader(workdir)
+
+    loader.load()
+
+    assert (workdir / "cache.bin").is_file()
+    assert loader.config.get("section", "key") == "value"
+    assert loader.config.get("DEFAULT", "logging_level") == "INFO"
+
+
+def test_cache_hit_skips_parsing(workdir: Path) -> None:
+    _loader(workdir).load()
+    loader = _loader(workdir)
+
+    with patch.object(loader, "_parse_layer") as parse:
+        loader.load()
+
+    parse.assert_not_called()
+    assert loader.config.get("section", "key") == "value"
+    assert loader.config.get("DEFAULT", "logging_level") == "INFO"
+
+
+def test_cache_hit_reports_unresolved_keys(workdir: Path) -> None:
+    (workdir / "application.ini").write_text(CONFIG + "other = {{CACHE_MISSING}}\n")
+    first = _loader(workdir)
+    first.load()
+    loader = _loader(workdir)
+
+    with patch.object(loader, "_parse_layer") as parse:
+        loader.load()
+
+    parse.assert_not_called()
+    assert first.unresolved_keys == {"CACHE_MISSING"}
+    assert loader.unresolved_keys == {"CACHE_MISSING"}
+
+
+def test_cache_miss_on_referenced_environ_change(workdir: Path) -> None:
+    _loader(workdir).load()
+    loader = _loader(workdir)
+
+    with patch.dict(os.environ, {"LEVEL": "DEBUG"}):
+        loader.load()
+
+    assert loader.config.get("DEFAULT", "logging_level") == "DEBUG"
+
+
+def test_cache_miss_on_file_change(workdir: Path) -> None:
+    _loader(workdir).load()
+    (workdir / "application.ini").write_text(CONFIG.replace("value", "changed"))
+    loader = _loader(workdir)
+
+    loader.load()
+
+    assert loader.config.get("section", "key") == "changed"
+
+
+def test_cache_ignores_invalid_file(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.bin"
+    cache_file.write_bytes(b"not a cache")
+
+    cache = ConfigCache(cache_file)
+
+    assert cache.get(cache_file, b"", {}) is None
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import Generator
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from runtime_yolk import ConfigLoader
+from runtime_yolk.util import mapped_file
 
 FIXTURE_PATH = Path("tests/fixtures/default_and_env_config")
 
@@ -40,6 +44,222 @@ def test_load_default_and_env_config(config_prod: ConfigLoader) -> None:
     assert config_prod.config.get("DEFAULT", "environment") == "prod"
 
 
+def test_search_path_layers_each_file_name(tmp_path: Path) -> None:
+    system, local = tmp_path / "etc", tmp_path / "cwd"
+    system.mkdir()
+    local.mkdir()
+    (system / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = prod\nsource = system\nkept = yes\n"
+    )
+    (local / "application.ini").write_text("[DEFAULT]\nsource = local\n")
+    (system / "application-prod.ini").write_text("[app]\nsource = system-prod\n")
+    loader = ConfigLoader(search_path=[system, local])
+
+    loader.load()
+
+    assert [layer.path for layer in loader._layers] == [
+        system / "application.ini",
+        local / "application.ini",
+        system / "application-prod.ini",
+    ]
+    assert loader.config.get("DEFAULT", "source") == "local"
+    assert loader.config.get("DEFAULT", "kept") == "yes"
+    assert loader.config.get("app", "source") == "system-prod"
+
+    loader = ConfigLoader(search_path=[system, local])
+    asyncio.run(loader.aload())
+
+    assert loader.config.get("app", "source") == "system-prod"
+
+
+def test_compact_load_matches_load(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = dev\n[app]\nkey = base\nother = 1\n"
+    )
+    (tmp_path / "application-dev.ini").write_text("[app]\nkey = dev\n")
+    expected = ConfigLoader(working_directory=tmp_path)
+    expected.load()
+    config = ConfigLoader(working_directory=tmp_path, compact=True)
+    config.load()
+
+    assert type(config.store).__name__ == "CompactConfig"
+    with pytest.raises(TypeError):
+        config.config
+    assert config.store.items("app") == expected.config.items("app", raw=True)
+
+    _bump(tmp_path / "application-dev.ini", "[app]\nkey = changed\n")
+
+    assert config.reload() == {("app", "key")}
+    assert config.store.get("app", "key") == "changed"
+
+
+def test_lazy_load_resolves_on_read(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = {{LAZY_ENV}}\n[app]\nkey = {{LAZY_KEY}}\n"
+    )
+    (tmp_path / "application-dev.ini").write_text("[app]\nother = {{LAZY_MISSING}}\n")
+
+    for compact in (False, True):
+        config = ConfigLoader(working_directory=tmp_path, compact=compact, lazy=True)
+        with patch.dict(os.environ, {"LAZY_ENV": "dev", "LAZY_KEY": "value"}):
+            config.load()
+
+            assert config._layers[0].layer["app"] == {"key": "{{LAZY_KEY}}"}
+            assert config.unresolved_keys == set()
+            assert config.store.get("app", "key") == "value"
+            assert config.store.get("app", "key", raw=True) == "{{LAZY_KEY}}"
+            assert dict(config.store.items("app"))["other"] == ""
+            assert config.unresolved_keys == {"LAZY_MISSING"}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_mapped_files_match_read_files(tmp_path: Path, lazy: bool) -> None:
+    (tmp_path / "application.ini").write_text(
+        "# comment\n[DEFAULT]\nenvironment = dev\n\n"
+        "[app]\nkey = {{MAPPED_KEY}}-{{MAPPED_MISSING}}\n"
+        "multi = first\n  second\n"
+    )
+    (tmp_path / "application-dev.ini").write_text("[app]\nother = {{MAPPED_KEY}}\n")
+    expected = ConfigLoader(working_directory=tmp_path, lazy=lazy)
+    config = ConfigLoader(working_directory=tmp_path, lazy=lazy)
+
+    with patch.dict(os.environ, {"MAPPED_KEY": "value"}):
+        expected.load()
+        with patch("runtime_yolk.util.mapped_file.MMAP_THRESHOLD", 1):
+            config.load()
+            aloaded = ConfigLoader(working_directory=tmp_path, lazy=lazy)
+            asyncio.run(aloaded.aload())
+
+        for loaded in (config, aloaded):
+            assert [layer.layer for layer in loaded._layers] == [
+                layer.layer for layer in expected._layers
+            ]
+            assert loaded.config.items("app") == expected.config.items("app")
+            assert loaded.unresolved_keys == expected.unresolved_keys
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_mapped_files_translate_line_endings(tmp_path: Path, lazy: bool) -> None:
+    (tmp_path / "application.ini").write_bytes(
+        b"[app]\r\nkey = {{MAPPED_KEY}}\rother = 1\r\nmulti = first\r  second\n"
+    )
+    expected = ConfigLoader(working_directory=tmp_path, lazy=lazy)
+    config = ConfigLoader(working_directory=tmp_path, lazy=lazy)
+
+    with patch.dict(os.environ, {"MAPPED_KEY": "value"}):
+        expected.load()
+        with patch("runtime_yolk.util.mapped_file.MMAP_THRESHOLD", 1):
+            config.load()
+
+        assert config._layers[0].layer == expected._layers[0].layer
+        assert config.config.items("app") == expected.config.items("app")
+    assert expected.config.get("app", "other") == "1"
+
+
+def test_aload_closes_every_mapped_file(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text("[DEFAULT]\nenvironment = dev\n")
+    (tmp_path / "application-dev.ini").write_text("[app]\nkey = dev\n")
+    read_contents = mapped_file.read_contents
+    mapped: list[Any] = []
+
+    def recording(filepath: Path) -> Any:
+        contents = read_contents(filepath)
+        mapped.append(contents)
+        return contents
+
+    config = ConfigLoader(working_directory=tmp_path)
+    with patch("runtime_yolk.util.mapped_file.MMAP_THRESHOLD", 1), patch(
+        "runtime_yolk.util.mapped_file.read_contents", recording
+    ):
+        asyncio.run(config.aload())
+
+    # application-dev.ini is read again once it names its own environment
+    assert len(mapped) == 3
+    assert all(contents.closed for contents in mapped)
+
+
+def test_interpolates_against_environ_snapshot(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[app]\nfirst = {{SNAPSHOT_KEY}}\nsecond = {{SNAPSHOT_OTHER}}\n"
+    )
+    iter_lines = mapped_file.iter_lines
+
+    def changing_environ(buffer: Any) -> Iterator[bytes]:
+        for line in iter_lines(buffer):
+            yield line
+            # Written while the file is parsed line by line
+            os.environ["SNAPSHOT_OTHER"] = "changed"
+
+    config = ConfigLoader(working_directory=tmp_path)
+    with patch.dict(os.environ, {"SNAPSHOT_KEY": "one", "SNAPSHOT_OTHER": "two"}):
+        with patch("runtime_yolk.util.mapped_file.MMAP_THRESHOLD", 1), patch(
+            "runtime_yolk.util.mapped_file.iter_lines", changing_environ
+        ):
+            config.load()
+
+    assert config.config.get("app", "second") == "two"
+
+
+def test_shared_loaders_parse_identical_files_once(tmp_path: Path) -> None:
+    base = "[DEFAULT]\nenvironment = {{SHARED_ENV}}\n[app]\nkey = base\n"
+    loaders = []
+    for tenant in ("one", "two"):
+        directory = tmp_path / tenant
+        directory.mkdir()
+        (directory / "application.ini").write_text(base)
+        (directory / f"application-{tenant}.ini").write_text(f"[app]\nkey = {tenant}\n")
+        loaders.append(ConfigLoader(working_directory=directory, shared=True))
+
+    with patch.dict(os.environ, {"SHARED_ENV": "one"}):
+        loaders[0].load()
+    with patch.dict(os.environ, {"SHARED_ENV": "two"}):
+        with patch.object(
+            loaders[1], "_parse_layer", wraps=loaders[1]._parse_layer
+        ) as parse_layer:
+            loaders[1].load()
+        shared_again = ConfigLoader(working_directory=tmp_path / "two", shared=True)
+        shared_again.load()
+
+    one, two = loaders
+    assert parse_layer.call_count == 2
+    assert one._layers[0].layer is not two._layers[0].layer
+    assert two._layers[0].layer is shared_again._layers[0].layer
+    assert two._layers[1].layer is shared_again._layers[1].layer
+    assert one.store.get("app", "key") == "one"
+    assert two.store.get("app", "key") == "two"
+    assert one.store._layers[1] is one._layers[0].layer  # type: ignore[union-attr]
+
+
+def test_shared_loaders_report_unresolved_keys_of_pooled_layers(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "application.ini").write_text("[app]\nkey = {{SHARED_MISSING}}\n")
+    first = ConfigLoader(working_directory=tmp_path, shared=True)
+    second = ConfigLoader(working_directory=tmp_path, shared=True)
+
+    first.load()
+    with patch.object(second, "_parse_layer") as parse_layer:
+        second.load()
+
+    parse_layer.assert_not_called()
+    assert first.unresolved_keys == {"SHARED_MISSING"}
+    assert second.unresolved_keys == {"SHARED_MISSING"}
+
+
+def test_aload_matches_load(config_prod: ConfigLoader) -> None:
+    expected = ConfigLoader(working_directory=FIXTURE_PATH)
+    expected.load()
+
+    asyncio.run(config_prod.aload())
+
+    assert [layer.path for layer in config_prod._layers] == [
+        layer.path for layer in expected._layers
+    ]
+    assert {name: dict(section) for name, section in config_prod.config.items()} == {
+        name: dict(section) for name, section in expected.config.items()
+    }
+
+
 @pytest.mark.parametrize(
     ("in_str", "out_str"),
     (
@@ -67,3 +287,184 @@ def test_interpolate_environment(in_str: str, out_str: str) -> None:
         result = config._interpolate_environment(in_str)
 
     assert result == out_str
+
+
+@pytest.mark.parametrize(
+    ("in_str", "out_str"),
+    (
+        ("{{KEY.WITH(META)+}}", "meta"),
+        ("{{BACKSLASH}}", r"C:\new\table"),
+        ("{{ENVIRONMENT}}{{ENVIRONMENT}}", "productionproduction"),
+    ),
+)
+def test_interpolate_environment_treats_keys_literally(
+    in_str: str,
+    out_str: str,
+) -> None:
+    config = ConfigLoader()
+    test_env = {
+        "ENVIRONMENT": "production",
+        "KEY.WITH(META)+": "meta",
+        "BACKSLASH": r"C:\new\table",
+    }
+
+    with patch.dict(os.environ, test_env):
+        result = config._interpolate_environment(in_str)
+
+    assert result == out_str
+
+
+def test_interpolate_environment_records_unresolved_keys() -> None:
+    config = ConfigLoader()
+
+    with patch.dict(os.environ, {"FOUND": "yes"}):
+        config._interpolate_environment("{{FOUND}} {{MISSING}} {{ALSO_MISSING}}")
+
+    assert config.unresolved_keys == {"MISSING", "ALSO_MISSING"}
+
+
+@pytest.mark.parametrize("store", ["configparser", "compact", "shared", "lazy"])
+def test_load_resolves_config_references(tmp_path: Path, store: str) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = dev\nroot = {{db:host}}\n"
+        "[db]\nhost = {{REF_HOST}}\nurl = pg://{{db:host}}/{{app:name}}\n"
+        "[app]\nname = yolk\ndsn = {{db:url}}\nmissing = {{db:nope}}\n"
+    )
+    (tmp_path / "application-dev.ini").write_text("[app]\nname = dev\n")
+    config = ConfigLoader(
+        working_directory=tmp_path,
+        compact=store == "compact",
+        shared=store == "shared",
+        lazy=store == "lazy",
+    )
+
+    with patch.dict(os.environ, {"REF_HOST": "db.local"}):
+        config.load()
+
+        assert config.store.get("app", "dsn") == "pg://db.local/dev"
+        assert config.store.get("app", "root") == "db.local"
+        assert config.store.get("app", "missing") == ""
+    assert config.unresolved_keys == {"db:nope"}
+
+
+def test_reload_reports_changed_references(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[db]\nhost = one\n[app]\nurl = {{db:host}}/x\nother = 1\n"
+    )
+    (tmp_path / "application-dev.ini").write_text("")
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+
+    _bump(
+        tmp_path / "application.ini",
+        "[db]\nhost = two\n[app]\nurl = {{db:host}}/x\nother = 1\n",
+    )
+
+    assert config.reload() == {("db", "host"), ("app", "url")}
+    assert config.config.get("app", "url") == "two/x"
+
+
+def test_config_reference_cycle_raises(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text("[a]\nx = {{b:y}}\n[b]\ny = {{a:x}}\n")
+    config = ConfigLoader(working_directory=tmp_path)
+
+    with pytest.raises(ValueError, match="cycle"):
+        config.load()
+
+
+def _bump(path: Path, contents: str) -> None:
+    """Rewrite file and move mtime forward so a stat change is always seen."""
+    stat = path.stat()
+    path.write_text(contents)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_without_changes(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text("[app]\nkey = value\n")
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+
+    with patch.object(config, "_read_layer") as read_layer:
+        assert config.reload() == set()
+
+    read_layer.assert_not_called()
+
+
+def test_reload_only_changed_layer(tmp_path: Path) -> None:
+    base = tmp_path / "application.ini"
+    base.write_text("[DEFAULT]\nenvironment = dev\n[app]\nkey = base\nother = 1\n")
+    (tmp_path / "application-dev.ini").write_text("[app]\nkey = dev\n")
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+    original = config.config
+
+    _bump(base, "[DEFAULT]\nenvironment = dev\n[app]\nkey = base\nother = 2\n")
+    with patch.object(config, "_read_layer", wraps=config._read_layer) as read_layer:
+        changed = config.reload()
+
+    assert changed == {("app", "other")}
+    assert read_layer.call_count == 1
+    assert config.config is not original
+    assert config.config.get("app", "key") == "dev"
+    assert config.config.get("app", "other") == "2"
+
+
+def test_reload_on_referenced_environ_change(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text("[app]\nkey = {{RELOAD_KEY}}\n")
+    config = ConfigLoader(working_directory=tmp_path)
+
+    with patch.dict(os.environ, {"RELOAD_KEY": "one"}):
+        config.load()
+        os.environ["RELOAD_KEY"] = "two"
+        changed = config.reload()
+
+    assert changed == {("app", "key")}
+    assert config.config.get("app", "key") == "two"
+
+
+def test_reload_follows_changed_environment(tmp_path: Path) -> None:
+    base = tmp_path / "application.ini"
+    base.write_text("[DEFAULT]\nenvironment = dev\n[app]\nkey = base\n")
+    (tmp_path / "application-dev.ini").write_text("[app]\nkey = dev\nonly_dev = 1\n")
+    (tmp_path / "application-prod.ini").write_text("[app]\nkey = prod\n")
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+
+    _bump(base, "[DEFAULT]\nenvironment = prod\n[app]\nkey = base\n")
+    changed = config.reload()
+
+    assert changed == {("DEFAULT", "environment"), ("app", "key"), ("app", "only_dev")}
+    assert config.config.get("app", "key") == "prod"
+    assert not config.config.has_option("app", "only_dev")
+    assert [loaded.path.name for loaded in config._layers] == [
+        "application.ini",
+        "application-prod.ini",
+    ]
+
+
+def test_reload_picks_up_created_files(tmp_path: Path) -> None:
+    (tmp_path / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = dev\n[app]\nkey = base\n"
+    )
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+
+    assert config.reload() == set()
+
+    (tmp_path / "application-dev.ini").write_text("[app]\nkey = dev\n")
+
+    assert config.reload() == {("app", "key")}
+    assert config.config.get("app", "key") == "dev"
+
+
+def test_reload_removed_file(tmp_path: Path) -> None:
+    path = tmp_path / "application.ini"
+    path.write_text("[app]\nkey = value\n")
+    config = ConfigLoader(working_directory=tmp_path)
+    config.load()
+
+    path.unlink()
+    changed = config.reload()
+
+    assert changed == {("app", "key")}
+    assert not config.config.has_section("app")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from configparser import ConfigParser
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+import pytest
+
+from runtime_yolk.config_snapshot import ConfigSnapshot
+
+CONFIG = """
+[DEFAULT]
+shared = default
+number = 1
+
+[app]
+Number = 42
+ratio = 0.5
+enabled = yes
+broken = maybe
+"""
+
+
+@pytest.fixture
+def snapshot() -> ConfigSnapshot:
+    config = ConfigParser(interpolation=None)
+    config.read_string(CONFIG)
+    return ConfigSnapshot(config)
+
+
+def test_defaults_resolved(snapshot: ConfigSnapshot) -> None:
+    assert snapshot.get("app", "shared") == "default"
+    assert snapshot.get("DEFAULT", "number") == "1"
+    assert snapshot.has_option("app", "shared")
+    assert snapshot.sections() == ["app"]
+    assert not snapshot.has_section("DEFAULT")
+
+
+def test_typed_reads(snapshot: ConfigSnapshot) -> None:
+    assert snapshot.getint("app", "NUMBER") == 42
+    assert snapshot.getfloat("app", "ratio") == 0.5
+    assert snapshot.getboolean("app", "enabled") is True
+
+
+def test_typed_reads_are_memoized(snapshot: ConfigSnapshot) -> None:
+    first = snapshot.getint("app", "number")
+
+    assert snapshot._typed[("app", "number", int)] == first
+
+
+def test_fallbacks(snapshot: ConfigSnapshot) -> None:
+    assert snapshot.get("app", "missing", fallback="x") == "x"
+    assert snapshot.get("missing", "missing", fallback=None) is None
+    assert snapshot.getint("app", "missing", fallback=7) == 7
+
+
+def test_errors_match_configparser(snapshot: ConfigSnapshot) -> None:
+    with pytest.raises(NoSectionError):
+        snapshot.get("missing", "option")
+    with pytest.raises(NoOptionError):
+        snapshot.getint("app", "missing")
+    with pytest.raises(ValueError):
+        snapshot.getboolean("app", "broken")
+
+
+def test_items_are_read_only(snapshot: ConfigSnapshot) -> None:
+    with pytest.raises(TypeError):
+        snapshot.items("app")["new"] = "value"  # type: ignore[index]
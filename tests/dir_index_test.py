@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from runtime_yolk.util.dir_index import DirectoryIndex
+
+
+def test_find_in_search_path_order(tmp_path: Path) -> None:
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "app.ini").write_text("")
+    (second / "app.ini").write_text("")
+    (second / "app-prod.ini").mkdir()
+
+    index = DirectoryIndex([second, tmp_path / "missing", first])
+
+    assert index.find("app.ini") == [second / "app.ini", first / "app.ini"]
+    assert index.find("app-prod.ini") == []
+
+
+def test_listing_is_cached_until_cleared(tmp_path: Path) -> None:
+    index = DirectoryIndex([tmp_path])
+    assert index.find("app.ini") == []
+
+    (tmp_path / "app.ini").write_text("")
+    assert index.find("app.ini") == []
+
+    index.clear()
+    assert index.find("app.ini") == [tmp_path / "app.ini"]
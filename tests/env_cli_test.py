@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import pytest
@@ -131,3 +132,88 @@ def test_delete_key(temp_env: str) -> None:
 def test_delete_key_raises_when_not_exists() -> None:
     with pytest.raises(KeyError):
         env_cli._delete_key("NEWKEY", EXPECTED_CONTENTS)
+
+
+def test_parse_args_requires_key_without_batch() -> None:
+    with pytest.raises(SystemExit):
+        env_cli._parse_args([])
+
+
+def test_parse_batch() -> None:
+    lines = ["# comment", "", "set key  some value ", "UNSET other"]
+
+    result = env_cli._parse_batch(lines)
+
+    assert result == [("set", "KEY", "some value"), ("unset", "OTHER", "")]
+
+
+@pytest.mark.parametrize("line", ("rename KEY VALUE", "set"))
+def test_parse_batch_raises_on_invalid(line: str) -> None:
+    with pytest.raises(ValueError):
+        env_cli._parse_batch([line])
+
+
+def test_apply_batch() -> None:
+    operations = [
+        ("set", "TEST1", "one"),
+        ("update", "TEST2", "two"),
+        ("add", "TEST3", "three"),
+        ("set", "TEST4", "four"),
+        ("delete", "TEST3", ""),
+        ("unset", "MISSING", ""),
+    ]
+    expected = (
+        EXPECTED_CONTENTS.replace("value_one", "one").replace("value_two", "two")
+        + "\nTEST4=four"
+    )
+
+    assert env_cli._apply_batch(operations, EXPECTED_CONTENTS) == expected
+
+
+def test_apply_batch_does_not_match_substrings() -> None:
+    contents = "MY_KEY=mine\nKEY=value"
+
+    result = env_cli._apply_batch([("delete", "KEY", "")], contents)
+
+    assert result == "MY_KEY=mine"
+
+
+@pytest.mark.parametrize(
+    "operation",
+    (("add", "TEST1", "x"), ("update", "NEWKEY", "x"), ("delete", "NEWKEY", "")),
+)
+def test_apply_batch_raises(operation: tuple[str, str, str]) -> None:
+    with pytest.raises(KeyError):
+        env_cli._apply_batch([operation], EXPECTED_CONTENTS)
+
+
+def test_batch_from_file(temp_env: str, tmp_path: Path) -> None:
+    batch_file = tmp_path / "batch.txt"
+    batch_file.write_text("set TEST2 updated\nset NEW value\n")
+
+    result = env_cli.main(["--batch", str(batch_file), "-F", temp_env])
+
+    assert result == 0
+    assert Path(temp_env).read_text() == (
+        EXPECTED_CONTENTS.replace("value_two", "updated") + "\nNEW=value"
+    )
+
+
+def test_batch_failure_writes_nothing(
+    temp_env: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("set NEW value\ndelete MISSING\n"))
+
+    result = env_cli.main(["--batch", "-", "-F", temp_env])
+
+    assert result == 1
+    assert Path(temp_env).read_text() == EXPECTED_CONTENTS
+
+
+def test_update_key_does_not_match_substrings() -> None:
+    contents = "MY_KEY=mine\nKEY=value"
+
+    result = env_cli._update_key("key", "new", contents)
+
+    assert result == "MY_KEY=mine\nKEY=new"
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from runtime_yolk.env_document import EnvDocument
+from runtime_yolk.env_document import split_line
+
+CONTENTS = "\n".join(
+    [
+        "# comment",
+        "export KEY=one",
+        "",
+        "MY_KEY = 'two'",
+        "  OTHER=three",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    (
+        ("KEY=value", ("", "KEY", "value")),
+        ("  export\tKEY = value", ("  export\t", "KEY", " value")),
+        ("exportKEY=value", ("", "exportKEY", "value")),
+        ("# KEY=value", None),
+        ("no delimiter", None),
+        ("", None),
+    ),
+)
+def test_split_line(line: str, expected: tuple[str, str, str] | None) -> None:
+    assert split_line(line) == expected
+
+
+def test_get_and_contains() -> None:
+    document = EnvDocument(CONTENTS)
+
+    assert "KEY" in document
+    assert "MY" not in document
+    assert document.get("MY_KEY") == "two"
+    assert document.get("MISSING") is None
+    assert len(document) == 3
+
+
+def test_items_in_file_order() -> None:
+    document = EnvDocument(CONTENTS)
+
+    assert list(document.items()) == [
+        ("KEY", "one"),
+        ("MY_KEY", "two"),
+        ("OTHER", "three"),
+    ]
+
+
+def test_edits_only_touch_changed_lines() -> None:
+    document = EnvDocument(CONTENTS)
+
+    document.update("KEY", "changed")
+    document.delete("MY_KEY")
+    document.add("NEW", "value")
+
+    assert document.render() == "\n".join(
+        ["# comment", "export KEY=changed", "", "  OTHER=three", "NEW=value"]
+    )
+
+
+def test_set_after_delete_appends() -> None:
+    document = EnvDocument(CONTENTS)
+
+    document.discard("KEY")
+    document.upsert("KEY", "back")
+
+    assert document.render().endswith("\nKEY=back")
+    assert document.get("KEY") == "back"
+
+
+@pytest.mark.parametrize(
+    ("method", "args"),
+    (
+        ("add", ("KEY", "x")),
+        ("update", ("MISSING", "x")),
+        ("delete", ("MISSING",)),
+    ),
+)
+def test_invalid_edits_raise(method: str, args: tuple[str, ...]) -> None:
+    document = EnvDocument(CONTENTS)
+
+    with pytest.raises(KeyError):
+        getattr(document, method)(*args)
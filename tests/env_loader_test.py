@@ -86,6 +86,8 @@ def test_load_missing_file(loader: env_loader.EnvLoader) -> None:
         ("\"'test'\"", "'test'"),
         ('"test"\'', '"test"\''),
         ('\'"test"', '\'"test"'),
+        ('""', '""'),
+        ("'", "'"),
     ),
 )
 def test_remove_lt_quotes(
@@ -105,3 +107,120 @@ def test_remove_lt_quotes(
 )
 def test_strip_export(loader: env_loader.EnvLoader, given: str, expected: str) -> None:
     assert loader._strip_export(given) == expected
+
+
+def test_iter_values_streams_file(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    results = list(loader.iter_values(mock_env_file))
+
+    assert dict(results) == ENV_FILE_EXPECTED
+    assert "SECRETBOX_TEST_PROJECT_ENVIRONMENT" not in os.environ
+
+
+def test_iter_values_missing_file(loader: env_loader.EnvLoader) -> None:
+    assert list(loader.iter_values("BYWHATCHANGEWOULDTHISSEXIST")) == []
+
+
+def test_iter_values_allows_filtering(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    results = {k: v for k, v in loader.iter_values(mock_env_file) if "SECRET" in k}
+
+    assert results == {
+        "SECRETBOX_TEST_PROJECT_ENVIRONMENT": "sandbox",
+        "SUPER_SECRET": "12345",
+    }
+
+
+def test_parse_env_file_matches_streaming(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    contents = "\n".join(ENV_FILE_CONTENTS)
+
+    assert loader._parse_env_file(contents) == dict(loader.iter_values(mock_env_file))
+
+
+def test_apply_reports_diff(loader: env_loader.EnvLoader) -> None:
+    class RecordingEnviron(dict):  # type: ignore[type-arg]
+        def __setitem__(self, key: str, value: str) -> None:
+            writes.append(key)
+            super().__setitem__(key, value)
+
+    writes: list[str] = []
+    environ = RecordingEnviron(SUPER_SECRET="12345", PASSWORD="hunter2")
+    values = {"SUPER_SECRET": "12345", "PASSWORD": "correct", "VALID": "="}
+
+    with patch.object(os, "environ", environ), patch.object(
+        loader, "read", return_value=values
+    ):
+        diff = loader.apply()
+
+    assert diff.added == {"VALID": "="}
+    assert diff.changed == {"PASSWORD": "correct"}
+    assert diff.unchanged == {"SUPER_SECRET": "12345"}
+    assert bool(diff) is True
+    assert sorted(writes) == ["PASSWORD", "VALID"]
+
+
+def test_apply_dry_run_does_not_mutate(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    diff = loader.apply(mock_env_file, dry_run=True)
+
+    assert diff.added == ENV_FILE_EXPECTED
+    assert "SUPER_SECRET" not in os.environ
+
+
+def test_apply_unchanged_is_falsy(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    loader.apply(mock_env_file)
+
+    diff = loader.apply(mock_env_file)
+
+    assert not diff
+    assert diff.values == ENV_FILE_EXPECTED
+
+
+def test_apply_increments_generation(loader: env_loader.EnvLoader) -> None:
+    generation = env_loader.EnvLoader.generation
+
+    loader.apply_values({"GENERATION_KEY": "value"}, dry_run=True)
+    assert env_loader.EnvLoader.generation == generation
+
+    loader.apply_values({"GENERATION_KEY": "value"})
+    loader.apply_values({"GENERATION_KEY": "value"})
+    assert env_loader.EnvLoader.generation == generation + 1
+
+
+def test_mapped_file_matches_streaming(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    with patch.object(env_loader.mapped_file, "MMAP_THRESHOLD", 1):
+        assert loader.read(mock_env_file) == ENV_FILE_EXPECTED
+
+
+def test_read_does_not_mutate(
+    mock_env_file: str,
+    loader: env_loader.EnvLoader,
+) -> None:
+    assert loader.read(mock_env_file) == ENV_FILE_EXPECTED
+    assert "SUPER_SECRET" not in os.environ
+
+
+def test_search_path_later_directories_override(tmp_path: Path) -> None:
+    system, local = tmp_path / "etc", tmp_path / "cwd"
+    system.mkdir()
+    local.mkdir()
+    (system / ".env").write_text("SHARED=system\nSYSTEM_ONLY=1")
+    (local / ".env").write_text("SHARED=local")
+    loader = env_loader.EnvLoader(search_path=[system, tmp_path / "missing", local])
+
+    assert loader.read() == {"SHARED": "local", "SYSTEM_ONLY": "1"}
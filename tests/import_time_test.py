@@ -0,0 +1,81 @@
+"""Guard the import cost of runtime_yolk, measured in a fresh interpreter."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative microseconds allowed for `from runtime_yolk import Yolk`, generous
+# for slow CI
+IMPORT_BUDGET_US = 150_000
+
+DEFERRED_MODULES = (
+    "argparse",
+    "configparser",
+    "dataclasses",
+    "hashlib",
+    "logging",
+    "tempfile",
+    "typing",
+)
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_time(stderr: str, package: str) -> int:
+    # Submodules imported on their own count too, e.g. `runtime_yolk.yolk` imported
+    # lazily after `runtime_yolk`
+    total = 0
+    for line in stderr.splitlines():
+        _, _, timings = line.partition("import time:")
+        try:
+            _, cumulative, name = timings.split("|")
+        except ValueError:
+            continue
+        # Nested imports are indented, their time is already in the parent's
+        name = name[1:]
+        if name == package or name.startswith(f"{package}."):
+            total += int(cumulative)
+    if not total:
+        raise AssertionError(f"{package} not found in importtime output")
+    return total
+
+
+def test_import_time_within_budget() -> None:
+    result = _run("from runtime_yolk import Yolk", "-X", "importtime")
+
+    cumulative = _cumulative_import_time(result.stderr, "runtime_yolk")
+
+    assert cumulative < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize(
+    "code",
+    (
+        "import runtime_yolk",
+        "from runtime_yolk import Yolk",
+        "from runtime_yolk import ConfigLoader, EnvLoader",
+    ),
+)
+def test_heavy_modules_deferred(code: str) -> None:
+    check = f"{code}; import sys; print(' '.join(sorted(sys.modules)))"
+
+    loaded = set(_run(check).stdout.split())
+
+    assert not loaded.intersection(DEFERRED_MODULES)
+
+
+def test_lazy_attribute_error() -> None:
+    import runtime_yolk
+
+    with pytest.raises(AttributeError):
+        runtime_yolk.NotAThing
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any
+
+from runtime_yolk.util.interpolate import Interpolator
+
+
+def test_interpolate_resolves_each_key_once() -> None:
+    lookups: list[str] = []
+
+    class CountingDict(dict):  # type: ignore[type-arg]
+        def get(self, key: Any, default: Any = None) -> Any:
+            lookups.append(key)
+            return super().get(key, default)
+
+    interpolator = Interpolator(CountingDict({"A": "1"}))
+
+    result = interpolator.interpolate("{{A}}{{A}}{{B}}{{B}}")
+
+    assert result == "11"
+    assert lookups == ["A", "B"]
+
+
+def test_interpolate_referenced_keys() -> None:
+    interpolator = Interpolator({"A": "1"})
+
+    interpolator.interpolate("{{A}} {{B}}")
+
+    assert interpolator.referenced == {"A": "1", "B": None}
+    assert interpolator.unresolved == {"B"}
+
+
+def test_interpolate_keeps_config_references() -> None:
+    interpolator = Interpolator({"A": "1", "app:key": "env"})
+
+    result = interpolator.interpolate("{{A}} {{app:key}}")
+
+    assert result == "1 {{app:key}}"
+    assert interpolator.referenced == {"A": "1"}
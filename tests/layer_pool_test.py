@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import gc
+
+from runtime_yolk import layer_pool
+
+
+def test_get_checks_referenced_environ() -> None:
+    key = layer_pool.pool_key(b"[app]\nkey = {{POOL_KEY}}\n", False)
+    layer = layer_pool.put(key, {"app": {"key": "one"}}, {"POOL_KEY": "one"})
+
+    assert layer_pool.get(key, {"POOL_KEY": "one"}) == (layer, {"POOL_KEY": "one"})
+    assert layer_pool.get(key, {"POOL_KEY": "two"}) is None
+    assert layer_pool.get(layer_pool.pool_key(b"other", False), {}) is None
+
+
+def test_lazy_layers_are_pooled_apart() -> None:
+    contents = b"[app]\nkey = {{POOL_KEY}}\n"
+    layer = layer_pool.put(layer_pool.pool_key(contents, True), {"app": {}}, {})
+
+    assert layer_pool.get(layer_pool.pool_key(contents, True), {}) is not None
+    assert layer_pool.get(layer_pool.pool_key(contents, False), {}) is None
+    del layer
+
+
+def test_unused_layers_are_dropped() -> None:
+    key = layer_pool.pool_key(b"[dropped]\n", False)
+    layer = layer_pool.put(key, {"dropped": {}}, {})
+
+    assert layer_pool.get(key, {}) is not None
+
+    del layer
+    gc.collect()
+
+    assert layer_pool.get(key, {}) is None
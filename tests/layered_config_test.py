@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from configparser import ConfigParser
+from configparser import NoOptionError
+from configparser import NoSectionError
+
+import pytest
+
+from runtime_yolk.layered_config import LayeredConfig
+
+BASE = {
+    "DEFAULT": {"shared": "default", "number": "1"},
+    "app": {"number": "42", "ratio": "0.5", "enabled": "yes"},
+    "worker": {"number": "3"},
+}
+TENANT = {"DEFAULT": {"shared": "tenant"}, "app": {"Ratio": "0.25"}, "extra": {}}
+
+
+@pytest.fixture
+def parser() -> ConfigParser:
+    config = ConfigParser(interpolation=None)
+    config.read_dict(BASE)
+    config.read_dict(TENANT)
+    return config
+
+
+@pytest.fixture
+def layered() -> LayeredConfig:
+    config = LayeredConfig()
+    config.add_layer(BASE)
+    config.read_dict(TENANT)
+    return config
+
+
+def test_reads_match_configparser(parser: ConfigParser, layered: LayeredConfig) -> None:
+    assert layered.sections() == parser.sections()
+    assert layered.defaults() == dict(parser.defaults())
+    for section in ["DEFAULT", *parser.sections()]:
+        assert layered.items(section) == parser.items(section)
+        assert layered.options(section) == [key for key, _ in parser.items(section)]
+        for option in ["shared", "NUMBER", "ratio", "missing"]:
+            assert layered.has_option(section, option) == parser.has_option(
+                section, option
+            )
+            assert layered.get(section, option, fallback=None) == parser.get(
+                section, option, fallback=None
+            )
+
+
+def test_typed_reads(layered: LayeredConfig) -> None:
+    assert layered.getint("app", "number") == 42
+    assert layered.getint("extra", "missing", fallback=7) == 7
+    assert layered.getfloat("app", "ratio") == 0.25
+    assert layered.getboolean("app", "enabled") is True
+
+
+def test_errors_match_configparser(layered: LayeredConfig) -> None:
+    with pytest.raises(NoSectionError):
+        layered.get("missing", "option")
+    with pytest.raises(NoOptionError):
+        layered.get("app", "missing")
+    with pytest.raises(NoSectionError):
+        layered.items("missing")
+    assert "extra" in layered
+    assert not layered.has_section("DEFAULT")
+
+
+def test_layers_are_kept_not_copied(layered: LayeredConfig) -> None:
+    other = LayeredConfig()
+    other.add_layer(BASE)
+
+    assert layered._layers[0] is other._layers[0] is BASE
+    assert layered._layers[1] == {
+        "DEFAULT": {"shared": "tenant"},
+        "app": {"ratio": "0.25"},
+        "extra": {},
+    }
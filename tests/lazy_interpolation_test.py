@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from configparser import ConfigParser
+from typing import Any
+
+import pytest
+
+from runtime_yolk.env_loader import EnvLoader
+from runtime_yolk.lazy_interpolation import LazyInterpolation
+
+
+def test_resolves_on_read() -> None:
+    interpolation = LazyInterpolation({"HOST": "localhost"})
+    config = ConfigParser(interpolation=interpolation)
+    config.read_dict({"app": {"url": "http://{{HOST}}:{{PORT}}", "plain": "value"}})
+
+    assert config.get("app", "url") == "http://localhost:"
+    assert config.get("app", "url", raw=True) == "http://{{HOST}}:{{PORT}}"
+    assert config.get("app", "plain") == "value"
+    assert interpolation.unresolved == {"PORT"}
+
+
+def test_memoized_until_env_loader_applies(monkeypatch: pytest.MonkeyPatch) -> None:
+    environ = {"HOST": "one"}
+    interpolation = LazyInterpolation(environ)
+
+    assert interpolation.resolve("{{HOST}}") == "one"
+
+    environ["HOST"] = "two"
+    assert interpolation.resolve("{{HOST}}") == "one"
+
+    monkeypatch.setattr(EnvLoader, "generation", EnvLoader.generation + 1)
+    assert interpolation.resolve("{{HOST}}") == "two"
+    assert interpolation.take_changed() == {"{{HOST}}"}
+    assert interpolation.take_changed() == set()
+
+
+def test_take_changed_skips_unchanged_and_unread() -> None:
+    environ = {"HOST": "one", "PORT": "80"}
+    interpolation = LazyInterpolation(environ)
+    interpolation.resolve("{{HOST}}")
+
+    environ["PORT"] = "81"
+
+    assert interpolation.take_changed() == set()
+
+    environ["HOST"] = "two"
+
+    assert interpolation.take_changed() == {"{{HOST}}"}
+
+
+def test_invalidates_once_across_threads() -> None:
+    changed: list[set[str]] = []
+    other = threading.Thread(
+        target=lambda: changed.append(interpolation.take_changed())
+    )
+
+    class Interleaving(dict):  # type: ignore[type-arg]
+        def get(self, key: Any, default: Any = None) -> Any:
+            # Another thread invalidates while this one checks the memo
+            if armed and other.ident is None:
+                other.start()
+                other.join(0.1)
+            return super().get(key, default)
+
+    armed = False
+    environ = Interleaving(HOST="one")
+    interpolation = LazyInterpolation(environ)
+    interpolation.resolve("{{HOST}}")
+    environ["HOST"] = "two"
+    armed = True
+
+    changed.append(interpolation.take_changed())
+    other.join()
+
+    assert changed == [{"{{HOST}}"}, set()]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from runtime_yolk.load_stats import LoadStats
+from runtime_yolk.load_stats import PhaseStats
+
+
+def test_finish_records_wall_time_and_calls_hook() -> None:
+    finished: list[PhaseStats] = []
+    stats = LoadStats(finished.append)
+
+    phase = stats.start("load_env")
+    phase.keys_applied = 3
+    stats.finish(phase)
+
+    assert list(stats.phases) == [phase]
+    assert finished == [phase]
+    assert phase.wall_time > 0
+
+
+def test_total_sums_phases_by_name() -> None:
+    stats = LoadStats()
+    for bytes_read in (10, 20):
+        phase = stats.start("interpolate")
+        phase.bytes_read = bytes_read
+        stats.finish(phase)
+    stats.finish(stats.start("load_config"))
+
+    total = stats.total("interpolate")
+
+    assert total.bytes_read == 30
+    assert total.wall_time == sum(p.wall_time for p in list(stats.phases)[:2])
+    assert stats.total("missing").as_dict() == {
+        "name": "missing",
+        "wall_time": 0.0,
+        "bytes_read": 0,
+        "files_probed": 0,
+        "files_loaded": 0,
+        "placeholders_resolved": 0,
+        "keys_applied": 0,
+    }
+
+    stats.clear()
+    assert not stats.phases
+    assert stats.total("interpolate").bytes_read == 0
+
+
+def test_history_is_bounded_and_totals_are_kept() -> None:
+    stats = LoadStats(max_phases=3)
+    for _ in range(10):
+        phase = stats.start("reload")
+        phase.files_probed = 2
+        stats.finish(phase)
+
+    assert len(stats.phases) == 3
+    assert stats.total("reload").files_probed == 20
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import logging
+import sys
+
+import pytest
+
+from runtime_yolk.log_formatters import CachedFormatter
+from runtime_yolk.log_formatters import JsonLinesFormatter
+from runtime_yolk.log_formatters import build_formatter
+from runtime_yolk.log_formatters import compile_format
+
+DEFAULT_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+
+def _record(msg: str = "test %s", created: float | None = None) -> logging.LogRecord:
+    record = logging.LogRecord("app", logging.INFO, __file__, 12, msg, ("arg",), None)
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    return record
+
+
+def test_compile_format() -> None:
+    assert compile_format("%(asctime)s %(levelname)-8s %(lineno)05d 100%%") == (
+        "%s %-8s %05d 100%%",
+        ("asctime", "levelname", "lineno"),
+    )
+    assert compile_format("%%(name)s") == ("%%(name)s", ())
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        DEFAULT_FORMAT,
+        "%(levelname)-8s|%(lineno)4d|%(message)r 100%%",
+        "%(message)s",
+        "%%(name)s %(name)s",
+    ],
+)
+def test_cached_matches_stock(fmt: str) -> None:
+    stock = logging.Formatter(fmt)
+    cached = CachedFormatter(fmt)
+
+    for created in (1_700_000_000.123, 1_700_000_000.987, 1_700_000_001.5):
+        assert cached.format(_record(created=created)) == stock.format(
+            _record(created=created)
+        )
+
+
+def test_cached_matches_stock_with_datefmt_and_traceback() -> None:
+    stock = logging.Formatter(DEFAULT_FORMAT, "%H:%M:%S")
+    cached = CachedFormatter(DEFAULT_FORMAT, "%H:%M:%S")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        exc_info = sys.exc_info()
+
+    def record() -> logging.LogRecord:
+        failed = _record(created=1_700_000_000.5)
+        failed.exc_info = exc_info
+        return failed
+
+    assert cached.format(record()) == stock.format(record())
+
+
+def test_cached_time_is_rendered_once_per_second(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    formatter = CachedFormatter(DEFAULT_FORMAT)
+    calls: list[float] = []
+    converter = formatter.converter
+
+    def counting(seconds: float | None) -> object:
+        calls.append(seconds or 0.0)
+        return converter(seconds)
+
+    monkeypatch.setattr(formatter, "converter", counting)
+
+    first = formatter.format(_record(created=1_700_000_000.25))
+    second = formatter.format(_record(created=1_700_000_000.75))
+    formatter.format(_record(created=1_700_000_001.0))
+
+    assert len(calls) == 2
+    assert first.split(",")[0] == second.split(",")[0]
+    assert first.split(" - ")[0].endswith(",250")
+    assert second.split(" - ")[0].endswith(",750")
+
+
+def test_missing_field_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        CachedFormatter("%(missing)s").format(_record())
+    with pytest.raises(ValueError):
+        JsonLinesFormatter("%(missing)s").format(_record())
+
+
+def test_json_lines() -> None:
+    formatter = JsonLinesFormatter(DEFAULT_FORMAT + " %(lineno)d")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = _record("café\n%s", created=1_700_000_000.25)
+        record.exc_info = sys.exc_info()
+
+    line = formatter.format(record)
+    entry = json.loads(line)
+
+    assert "\n" not in line
+    assert set(entry) == {
+        "asctime",
+        "levelname",
+        "name",
+        "message",
+        "lineno",
+        "exc_text",
+    }
+    assert entry["message"] == "café\narg"
+    assert entry["lineno"] == 12
+    assert entry["asctime"] == logging.Formatter().formatTime(record)
+    assert entry["exc_text"].endswith("RuntimeError: boom")
+
+
+def test_json_lines_fields_and_stack_info() -> None:
+    formatter = JsonLinesFormatter("%(name)s %(name)s %(args)s")
+    record = _record()
+    record.stack_info = "Stack (most recent call last):"
+
+    assert json.loads(formatter.format(record)) == {
+        "name": "app",
+        "args": ["arg"],
+        "stack_info": "Stack (most recent call last):",
+    }
+
+
+def test_build_formatter() -> None:
+    assert type(build_formatter("")) is logging.Formatter
+    assert type(build_formatter("%(message)s", "cached")) is CachedFormatter
+    assert type(build_formatter("", "json")) is JsonLinesFormatter
+    assert build_formatter("", "json").format(_record()) == '{"message":"test arg"}'
+    with pytest.raises(ValueError):
+        build_formatter("", "xml")
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import queue
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from runtime_yolk.log_handlers import BufferedRotatingFileHandler
+from runtime_yolk.log_handlers import OverflowQueueHandler
+from runtime_yolk.log_handlers import OverflowQueueListener
+from runtime_yolk.log_handlers import reopen_after_fork
+from runtime_yolk.log_handlers import retarget
+from runtime_yolk.log_handlers import worker_path
+
+
+def _record(level: int, msg: str = "test") -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def _levels(records: queue.Queue[logging.LogRecord]) -> list[int]:
+    return [record.levelno for record in records.queue]
+
+
+def test_invalid_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        OverflowQueueHandler(queue.Queue(1), "explode")
+
+
+def test_drop_policy_drops_new_records() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(2)
+    handler = OverflowQueueHandler(records, "drop")
+
+    for level in (logging.INFO, logging.INFO, logging.ERROR):
+        handler.handle(_record(level))
+
+    assert _levels(records) == [logging.INFO, logging.INFO]
+    assert handler.dropped == 1
+
+
+def test_drop_lowest_policy_keeps_higher_levels() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(2)
+    handler = OverflowQueueHandler(records, "drop_lowest")
+
+    for level in (logging.WARNING, logging.DEBUG, logging.ERROR, logging.INFO):
+        handler.handle(_record(level))
+
+    assert _levels(records) == [logging.WARNING, logging.ERROR]
+    assert handler.dropped == 2
+
+
+def test_drop_lowest_policy_never_drops_sentinel() -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(1)
+    records.put_nowait(None)  # type: ignore[arg-type]
+    handler = OverflowQueueHandler(records, "drop_lowest")
+
+    handler.handle(_record(logging.CRITICAL))
+
+    assert list(records.queue) == [None]
+    assert handler.dropped == 1
+
+
+def _buffered(path: Path, **kwargs: Any) -> BufferedRotatingFileHandler:
+    handler = BufferedRotatingFileHandler(str(path), **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+@pytest.mark.parametrize("overflow", ["drop", "drop_lowest"])
+def test_listener_stops_on_full_queue(overflow: str) -> None:
+    records: queue.Queue[logging.LogRecord] = queue.Queue(2)
+    handled: list[str] = []
+
+    class SlowHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            time.sleep(0.05)
+            handled.append(record.getMessage())
+
+    handler = OverflowQueueHandler(records, overflow)
+    listener = OverflowQueueListener(records, SlowHandler())
+    listener.start()
+    for idx in range(3):
+        handler.handle(_record(logging.ERROR, str(idx)))
+
+    assert records.full()
+    listener.stop()
+
+    assert len(handled) + handler.dropped == 3
+    assert records.empty()
+
+
+def test_buffered_handler_holds_records_until_threshold(tmp_path: Path) -> None:
+    path = tmp_path / "buffered.log"
+    handler = _buffered(path, flush_records=3, flush_bytes=0, flush_interval=0)
+
+    handler.handle(_record(logging.INFO, "one"))
+    handler.handle(_record(logging.INFO, "two"))
+    assert path.read_text() == ""
+    # No size threshold, messages are not encoded to count their size
+    assert handler._buffered == 0
+
+    handler.handle(_record(logging.INFO, "three"))
+    assert path.read_text() == "one\ntwo\nthree\n"
+    handler.close()
+
+
+def test_buffered_handler_writes_errors_immediately(tmp_path: Path) -> None:
+    path = tmp_path / "buffered.log"
+    handler = _buffered(path, flush_records=0, flush_bytes=0, flush_interval=0)
+
+    handler.handle(_record(logging.INFO, "info"))
+    handler.handle(_record(logging.ERROR, "error"))
+
+    assert path.read_text() == "info\nerror\n"
+    handler.close()
+
+
+def test_buffered_handler_writes_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "buffered.log"
+    handler = _buffered(path, flush_records=0, flush_bytes=0, flush_interval=0)
+
+    handler.handle(_record(logging.INFO, "info"))
+    handler.close()
+
+    assert path.read_text() == "info\n"
+
+
+def test_buffered_handler_writes_after_interval_without_records(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "buffered.log"
+    handler = _buffered(path, flush_records=0, flush_bytes=0, flush_interval=0.05)
+
+    handler.handle(_record(logging.INFO, "burst"))
+    assert path.read_text() == ""
+
+    deadline = time.monotonic() + 5
+    while path.read_text() == "" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert path.read_text() == "burst\n"
+    handler.close()
+
+
+def test_buffered_sizes_count_encoded_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "rotate.log"
+    handler = _buffered(
+        path, encoding="utf-8", flush_records=1, max_bytes=12, backup_count=1
+    )
+
+    # 5 characters, 11 bytes with the newline
+    handler.handle(_record(logging.INFO, "ééééé"))
+    assert handler._file_size == path.stat().st_size == 11
+    handler.handle(_record(logging.INFO, "ééééé"))
+    handler.close()
+
+    assert path.read_text(encoding="utf-8") == "ééééé\n"
+    assert Path(f"{path}.1").read_text(encoding="utf-8") == "ééééé\n"
+
+
+def test_size_rotation_keeps_backups(tmp_path: Path) -> None:
+    path = tmp_path / "rotate.log"
+    handler = _buffered(path, flush_records=1, max_bytes=10, backup_count=2)
+
+    for message in ("first----", "second---", "third----", "fourth---"):
+        handler.handle(_record(logging.INFO, message))
+    handler.close()
+
+    assert path.read_text() == "fourth---\n"
+    assert (tmp_path / "rotate.log.1").read_text() == "third----\n"
+    assert (tmp_path / "rotate.log.2").read_text() == "second---\n"
+    assert not (tmp_path / "rotate.log.3").exists()
+
+
+def test_time_rotation_compresses(tmp_path: Path) -> None:
+    path = tmp_path / "rotate.log"
+    handler = _buffered(path, flush_records=1, rotate_interval=60, compress=True)
+
+    handler.handle(_record(logging.INFO, "old"))
+    with patch("time.time", return_value=time.time() + 61):
+        handler.handle(_record(logging.INFO, "new"))
+    handler.close()
+
+    assert path.read_text() == "new\n"
+    with gzip.open(tmp_path / "rotate.log.1.gz", "rt") as rotated:
+        assert rotated.read() == "old\n"
+    assert not (tmp_path / "rotate.log.1").exists()
+
+
+def test_worker_path() -> None:
+    assert worker_path("logs/app.log", 42) == "logs/app.42.log"
+    assert worker_path("app", 42) == "app.42"
+
+
+def test_reopen_after_fork_drops_buffer_and_switches_file(tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    worker = tmp_path / "app.1.log"
+    handler = _buffered(path, flush_records=0, flush_bytes=0, flush_interval=0)
+    handler.handle(_record(logging.INFO, "inherited"))
+    lock = handler.lock
+
+    reopen_after_fork(handler, str(worker))
+    handler.handle(_record(logging.ERROR, "child"))
+    handler.close()
+
+    assert handler.lock is not lock
+    assert path.read_text() == ""
+    assert worker.read_text() == "child\n"
+
+
+def test_reopen_after_fork_appends_to_same_file(tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    handler = logging.FileHandler(path, mode="w")
+    handler.handle(_record(logging.INFO, "parent"))
+
+    reopen_after_fork(handler)
+    handler.handle(_record(logging.INFO, "child"))
+    handler.close()
+
+    assert path.read_text() == "parent\nchild\n"
+
+
+def test_retarget_writes_buffer_then_switches_file(tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    moved = tmp_path / "moved.log"
+    handler = _buffered(path, flush_records=0, flush_bytes=0, flush_interval=0)
+    handler.handle(_record(logging.INFO, "before"))
+
+    retarget(handler, str(moved))
+    handler.handle(_record(logging.ERROR, "after"))
+    handler.close()
+
+    assert path.read_text() == "before\n"
+    assert moved.read_text() == "after\n"
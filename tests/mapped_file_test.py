@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from unittest.mock import patch
+
+from runtime_yolk.util import mapped_file
+
+
+def test_small_files_are_read(tmp_path: Path) -> None:
+    path = tmp_path / "small"
+    path.write_bytes(b"KEY=value\n")
+
+    assert mapped_file.read_contents(path) == b"KEY=value\n"
+
+
+def test_large_files_are_mapped(tmp_path: Path) -> None:
+    path = tmp_path / "large"
+    path.write_bytes(b"first\r\nsecond\n\nlast")
+
+    with patch.object(mapped_file, "MMAP_THRESHOLD", 1):
+        contents = mapped_file.read_contents(path)
+
+    assert isinstance(contents, mmap.mmap)
+    assert list(mapped_file.iter_lines(contents)) == [
+        b"first\r\n",
+        b"second\n",
+        b"\n",
+        b"last",
+    ]
+
+    mapped_file.close(contents)
+    assert contents.closed
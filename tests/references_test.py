@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import pytest
+
+from runtime_yolk.util.references import ReferenceResolver
+
+
+def test_resolves_in_dependency_order() -> None:
+    layers = [
+        {
+            "app": {"url": "{{db:url}}/app", "name": "yolk"},
+            "db": {"url": "{{db:scheme}}://{{DEFAULT:host}}", "scheme": "pg"},
+            "DEFAULT": {"host": "{{app:name}}.local"},
+        }
+    ]
+
+    resolved = ReferenceResolver(layers, {}).resolve()
+
+    assert resolved == {
+        ("app", "url"): "pg://yolk.local/app",
+        ("db", "url"): "pg://yolk.local",
+        ("DEFAULT", "host"): "yolk.local",
+    }
+
+
+def test_later_layers_and_defaults() -> None:
+    layers = [
+        {"app": {"key": "{{db:host}} {{db:port}} {{db:env}}"}, "db": {"host": "a"}},
+        {"db": {"host": "b"}, "DEFAULT": {"port": "1"}},
+    ]
+
+    resolved = ReferenceResolver(layers, {"env": "prod"}).resolve()
+
+    assert resolved == {("app", "key"): "b 1 prod"}
+
+
+def test_overridden_reference_is_not_resolved() -> None:
+    layers = [{"app": {"key": "{{app:missing}}"}}, {"app": {"key": "plain"}}]
+    resolver = ReferenceResolver(layers, {})
+
+    assert resolver.resolve() == {}
+    assert resolver.unresolved == set()
+
+
+def test_each_value_is_evaluated_once_and_shared() -> None:
+    shared = "x" * 100
+    layers = [
+        {
+            "base": {"value": "{{base:raw}}", "raw": shared},
+            **{f"s{idx}": {"copy": "{{base:value}}"} for idx in range(50)},
+        }
+    ]
+    resolver = ReferenceResolver(layers, {})
+    substituted: list[str] = []
+    substitute = resolver._substitute
+
+    def counting(value: str) -> str:
+        substituted.append(value)
+        return substitute(value)
+
+    resolver._substitute = counting  # type: ignore[method-assign]
+    resolved = resolver.resolve()
+
+    assert len(substituted) == 51
+    assert all(resolved[(f"s{idx}", "copy")] is shared for idx in range(50))
+
+
+def test_missing_references_are_unresolved() -> None:
+    layers = [{"app": {"key": "[{{app:missing}}|{{nope:key}}]", "Other": "x"}}]
+    resolver = ReferenceResolver(layers, {})
+
+    assert resolver.resolve() == {("app", "key"): "[|]"}
+    assert resolver.unresolved == {"app:missing", "nope:key"}
+
+
+def test_option_names_are_case_insensitive() -> None:
+    layers = [{"app": {"key": "{{app:OTHER}}", "other": "x"}}]
+
+    assert ReferenceResolver(layers, {}).resolve() == {("app", "key"): "x"}
+
+
+def test_environ_placeholders_are_kept() -> None:
+    layers = [{"app": {"key": "{{app:other}}/{{HOME}}", "other": "{{USER}}"}}]
+
+    assert ReferenceResolver(layers, {}).resolve() == {
+        ("app", "key"): "{{USER}}/{{HOME}}"
+    }
+
+
+def test_cycle_raises() -> None:
+    layers = [
+        {
+            "a": {"x": "{{b:y}}", "start": "{{a:x}}"},
+            "b": {"y": "{{c:z}}"},
+            "c": {"z": "{{a:x}}"},
+        }
+    ]
+
+    with pytest.raises(ValueError, match="a:x -> b:y -> c:z -> a:x"):
+        ReferenceResolver(layers, {}).resolve()
+
+    with pytest.raises(ValueError, match="a:x -> a:x"):
+        ReferenceResolver([{"a": {"x": "{{a:x}}"}}], {}).resolve()
+
+
+def test_long_chain_does_not_recurse() -> None:
+    chain = {f"k{idx}": f"{{{{app:k{idx + 1}}}}}" for idx in range(5000)}
+    chain["k5000"] = "end"
+
+    resolved = ReferenceResolver([{"app": chain}], {}).resolve()
+
+    assert resolved[("app", "k0")] == "end"
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from configparser import ConfigParser
+from configparser import NoOptionError
+from configparser import NoSectionError
+from pathlib import Path
+
+import pytest
+
+from runtime_yolk.shared_config import SharedConfig
+from runtime_yolk.shared_config import publish
+from runtime_yolk.shared_config import read_generation
+
+CONFIG = """
+[DEFAULT]
+shared = default
+number = 1
+
+[app]
+Number = 42
+ratio = 0.5
+enabled = yes
+unicode = café
+
+[zeta]
+"""
+
+
+@pytest.fixture
+def config() -> ConfigParser:
+    config = ConfigParser(interpolation=None)
+    config.read_string(CONFIG)
+    return config
+
+
+@pytest.fixture
+def shared(config: ConfigParser, tmp_path: Path) -> SharedConfig:
+    path = str(tmp_path / "config.shm")
+    publish(config, path)
+    return SharedConfig(path)
+
+
+def test_reads_match_configparser(shared: SharedConfig, config: ConfigParser) -> None:
+    assert shared.sections() == config.sections()
+    assert shared.has_section("app")
+    assert shared.has_section("zeta")
+    assert not shared.has_section("DEFAULT")
+    assert shared.get("app", "NUMBER") == "42"
+    assert shared.get("app", "unicode") == "café"
+    assert shared.get("app", "shared") == "default"
+    assert shared.get("zeta", "number") == "1"
+    assert shared.has_option("app", "shared")
+    assert not shared.has_option("app", "missing")
+
+
+def test_typed_reads(shared: SharedConfig) -> None:
+    assert shared.getint("app", "number") == 42
+    assert shared.getfloat("app", "ratio") == 0.5
+    assert shared.getboolean("app", "enabled") is True
+    assert shared.getint("app", "missing", fallback=7) == 7
+
+
+def test_errors_match_configparser(shared: SharedConfig) -> None:
+    with pytest.raises(NoSectionError):
+        shared.get("missing", "option")
+    with pytest.raises(NoOptionError):
+        shared.get("app", "missing")
+
+    assert shared.get("missing", "option", fallback=None) is None
+
+
+def test_closed_raises(shared: SharedConfig) -> None:
+    with shared:
+        pass
+
+    with pytest.raises(ValueError, match="closed"):
+        shared.get("app", "number")
+
+
+def test_invalid_file_raises(tmp_path: Path) -> None:
+    path = tmp_path / "config.shm"
+    path.write_bytes(b"not a published config, but long enough for a header")
+
+    with pytest.raises(ValueError, match="Not a published"):
+        SharedConfig(str(path))
+
+    assert read_generation(str(path)) == 0
+    assert read_generation(str(tmp_path / "missing")) == 0
+
+
+def test_refresh_attaches_new_generation(
+    shared: SharedConfig,
+    config: ConfigParser,
+    tmp_path: Path,
+) -> None:
+    path = str(tmp_path / "config.shm")
+    first = shared.generation
+    assert first > 0
+    assert not shared.refresh()
+
+    config.set("app", "number", "43")
+    second = publish(config, path)
+    assert second > first
+
+    assert shared.is_stale()
+    assert shared.get("app", "number") == "42"
+    assert shared.refresh()
+    assert shared.generation == second
+    assert shared.get("app", "number") == "43"
+
+
+def test_generation_is_new_after_file_removed(
+    shared: SharedConfig,
+    config: ConfigParser,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "config.shm"
+    path.unlink()
+
+    assert publish(config, str(path)) > shared.generation
+    assert shared.refresh()
+
+
+def test_sections_only_hold_their_own_options(
+    config: ConfigParser,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "config.shm"
+    publish(config, str(path))
+    for section in range(50):
+        config.add_section(f"section_{section}")
+    publish(config, str(path))
+
+    with SharedConfig(str(path)) as shared:
+        # Section markers, two DEFAULT options, and the four options of app
+        assert shared._count == 53 + 2 + 4
+        assert shared.get("section_1", "shared") == "default"
+        assert shared.get("app", "number") == "42"
+
+
+def test_published_default_section(tmp_path: Path) -> None:
+    config = ConfigParser(interpolation=None, default_section="common")
+    config.read_string("[common]\nkey = value\n[app]\n[DEFAULT]\nother = 1\n")
+    path = str(tmp_path / "config.shm")
+    publish(config, path)
+
+    with SharedConfig(path) as shared:
+        assert sorted(shared.sections()) == ["DEFAULT", "app"]
+        assert not shared.has_section("common")
+        assert shared.get("app", "key") == "value"
+        assert shared.get("DEFAULT", "other") == "1"
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import os
+import threading
 from collections.abc import Generator
 from configparser import NoOptionError
 from pathlib import Path
@@ -11,6 +14,9 @@ import pytest
 from _pytest.logging import LogCaptureFixture
 
 from runtime_yolk import Yolk
+from runtime_yolk.log_handlers import BufferedRotatingFileHandler
+from runtime_yolk.shared_config import SharedConfig
+from runtime_yolk.watcher import ReloadChanges
 
 FIXTURE_PATH = "tests/fixtures/yolk_test"
 
@@ -155,3 +161,514 @@ def test_add_logging_file(temp_file: tuple[int, str]) -> None:
 
     assert "Testing file writing" in results
     assert "Should not be shown" not in results
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_reload_env_and_config(tmp_path: Path, lazy: bool) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("RELOAD_LEVEL=INFO")
+    (tmp_path / "application.ini").write_text("[DEFAULT]\nlevel = {{RELOAD_LEVEL}}\n")
+    yolk = Yolk(working_directory=str(tmp_path), lazy_interpolation=lazy)
+    yolk.load_env()
+    yolk.load_config()
+    assert yolk.config.get("DEFAULT", "level") == "INFO"
+    received: list[ReloadChanges] = []
+    yolk.subscribe(received.append)
+
+    stat = env_file.stat()
+    env_file.write_text("RELOAD_LEVEL=DEBUG")
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changes = yolk.reload()
+
+    assert changes.environ == {"RELOAD_LEVEL"}
+    assert changes.config == {("DEFAULT", "level")}
+    assert yolk.config.get("DEFAULT", "level") == "DEBUG"
+    assert received == [changes]
+
+
+def test_aload_applies_env_before_config(tmp_path: Path) -> None:
+    (tmp_path / ".env").write_text("ALOAD_LEVEL=INFO")
+    (tmp_path / "application.ini").write_text(
+        "[DEFAULT]\nlogging_level = {{ALOAD_LEVEL}}\n"
+    )
+    yolk = Yolk(working_directory=str(tmp_path))
+    root = logging.getLogger()
+    level = root.level
+
+    try:
+        asyncio.run(yolk.aload())
+    finally:
+        root.setLevel(level)
+        for handler in yolk._handlers.values():
+            root.removeHandler(handler)
+
+    assert os.environ["ALOAD_LEVEL"] == "INFO"
+    assert yolk.config.get("DEFAULT", "logging_level") == "INFO"
+    assert list(yolk._handlers) == ["yolk_core"]
+
+
+def test_areload_notifies_on_loop_thread(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ARELOAD=1")
+    yolk = Yolk(working_directory=str(tmp_path))
+    threads: list[threading.Thread] = []
+    yolk.subscribe(lambda changes: threads.append(threading.current_thread()))
+
+    async def main() -> ReloadChanges:
+        await yolk.aload_env()
+        stat = env_file.stat()
+        env_file.write_text("ARELOAD=2")
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return await yolk.areload()
+
+    changes = asyncio.run(main())
+
+    assert changes.environ == {"ARELOAD"}
+    assert os.environ["ARELOAD"] == "2"
+    assert threads == [threading.main_thread()]
+
+
+def test_reload_without_changes_skips_subscribers(tmp_path: Path) -> None:
+    yolk = Yolk(working_directory=str(tmp_path))
+    yolk.load_env()
+    yolk.subscribe(lambda changes: pytest.fail("Should not be called"))
+
+    assert not yolk.reload()
+
+
+def test_watch_polls_in_background() -> None:
+    yolk = Yolk()
+    called = threading.Event()
+
+    with patch.object(yolk, "reload", side_effect=called.set):
+        yolk.watch(interval=0.01)
+        try:
+            assert called.wait(timeout=5)
+        finally:
+            yolk.stop_watching()
+
+    assert yolk._watcher is None
+
+
+def test_queued_logging_writes_through_listener(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "queued.log")
+    yolk = Yolk()
+    yolk.add_logging_file(filepath, "INFO")
+    root = logging.getLogger()
+
+    yolk.set_queued_logging(max_size=100, overflow="drop")
+    level = root.level
+    root.setLevel(logging.INFO)
+    try:
+        yolk.add_logging_file(str(tmp_path / "late.log"), "INFO")
+        assert not [h for h in root.handlers if h in yolk._handlers.values()]
+        logging.getLogger("queued").info("Queued record")
+    finally:
+        root.setLevel(level)
+        yolk.stop_queued_logging()
+
+    assert "Queued record" in Path(filepath).read_text()
+    assert "Queued record" in (tmp_path / "late.log").read_text()
+    assert all(handler in root.handlers for handler in yolk._handlers.values())
+    assert yolk.dropped_log_records == 0
+
+    for handler in yolk._handlers.values():
+        root.removeHandler(handler)
+        handler.close()
+
+
+def test_add_logging_file_buffered(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "buffered.log")
+    yolk = Yolk()
+    log = logging.getLogger("test_buffered")
+
+    yolk.add_logging_file(filepath, "CRITICAL", buffered=True, max_bytes=1024)
+    handler = yolk._handlers[f"yolk_core_{filepath}"]
+    log.critical("Written at once")
+
+    assert isinstance(handler, BufferedRotatingFileHandler)
+    assert "Written at once" in Path(filepath).read_text()
+
+    logging.getLogger().removeHandler(handler)
+    handler.close()
+
+
+def test_logging_setup_is_idempotent(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "idempotent.log")
+    yolk = Yolk()
+    root = logging.getLogger()
+    level = root.level
+    before = [handler.name for handler in root.handlers]
+
+    try:
+        yolk.set_logging("INFO")
+        yolk.set_logging("WARNING")
+        yolk.add_logging_file(filepath, "INFO")
+        yolk.add_logging_file(filepath, "ERROR")
+        yolk.add_logging_file(filepath)
+
+        names = [handler.name for handler in root.handlers]
+        assert names.count("yolk_core") == before.count("yolk_core") + 1
+        assert names.count(f"yolk_core_{filepath}") == 1
+        assert root.level == logging.WARNING
+        assert yolk.logging_handlers[f"yolk_core_{filepath}"].level == logging.WARNING
+    finally:
+        root.setLevel(level)
+        for name in list(yolk.logging_handlers):
+            yolk.remove_handler(name)
+
+    assert not yolk.logging_handlers
+    assert [handler.name for handler in root.handlers] == before
+
+
+def test_logging_handlers_shared_between_instances(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "shared.log")
+    first, second = Yolk(), Yolk()
+    root = logging.getLogger()
+    level = root.level
+    before = [handler.name for handler in root.handlers]
+
+    try:
+        first.set_logging("INFO")
+        first.add_logging_file(filepath, "INFO")
+        second.set_logging("WARNING")
+        second.add_logging_file(filepath, "ERROR")
+
+        names = [handler.name for handler in root.handlers]
+        assert names.count("yolk_core") == before.count("yolk_core") + 1
+        assert names.count(f"yolk_core_{filepath}") == 1
+        assert second.logging_handlers == first.logging_handlers
+        assert first.logging_handlers[f"yolk_core_{filepath}"].level == logging.ERROR
+    finally:
+        root.setLevel(level)
+        for name in list(second.logging_handlers):
+            second.remove_handler(name)
+
+    assert [handler.name for handler in root.handlers] == before
+
+
+def test_add_logging_file_replaces_handler_on_new_options(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "options.log")
+    Path(filepath).write_text("old record\n")
+    yolk = Yolk()
+    name = f"yolk_core_{filepath}"
+
+    try:
+        yolk.add_logging_file(filepath, "INFO")
+        plain = yolk.logging_handlers[name]
+        yolk.add_logging_file(filepath, "INFO", buffered=True)
+        buffered = yolk.logging_handlers[name]
+        yolk.add_logging_file(filepath, "INFO", buffered=True)
+        yolk.add_logging_file(filepath, "INFO", append=False)
+
+        assert isinstance(buffered, BufferedRotatingFileHandler)
+        assert yolk.logging_handlers[name] is not buffered
+        assert plain not in logging.getLogger().handlers
+        assert buffered not in logging.getLogger().handlers
+        assert Path(filepath).read_text() == ""
+    finally:
+        yolk.remove_handler(name)
+
+
+def test_tune_handler_in_place(tmp_path: Path) -> None:
+    first, second = str(tmp_path / "first.log"), str(tmp_path / "second.log")
+    yolk = Yolk()
+    yolk.add_logging_file(first, "INFO")
+    handler = yolk.logging_handlers[f"yolk_core_{first}"]
+    log = logging.getLogger("test_tune")
+    log.setLevel(logging.DEBUG)
+
+    try:
+        log.info("first record")
+        yolk.tune_handler(
+            f"yolk_core_{first}", level="WARNING", fmt="%(levelname)s %(message)s"
+        )
+        log.info("dropped record")
+        yolk.tune_handler(f"yolk_core_{first}", target=second)
+        log.warning("second record")
+
+        with pytest.raises(TypeError):
+            yolk.tune_handler(f"yolk_core_{first}", target=io.StringIO())
+        with pytest.raises(KeyError):
+            yolk.tune_handler("missing", level="INFO")
+    finally:
+        yolk.remove_handler(f"yolk_core_{first}")
+
+    assert yolk.logging_handlers == {}
+    assert handler not in logging.getLogger().handlers
+    assert Path(first).read_text() == "first record\n"
+    assert Path(second).read_text() == "WARNING second record\n"
+
+
+def test_reload_retunes_logging_from_config(tmp_path: Path) -> None:
+    config_file = tmp_path / "application.ini"
+    config_file.write_text(
+        "[DEFAULT]\nlogging_level = INFO\nlogging_format = A %(message)s\n"
+    )
+    filepath = str(tmp_path / "reloaded.log")
+    yolk = Yolk(working_directory=str(tmp_path))
+    yolk.load_config()
+    root = logging.getLogger()
+    level = root.level
+
+    try:
+        yolk.set_logging()
+        yolk.add_logging_file(filepath)
+        core = yolk.logging_handlers["yolk_core"]
+
+        stat = config_file.stat()
+        config_file.write_text(
+            "[DEFAULT]\nlogging_level = ERROR\nlogging_format = B %(message)s\n"
+        )
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        yolk.reload()
+
+        assert yolk.logging_handlers["yolk_core"] is core
+        assert core.formatter is not None and core.formatter._fmt == "B %(message)s"
+        assert root.level == logging.ERROR
+        assert yolk.logging_handlers[f"yolk_core_{filepath}"].level == logging.ERROR
+    finally:
+        root.setLevel(level)
+        for name in list(yolk.logging_handlers):
+            yolk.remove_handler(name)
+
+
+def test_logging_formatter_from_config(tmp_path: Path) -> None:
+    from runtime_yolk.log_formatters import CachedFormatter
+    from runtime_yolk.log_formatters import JsonLinesFormatter
+
+    config_file = tmp_path / "application.ini"
+    config_file.write_text("[DEFAULT]\nlogging_formatter = json\n")
+    yolk = Yolk(working_directory=str(tmp_path))
+    yolk.load_config()
+    root = logging.getLogger()
+    level = root.level
+
+    try:
+        yolk.set_logging()
+        core = yolk.logging_handlers["yolk_core"]
+        assert isinstance(core.formatter, JsonLinesFormatter)
+
+        stat = config_file.stat()
+        config_file.write_text("[DEFAULT]\nlogging_formatter = cached\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        yolk.reload()
+
+        assert type(core.formatter) is CachedFormatter
+        yolk.tune_handler("yolk_core", fmt="%(message)s")
+        assert type(core.formatter) is CachedFormatter
+    finally:
+        root.setLevel(level)
+        yolk.remove_handler("yolk_core")
+
+
+def test_snapshot_is_reused_until_config_changes() -> None:
+    yolk = Yolk(working_directory=FIXTURE_PATH)
+    yolk.load_config()
+
+    snapshot = yolk.snapshot()
+
+    assert yolk.snapshot() is snapshot
+    assert snapshot.get("DEFAULT", "yolk_test") == "pass"
+
+    yolk.load_config("not-application")
+
+    assert yolk.snapshot() is not snapshot
+    assert yolk.snapshot().get("DEFAULT", "yolk_test") == "eggshell"
+    assert snapshot.get("DEFAULT", "yolk_test") == "pass"
+
+
+def test_publish_config(tmp_path: Path) -> None:
+    yolk = Yolk(working_directory=FIXTURE_PATH)
+    yolk.load_config()
+    path = str(tmp_path / "config.shm")
+
+    assert yolk.publish_config(path) > 0
+
+    with SharedConfig(path) as shared:
+        assert shared.get("DEFAULT", "yolk_test") == "pass"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_writes_per_worker_file(tmp_path: Path) -> None:
+    filepath = str(tmp_path / "worker.log")
+    yolk = Yolk()
+    yolk.add_logging_file(filepath, "INFO", per_worker=True)
+    yolk.set_queued_logging()
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.INFO)
+
+    try:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            logging.getLogger("child").info("Child record")
+            yolk.stop_queued_logging()
+            os._exit(0)
+
+        _, status = os.waitpid(pid, 0)
+        logging.getLogger("parent").info("Parent record")
+    finally:
+        root.setLevel(level)
+        yolk.stop_queued_logging()
+
+    assert status == 0
+    assert "Child record" in (tmp_path / f"worker.{pid}.log").read_text()
+    parent_log = (tmp_path / f"worker.{os.getpid()}.log").read_text()
+    assert "Parent record" in parent_log
+    assert "Child record" not in parent_log
+
+    for handler in yolk._handlers.values():
+        root.removeHandler(handler)
+        handler.close()
+
+
+def test_stats_disabled_by_default() -> None:
+    assert Yolk().stats is None
+
+
+def test_instrumented_auto_load_records_phases() -> None:
+    finished: list[str] = []
+    root = logging.getLogger()
+    level = root.level
+
+    try:
+        yolk = Yolk(
+            working_directory=FIXTURE_PATH,
+            auto_load=True,
+            stats_hook=lambda phase: finished.append(phase.name),
+        )
+    finally:
+        root.setLevel(level)
+    for handler in yolk._handlers.values():
+        root.removeHandler(handler)
+
+    assert yolk.stats is not None
+    assert [phase.name for phase in yolk.stats.phases] == [
+        "load_env",
+        "load_config",
+        "interpolate",
+        "set_logging",
+    ]
+    assert finished == ["load_env", "interpolate", "load_config", "set_logging"]
+
+    env = yolk.stats.total("load_env")
+    config = yolk.stats.total("load_config")
+    assert env.files_loaded == 1
+    assert env.bytes_read == (Path(FIXTURE_PATH) / ".env").stat().st_size
+    assert env.keys_applied == len(yolk._env.read(".env"))
+    assert config.files_loaded == 1
+    assert config.files_probed == 1
+    assert config.bytes_read == yolk.stats.total("interpolate").bytes_read
+    assert config.keys_applied > 0
+
+
+def test_search_path_reload_sees_new_env_file(tmp_path: Path) -> None:
+    system, local = tmp_path / "etc", tmp_path / "cwd"
+    system.mkdir()
+    local.mkdir()
+    (system / ".env").write_text("SEARCH_LEVEL=system")
+    yolk = Yolk(search_path=[str(system), str(local)])
+    yolk.load_env()
+
+    assert os.environ["SEARCH_LEVEL"] == "system"
+
+    (local / ".env").write_text("SEARCH_LEVEL=local")
+    changes = yolk.reload()
+
+    assert changes.environ == {"SEARCH_LEVEL"}
+    assert os.environ["SEARCH_LEVEL"] == "local"
+
+
+@pytest.fixture
+def bundle_dir(tmp_path: Path) -> Path:
+    (tmp_path / ".env").write_text("BUNDLE_HOST=example.com")
+    (tmp_path / "application.ini").write_text(
+        "[app]\nhost = {{BUNDLE_HOST}}\nregion = {{BUNDLE_REGION}}\n"
+    )
+    yolk = Yolk(working_directory=str(tmp_path))
+    yolk.load_env()
+    yolk.load_config()
+    yolk.write_bundle(str(tmp_path / "bundle.json"))
+    del os.environ["BUNDLE_HOST"]
+    return tmp_path
+
+
+def test_load_bundle(bundle_dir: Path) -> None:
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    with patch.object(yolk._config, "_parse_layer") as parse:
+        assert yolk.load_bundle(str(bundle_dir / "bundle.json"))
+
+    parse.assert_not_called()
+    assert os.environ["BUNDLE_HOST"] == "example.com"
+    assert yolk.config.get("app", "host") == "example.com"
+    assert not yolk.reload()
+
+
+def test_load_bundle_after_repeated_load_config(bundle_dir: Path) -> None:
+    built = Yolk(working_directory=str(bundle_dir))
+    built.load_env()
+    built.load_config()
+    built.load_config()
+    built.write_bundle(str(bundle_dir / "repeated.json"))
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    assert built._config_names == ["application"]
+    assert yolk.load_bundle(str(bundle_dir / "repeated.json"))
+
+
+def test_load_bundle_falls_back_when_source_changed(bundle_dir: Path) -> None:
+    (bundle_dir / "application.ini").write_text("[app]\nhost = changed\n")
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    assert not yolk.load_bundle(str(bundle_dir / "bundle.json"))
+    assert yolk.config.get("app", "host") == "changed"
+
+
+def test_load_bundle_falls_back_when_environ_changed(bundle_dir: Path) -> None:
+    os.environ["BUNDLE_REGION"] = "eu"
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    assert not yolk.load_bundle(str(bundle_dir / "bundle.json"))
+    assert yolk.config.get("app", "region") == "eu"
+
+
+def test_load_bundle_falls_back_on_new_search_path_file(tmp_path: Path) -> None:
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    (first / "application.ini").write_text("[s]\nx = 1\n")
+    search_path = [str(first), str(second)]
+    built = Yolk(search_path=search_path)
+    built.load_env()
+    built.load_config()
+    built.write_bundle(str(tmp_path / "bundle.json"))
+    (second / "application.ini").write_text("[s]\nx = 2\n")
+    yolk = Yolk(search_path=search_path)
+
+    assert not yolk.load_bundle(str(tmp_path / "bundle.json"))
+    assert yolk.config.get("s", "x") == "2"
+
+
+def test_load_bundle_falls_back_on_new_environment_file(bundle_dir: Path) -> None:
+    (bundle_dir / "application.ini").write_text(
+        "[DEFAULT]\nenvironment = dev\n[app]\nhost = base\n"
+    )
+    built = Yolk(working_directory=str(bundle_dir))
+    built.load_env()
+    built.load_config()
+    built.write_bundle(str(bundle_dir / "environment.json"))
+    (bundle_dir / "application-dev.ini").write_text("[app]\nhost = dev\n")
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    assert not yolk.load_bundle(str(bundle_dir / "environment.json"))
+    assert yolk.config.get("app", "host") == "dev"
+
+
+def test_load_bundle_falls_back_when_missing(bundle_dir: Path) -> None:
+    yolk = Yolk(working_directory=str(bundle_dir))
+
+    assert not yolk.load_bundle(str(bundle_dir / "missing.json"), config_name="other")
+    assert os.environ["BUNDLE_HOST"] == "example.com"
+    assert not yolk.config.has_section("app")